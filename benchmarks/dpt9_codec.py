@@ -0,0 +1,88 @@
+"""
+Micro benchmark for parsing and serializing DPT 9 two byte floats.
+
+Compares the previous arithmetic implementation of `DPT2ByteFloat.from_knx()`/`to_knx()`
+with the lookup table decoder and the loop free encoder.
+
+Usage: python benchmarks/dpt9_codec.py [number_of_values]
+"""
+import sys
+from timeit import timeit
+
+from xknx.dpt import DPT2ByteFloat, DPTTemperature
+from xknx.exceptions import ConversionError
+
+
+def arithmetic_from_knx(cls, raw):
+    """Parse/deserialize from KNX/IP raw data (previous implementation)."""
+    cls.test_bytesarray(raw, 2)
+    data = (raw[0] * 256) + raw[1]
+    exponent = (data >> 11) & 0x0f
+    significand = data & 0x7ff
+    sign = data >> 15
+
+    if sign == 1:
+        significand = significand - 2048
+
+    value = float(significand << exponent) / 100
+
+    if not cls.value_min <= value <= cls.value_max:
+        raise ConversionError("Cant parse %s" % cls.__name__, value=value)
+
+    return value
+
+
+def arithmetic_to_knx(cls, value):
+    """Serialize to KNX/IP raw data (previous implementation)."""
+    def calc_exponent(float_value, sign):
+        """Return float exponent."""
+        exponent = 0
+        significand = abs(int(float_value * 100))
+
+        while significand < -2048 or significand > 2048:
+            exponent += 1
+            significand >>= 1
+
+        if sign:
+            significand ^= 0x7ff  # invert
+            significand += 1     # and add 1
+
+        return exponent, significand
+
+    try:
+        knx_value = float(value)
+        if not cls.value_min <= knx_value <= cls.value_max:
+            raise ValueError
+
+        sign = 1 if knx_value < 0 else 0
+        exponent, significand = calc_exponent(knx_value, sign)
+
+        return (sign << 7) | (exponent << 3) | (significand >> 8), \
+            significand & 0xff
+    except ValueError:
+        raise ConversionError("Cant serialize %s" % cls.__name__, value=value)
+
+
+def main(number):
+    """Run benchmark and print values per second."""
+    samples = (
+        ('from_knx 21.00', (0x0c, 0x1a), arithmetic_from_knx, DPTTemperature.from_knx),
+        ('from_knx -999.68', (0xB1, 0xE6), arithmetic_from_knx, DPT2ByteFloat.from_knx),
+        ('from_knx max', (0x7F, 0xFF), arithmetic_from_knx, DPT2ByteFloat.from_knx),
+        ('to_knx 21.00', 21.00, arithmetic_to_knx, DPTTemperature.to_knx),
+        ('to_knx -1000.00', -1000.00, arithmetic_to_knx, DPT2ByteFloat.to_knx),
+        ('to_knx max', 670760.96, arithmetic_to_knx, DPT2ByteFloat.to_knx),
+    )
+    DPT2ByteFloat.decode_table()
+    print('{:<20} {:>14} {:>14} {:>8}'.format('value', 'old vps', 'new vps', 'speedup'))
+    for name, argument, old_function, new_function in samples:
+        cls = new_function.__self__
+        assert old_function(cls, argument) == new_function(argument)
+        old_time = timeit(lambda: old_function(cls, argument), number=number)
+        new_time = timeit(lambda: new_function(argument), number=number)
+        print('{:<20} {:>14.0f} {:>14.0f} {:>7.2f}x'.format(
+            name, number / old_time, number / new_time, old_time / new_time))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
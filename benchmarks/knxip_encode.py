@@ -0,0 +1,59 @@
+"""
+Micro benchmark for serializing KNX/IP frames.
+
+Compares the list based `KNXIPFrame.to_knx()` (as previously used by UDPClient.send)
+with the preallocated bytearray of `KNXIPFrame.to_bytes()`.
+
+Usage: python benchmarks/knxip_encode.py [number_of_frames]
+"""
+import sys
+from timeit import timeit
+
+from xknx import XKNX
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.knxip import KNXIPFrame, KNXIPServiceType
+from xknx.telegram import GroupAddress, PhysicalAddress, Telegram
+
+
+def routing_indication(xknx, payload):
+    """Return a normalized ROUTING_INDICATION frame."""
+    knxipframe = KNXIPFrame(xknx)
+    knxipframe.init(KNXIPServiceType.ROUTING_INDICATION)
+    knxipframe.body.src_addr = PhysicalAddress('1.1.1')
+    knxipframe.body.telegram = Telegram(GroupAddress('1/2/3'), payload=payload)
+    knxipframe.normalize()
+    return knxipframe
+
+
+def tunnelling_request(xknx, payload):
+    """Return a normalized TUNNELLING_REQUEST frame."""
+    knxipframe = KNXIPFrame(xknx)
+    knxipframe.init(KNXIPServiceType.TUNNELLING_REQUEST)
+    knxipframe.body.communication_channel_id = 1
+    knxipframe.body.sequence_counter = 23
+    knxipframe.body.cemi.src_addr = PhysicalAddress('1.1.1')
+    knxipframe.body.cemi.telegram = Telegram(GroupAddress('1/2/3'), payload=payload)
+    knxipframe.normalize()
+    return knxipframe
+
+
+def main(number):
+    """Run benchmark and print frames per second."""
+    xknx = XKNX()
+    frames = (
+        ('routing binary', routing_indication(xknx, DPTBinary(1))),
+        ('routing 2 byte', routing_indication(xknx, DPTArray((0x0c, 0x1a)))),
+        ('tunnelling binary', tunnelling_request(xknx, DPTBinary(1))),
+        ('tunnelling 4 byte', tunnelling_request(xknx, DPTArray((0x45, 0x2c, 0x40, 0x00)))),
+    )
+    print('{:<20} {:>14} {:>14} {:>8}'.format('frame', 'list fps', 'bytes fps', 'speedup'))
+    for name, knxipframe in frames:
+        assert bytes(knxipframe.to_knx()) == knxipframe.to_bytes()
+        list_time = timeit(lambda frame=knxipframe: bytes(frame.to_knx()), number=number)
+        bytes_time = timeit(knxipframe.to_bytes, number=number)
+        print('{:<20} {:>14.0f} {:>14.0f} {:>7.2f}x'.format(
+            name, number / list_time, number / bytes_time, list_time / bytes_time))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
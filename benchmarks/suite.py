@@ -0,0 +1,391 @@
+"""
+Benchmark suite for the receive and send paths of xknx.
+
+Runs offline (the end-to-end benchmarks only use loopback sockets) and measures
+* encoding and decoding of KNX/IP frames (`KNXIPFrame.from_knx`/`to_knx`/`to_bytes`),
+* encoding and decoding of every DPT class within `xknx.dpt`,
+* `from_knx_many`/`to_knx_many` of DPT 9, 13 and 14 for 1000 payloads (if NumPy is installed),
+* `AddressFilter.match` and `CompiledAddressFilter.match`,
+* `Devices.devices_by_group_address` with 10k devices,
+* throughput of the TelegramQueue,
+* latency of a received datagram until `device_updated_cb` is called,
+* latency of `Switch.set_on()` until the datagram arrives at a loopback socket.
+
+Every benchmark yields one JSON record with operations per second, median and 99th percentile
+of the time per operation in microseconds and the memory allocated by a single operation in bytes
+(peak of tracemalloc). Micro benchmarks are timed in batches, so percentiles are those of the
+batch averages; latencies are timed per telegram.
+
+Usage: python benchmarks/suite.py [--quick] [--output results.json] [--compare baseline.json] [name ...]
+
+Names select benchmarks by prefix (e.g. `dpt` or `e2e.receive`). With --compare the results are
+compared to a previous run and the exit code is 1 if a benchmark got slower than --threshold.
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from itertools import cycle
+
+import xknx.dpt
+from xknx import XKNX
+from xknx.__version__ import __version__
+from xknx.devices import Switch
+from xknx.dpt import DPTArray, DPTBase, DPTBinary
+from xknx.io import KNXIPInterface, Routing, UDPClient
+from xknx.knxip import KNXIPFrame, KNXIPServiceType
+from xknx.telegram import (
+    AddressFilter, CompiledAddressFilter, GroupAddress, PhysicalAddress,
+    Telegram, TelegramDirection)
+
+# Sample payloads for DPT classes not accepting a payload of zeros
+DPT_SAMPLES = {
+    xknx.dpt.DPTControllerStatus: (0x21,),
+    xknx.dpt.DPTDate: (0x12, 0x06, 0x13),
+    xknx.dpt.DPTTime: (0x0c, 0x1e, 0x00),
+    xknx.dpt.DPTDateTime: (0x75, 0x06, 0x12, 0x0c, 0x1e, 0x00, 0x00, 0x00),
+}
+NUMBER_OF_DEVICES = 10000
+
+
+class Benchmark:
+    """Settings and results of a benchmark run."""
+
+    def __init__(self, quick):
+        """Initialize Benchmark class."""
+        # operations per batch and number of batches (or telegrams for latencies)
+        self.batch_size = 100 if quick else 1000
+        self.batches = 10 if quick else 50
+        self.telegrams = 200 if quick else 2000
+        self.results = []
+
+    def record(self, name, seconds_per_op, alloc_bytes):
+        """Add result of benchmark from the seconds each operation (or batch average) took."""
+        seconds_per_op = sorted(seconds_per_op)
+        result = {
+            'name': name,
+            'ops_per_sec': round(len(seconds_per_op) / sum(seconds_per_op), 1),
+            'p50_us': round(statistics.median(seconds_per_op) * 1e6, 3),
+            'p99_us': round(seconds_per_op[min(len(seconds_per_op) - 1, int(len(seconds_per_op) * 0.99))] * 1e6, 3),
+            'alloc_bytes': alloc_bytes,
+        }
+        self.results.append(result)
+        print('{name:<44} {ops_per_sec:>12.0f}/s {p50_us:>10.2f}us {p99_us:>10.2f}us {alloc_bytes:>8}B'.format(
+            **result), file=sys.stderr)
+
+    def run(self, name, function):
+        """Time function in batches and record result."""
+        function()
+        seconds_per_op = []
+        for _ in range(self.batches):
+            start = time.perf_counter()
+            for _ in range(self.batch_size):
+                function()
+            seconds_per_op.append((time.perf_counter() - start) / self.batch_size)
+        self.record(name, seconds_per_op, allocated(function))
+
+    async def run_async(self, name, function, number, ops_per_call=1):
+        """Time coroutine function per call and record result."""
+        await function()
+        seconds_per_op = []
+        for _ in range(number):
+            start = time.perf_counter()
+            await function()
+            seconds_per_op.append((time.perf_counter() - start) / ops_per_call)
+        peaks = []
+        for _ in range(5):
+            tracemalloc.start()
+            try:
+                await function()
+                peaks.append(tracemalloc.get_traced_memory()[1])
+            finally:
+                tracemalloc.stop()
+        self.record(name, seconds_per_op, int(statistics.median(peaks)) // ops_per_call)
+
+
+def allocated(function, number=5):
+    """Return median of bytes allocated at peak while calling function. Tracing restarts per call (no reset_peak() before Python 3.9)."""
+    peaks = []
+    for _ in range(number):
+        tracemalloc.start()
+        try:
+            function()
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+    return int(statistics.median(peaks))
+
+
+def routing_indication(xknx, group_address, payload):
+    """Return a normalized ROUTING_INDICATION frame."""
+    knxipframe = KNXIPFrame(xknx)
+    knxipframe.init(KNXIPServiceType.ROUTING_INDICATION)
+    knxipframe.body.src_addr = PhysicalAddress('1.1.1')
+    knxipframe.body.telegram = Telegram(group_address, payload=payload)
+    knxipframe.normalize()
+    return knxipframe
+
+
+def tunnelling_request(xknx, group_address, payload):
+    """Return a normalized TUNNELLING_REQUEST frame."""
+    knxipframe = KNXIPFrame(xknx)
+    knxipframe.init(KNXIPServiceType.TUNNELLING_REQUEST)
+    knxipframe.body.communication_channel_id = 1
+    knxipframe.body.sequence_counter = 23
+    knxipframe.body.cemi.src_addr = PhysicalAddress('1.1.1')
+    knxipframe.body.cemi.telegram = Telegram(group_address, payload=payload)
+    knxipframe.normalize()
+    return knxipframe
+
+
+def dpt_classes():
+    """Return all DPT classes of xknx.dpt with a payload sample."""
+    for name, dpt_class in sorted(vars(xknx.dpt).items()):
+        if inspect.isclass(dpt_class) and issubclass(dpt_class, DPTBase) \
+                and dpt_class not in (DPTBase, DPTArray, DPTBinary):
+            yield name, dpt_class, DPT_SAMPLES.get(
+                dpt_class, (0,) * (getattr(dpt_class, 'payload_length', None) or 1))
+
+
+def bench_knxip(benchmark):
+    """Benchmark decoding and encoding KNX/IP frames."""
+    xknx = XKNX()
+    frames = (
+        ('routing_binary', routing_indication(xknx, GroupAddress('1/2/3'), DPTBinary(1))),
+        ('routing_4byte', routing_indication(xknx, GroupAddress('1/2/3'), DPTArray((0x45, 0x2c, 0x40, 0x00)))),
+        ('tunnelling_binary', tunnelling_request(xknx, GroupAddress('1/2/3'), DPTBinary(1))),
+        ('tunnelling_4byte', tunnelling_request(xknx, GroupAddress('1/2/3'), DPTArray((0x45, 0x2c, 0x40, 0x00)))),
+    )
+    for name, knxipframe in frames:
+        raw = knxipframe.to_bytes()
+        benchmark.run('knxip.from_knx.' + name, lambda raw=raw: KNXIPFrame(xknx).from_knx(raw))
+        benchmark.run('knxip.to_knx.' + name, knxipframe.to_knx)
+        benchmark.run('knxip.to_bytes.' + name, knxipframe.to_bytes)
+
+
+def bench_dpt(benchmark):
+    """Benchmark decoding and encoding every DPT class."""
+    for name, dpt_class, raw in dpt_classes():
+        value = dpt_class.from_knx(raw)
+        benchmark.run('dpt.from_knx.' + name, lambda dpt_class=dpt_class, raw=raw: dpt_class.from_knx(raw))
+        benchmark.run('dpt.to_knx.' + name, lambda dpt_class=dpt_class, value=value: dpt_class.to_knx(value))
+
+
+def bench_dpt_many(benchmark):
+    """Benchmark decoding and encoding 1000 payloads at once with NumPy."""
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        print('dpt_many skipped: NumPy not installed', file=sys.stderr)
+        return
+    for dpt_class in (xknx.dpt.DPT2ByteFloat, xknx.dpt.DPT4ByteSigned, xknx.dpt.DPT4ByteFloat):
+        raw = numpy.zeros((1000, dpt_class.payload_length), dtype=numpy.uint8).tobytes()
+        values = dpt_class.from_knx_many(raw)
+        benchmark.run('dpt_many.from_knx_many.1000.' + dpt_class.__name__,
+                      lambda dpt_class=dpt_class, raw=raw: dpt_class.from_knx_many(raw))
+        benchmark.run('dpt_many.to_knx_many.1000.' + dpt_class.__name__,
+                      lambda dpt_class=dpt_class, values=values: dpt_class.to_knx_many(values))
+
+
+def bench_address_filter(benchmark):
+    """Benchmark matching group addresses."""
+    group_addresses = [GroupAddress(raw) for raw in range(0, 65536, 257)]
+    for pattern in ('1/*/2-5', '1/1-3,4,5/*', '*/2-5', '2-5'):
+        address_filter = AddressFilter(pattern)
+
+        def match(address_filter=address_filter):
+            for group_address in group_addresses:
+                address_filter.match(group_address)
+        benchmark.run('address_filter.match.' + pattern, match)
+        compiled_filter = CompiledAddressFilter([address_filter])
+
+        def match_compiled(compiled_filter=compiled_filter):
+            for group_address in group_addresses:
+                compiled_filter.match(group_address)
+        benchmark.run('address_filter.compiled.' + pattern, match_compiled)
+
+
+def bench_devices(benchmark):
+    """Benchmark finding devices by group address among 10k devices."""
+    xknx = XKNX()
+    for index in range(NUMBER_OF_DEVICES):
+        xknx.devices.add(Switch(xknx, 'switch{}'.format(index),
+                                group_address=GroupAddress(index * 2 + 1),
+                                group_address_state=GroupAddress(index * 2 + 2)))
+    group_addresses = [GroupAddress(raw) for raw in range(1, NUMBER_OF_DEVICES * 2, 97)]
+
+    def lookup():
+        for group_address in group_addresses:
+            for _ in xknx.devices.devices_by_group_address(group_address):
+                pass
+    benchmark.run('devices.devices_by_group_address.10k', lookup)
+    benchmark.run('devices.has_group_address.10k',
+                  lambda: [xknx.devices.has_group_address(group_address) for group_address in group_addresses])
+
+
+async def bench_telegram_queue(benchmark):
+    """Benchmark processing incoming telegrams by the running TelegramQueue."""
+    xknx = XKNX()
+    xknx.loop = asyncio.get_event_loop()
+    for index in range(100):
+        xknx.devices.add(Switch(xknx, 'switch{}'.format(index), group_address=GroupAddress(index + 1)))
+    telegrams = [Telegram(GroupAddress(index % 100 + 1), payload=DPTBinary(index % 2),
+                          direction=TelegramDirection.INCOMING) for index in range(benchmark.batch_size)]
+
+    async def process_batch():
+        """Queue telegrams and wait until all were processed."""
+        for telegram in telegrams:
+            xknx.telegrams.put_nowait(telegram)
+        await xknx.telegrams.join()
+    await xknx.telegram_queue.start()
+    await benchmark.run_async('telegram_queue.incoming', process_batch, benchmark.batches, len(telegrams))
+    await xknx.telegram_queue.stop()
+
+
+async def bench_receive(benchmark):
+    """Benchmark latency of received datagram until device_updated_cb is called."""
+    xknx = XKNX()
+    xknx.loop = asyncio.get_event_loop()
+    xknx.knxip_interface = KNXIPInterface(xknx)
+    routing = Routing(xknx, xknx.knxip_interface.telegram_received, '127.0.0.1', False,
+                      group_address_filter=xknx.telegram_queue.is_subscribed)
+    updated = asyncio.Event()
+
+    async def device_updated_cb(device):
+        """Signal device was updated."""
+        # pylint: disable=unused-argument
+        updated.set()
+    for index in range(NUMBER_OF_DEVICES):
+        xknx.devices.add(Switch(xknx, 'switch{}'.format(index), group_address=GroupAddress(index + 1),
+                                device_updated_cb=device_updated_cb))
+    # every datagram toggles the state of a switch, so device_updated_cb is called for each
+    datagrams = cycle([routing_indication(xknx, GroupAddress(index % NUMBER_OF_DEVICES + 1),
+                                          DPTBinary((index // NUMBER_OF_DEVICES + 1) % 2)).to_bytes()
+                       for index in range(2 * NUMBER_OF_DEVICES)])
+
+    async def receive():
+        """Pass datagram to UDPClient and wait for device_updated_cb."""
+        updated.clear()
+        routing.udpclient.data_received_callback(next(datagrams))
+        await updated.wait()
+    await xknx.telegram_queue.start()
+    await benchmark.run_async('e2e.receive.datagram_to_device_updated_cb', receive, benchmark.telegrams)
+    await xknx.telegram_queue.stop()
+
+
+async def bench_send(benchmark):
+    """
+    Benchmark latency of Switch.set_on() until the datagram was received by a loopback socket.
+
+    Allocations include the 256 KiB buffer asyncio allocates for receiving a datagram at the socket.
+    """
+    xknx = XKNX(rate_limit=0)
+    xknx.loop = asyncio.get_event_loop()
+    received = asyncio.Event()
+
+    class Sink(asyncio.DatagramProtocol):
+        """Signal datagram was received."""
+
+        def datagram_received(self, data, addr):
+            """Signal datagram was received."""
+            received.set()
+    (sink, _) = await xknx.loop.create_datagram_endpoint(Sink, local_addr=('127.0.0.1', 0))
+    xknx.knxip_interface = KNXIPInterface(xknx)
+    routing = Routing(xknx, None, '127.0.0.1', False)
+    routing.udpclient = UDPClient(xknx, ('127.0.0.1', 0), sink.get_extra_info('sockname')[:2])
+    await routing.udpclient.connect()
+    xknx.knxip_interface.interface = routing
+    switch = Switch(xknx, 'switch', group_address=GroupAddress('1/2/3'))
+
+    async def send():
+        """Switch on and wait for datagram."""
+        received.clear()
+        await switch.set_on()
+        await received.wait()
+    await xknx.telegram_queue.start()
+    await benchmark.run_async('e2e.send.set_on_to_datagram', send, benchmark.telegrams)
+    await xknx.telegram_queue.stop()
+    await routing.udpclient.stop()
+    sink.close()
+
+
+BENCHMARKS = (
+    ('knxip', bench_knxip),
+    ('dpt', bench_dpt),
+    ('dpt_many', bench_dpt_many),
+    ('address_filter', bench_address_filter),
+    ('devices', bench_devices),
+    ('telegram_queue', bench_telegram_queue),
+    ('e2e.receive', bench_receive),
+    ('e2e.send', bench_send),
+)
+
+
+def compare(results, baseline, threshold):
+    """Print results slower than baseline by more than threshold. Return number of regressions."""
+    baseline_ops = {result['name']: result['ops_per_sec'] for result in baseline['results']}
+    regressions = 0
+    for result in results:
+        if result['name'] not in baseline_ops:
+            continue
+        ratio = result['ops_per_sec'] / baseline_ops[result['name']]
+        if ratio < 1 - threshold:
+            regressions += 1
+            print('REGRESSION {:<44} {:>6.2f}x of baseline'.format(result['name'], ratio), file=sys.stderr)
+    return regressions
+
+
+def main(argv=None):
+    """Run selected benchmarks, print results as JSON. Return exit code."""
+    parser = argparse.ArgumentParser(description='Benchmark suite for xknx.')
+    parser.add_argument('names', nargs='*', help='run benchmarks starting with these names only')
+    parser.add_argument('--quick', action='store_true', help='less iterations, e.g. for CI')
+    parser.add_argument('--output', help='write JSON results to file instead of stdout')
+    parser.add_argument('--compare', help='JSON results of a previous run to compare with')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='relative slowdown reported as regression (default: 0.1)')
+    args = parser.parse_args(argv)
+
+    benchmark = Benchmark(args.quick)
+    for name, function in BENCHMARKS:
+        if args.names and not any(name.startswith(prefix) or prefix.startswith(name) for prefix in args.names):
+            continue
+        if inspect.iscoroutinefunction(function):
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(function(benchmark))
+            finally:
+                loop.close()
+        else:
+            function(benchmark)
+    if args.names:
+        benchmark.results = [result for result in benchmark.results
+                             if any(result['name'].startswith(prefix) for prefix in args.names)]
+
+    output = {
+        'version': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'quick': args.quick,
+        'results': benchmark.results,
+    }
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(output, output_file, indent=2)
+    else:
+        json.dump(output, sys.stdout, indent=2)
+        print()
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            return 1 if compare(benchmark.results, json.load(baseline_file), args.threshold) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,7 +4,7 @@ import getopt
 import sys
 
 from xknx import XKNX
-from xknx.telegram import AddressFilter
+from xknx.telegram import AddressFilter, CompiledAddressFilter
 
 
 async def telegram_received_cb(telegram):
@@ -47,7 +47,7 @@ async def main(argv):
             show_help()
             sys.exit()
         if opt in ['-f', '--filter']:
-            address_filters = list(map(AddressFilter, arg.split(',')))
+            address_filters = CompiledAddressFilter(map(AddressFilter, arg.split(',')))
     await monitor(address_filters)
 
 
@@ -7,7 +7,7 @@ from xknx.devices import ActionCallback, DateTime, DateTimeBroadcastType, Expose
 from xknx.dpt import DPTArray, DPTBinary
 from xknx.exceptions import XKNXException
 from xknx.io import DEFAULT_MCAST_PORT, ConnectionConfig, ConnectionType
-from xknx.telegram import AddressFilter, GroupAddress, Telegram
+from xknx.telegram import AddressFilter, CompiledAddressFilter, GroupAddress, Telegram
 
 from homeassistant.const import (
     CONF_ENTITY_ID,
@@ -236,7 +236,7 @@ class KNXModule:
             CONF_XKNX_FIRE_EVENT in self.config[DOMAIN]
             and self.config[DOMAIN][CONF_XKNX_FIRE_EVENT]
         ):
-            address_filters = list(
+            address_filters = CompiledAddressFilter(
                 map(AddressFilter, self.config[DOMAIN][CONF_XKNX_FIRE_EVENT_FILTER])
             )
             self.xknx.telegram_queue.register_telegram_received_cb(
@@ -1,6 +1,5 @@
 """Generate a markdown table that can be copied to home-assistant.io sensor.knx documentation."""
 try:
-    from xknx.remote_value import RemoteValueSensor
     from xknx.dpt import DPTBase
 except ModuleNotFoundError:
     exit("Add the `xknx` directory to pythons path via `export PYTHONPATH=$HOME/directory/to/xknx`")
@@ -126,7 +125,7 @@ def table_delimiter():
 def print_table():
     """Read the values and print the table to stdout."""
     rows = []
-    for key, dpt in RemoteValueSensor.DPTMAP.items():
+    for key, dpt in DPTBase.value_types().items():
         rows.append(DPTRow(value_type=key, dpt_class=dpt))
 
     rows.sort(key=lambda row: row.dpt_number_int())
@@ -17,6 +17,11 @@ REQUIRES = [
     'netifaces>=0.10.9'
 ]
 
+EXTRAS_REQUIRE = {
+    # from_knx_many/to_knx_many of DPT classes
+    'numpy': ['numpy>=1.16'],
+}
+
 setup(
     name='xknx',
     description='An Asynchronous Library for the KNX protocol. Documentation: https://xknx.io/',
@@ -41,5 +46,6 @@ setup(
     ],
     packages=find_packages(),
     install_requires=REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     keywords='knx ip knxip eib home automation',
     zip_safe=False)
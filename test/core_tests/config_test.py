@@ -26,6 +26,42 @@ class TestConfig(unittest.TestCase):
         xknx = XKNX(config='xknx.yaml')
         self.assertEqual(xknx.own_address, PhysicalAddress('15.15.249'))
         self.assertEqual(xknx.rate_limit, 18)
+        self.assertEqual(xknx.rate_limit_burst, 5)
+        self.assertIsNone(xknx.state_snapshot)
+
+    def test_config_general_state_snapshot(self):
+        """Test reading state snapshot file from general section."""
+        import yaml
+        xknx = XKNX()
+        Config(xknx).parse_general(yaml.safe_load("""
+            general:
+                state_snapshot_file: '/var/lib/xknx/state.bin'
+            """))
+        self.assertEqual(xknx.state_snapshot.path, '/var/lib/xknx/state.bin')
+
+    def test_config_general_callbacks(self):
+        """Test reading slow callback threshold and callback workers from general section."""
+        import yaml
+        xknx = XKNX()
+        Config(xknx).parse_general(yaml.safe_load("""
+            general:
+                slow_callback_threshold: 0.5
+                callback_workers: 4
+            """))
+        self.assertEqual(xknx.telegram_queue.slow_callback_threshold, 0.5)
+        self.assertEqual(xknx.telegram_queue.callback_workers, 4)
+
+    def test_config_general_state_sync(self):
+        """Test reading state sync settings from general section."""
+        import yaml
+        xknx = XKNX()
+        Config(xknx).parse_general(yaml.safe_load("""
+            general:
+                state_sync_max_in_flight: 3
+                state_sync_timeout: 2.5
+            """))
+        self.assertEqual(xknx.state_sync_max_in_flight, 3)
+        self.assertEqual(xknx.state_sync_timeout, 2.5)
 
     #
     # XKNX Connection Config
@@ -54,6 +90,17 @@ class TestConfig(unittest.TestCase):
                  gateway_port=6000)
              ),
             ("""
+            connection:
+                tunneling:
+                    gateway_ip: '192.168.1.2'
+                    window: 4
+            """,
+             ConnectionConfig(
+                 connection_type=ConnectionType.TUNNELING,
+                 gateway_ip="192.168.1.2",
+                 window=4)
+             ),
+            ("""
             connection:
                 tunneling:
                     gateway_ip: '192.168.1.2'
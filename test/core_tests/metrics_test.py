@@ -0,0 +1,110 @@
+"""Unit test for Metrics."""
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import pytest
+pytestmark = pytest.mark.asyncio
+
+from xknx import XKNX
+from xknx.core import Metrics
+from xknx.dpt import DPTBinary
+from xknx.io import KNXIPInterface, MetricsExporter, UDPClient
+from xknx.telegram import GroupAddress, Telegram, TelegramDirection
+
+# ROUTING_INDICATION with L_DATA_IND GroupValueResponse 0xf0 to 0/1/81
+RAW_ROUTING_INDICATION = bytes((0x06, 0x10, 0x05, 0x30, 0x00, 0x12, 0x29, 0x00,
+                                0xbc, 0xd0, 0x12, 0x02, 0x01, 0x51, 0x02, 0x00,
+                                0x40, 0xf0))
+
+
+class TestMetrics(unittest.TestCase):
+    """Test class for Metrics."""
+
+    def test_disabled(self):
+        """Test metrics being disabled by default."""
+        self.assertIsNone(XKNX().metrics)
+        self.assertIsInstance(XKNX(metrics=True).metrics, Metrics)
+
+    def test_expose(self):
+        """Test exposing counters, gauges and histograms in Prometheus text format."""
+        metrics = Metrics(XKNX())
+        metrics._families.clear()
+        metrics.counter('test_total', 'Test counter.').inc(2)
+        metrics.counter('test_total', 'Test counter.', labels={'name': 'a"b\\c'}).inc()
+        metrics.gauge('test_depth', 'Test gauge.', function=lambda: 7)
+        histogram = metrics.histogram('test_seconds', 'Test histogram.', buckets=(0.1, 1))
+        histogram.observe(0.1)
+        histogram.observe(0.5)
+        histogram.observe(2)
+        self.assertEqual(
+            metrics.expose(),
+            '# HELP test_total Test counter.\n'
+            '# TYPE test_total counter\n'
+            'test_total 2\n'
+            'test_total{name="a\\"b\\\\c"} 1\n'
+            '# HELP test_depth Test gauge.\n'
+            '# TYPE test_depth gauge\n'
+            'test_depth 7\n'
+            '# HELP test_seconds Test histogram.\n'
+            '# TYPE test_seconds histogram\n'
+            'test_seconds_bucket{le="0.1"} 1\n'
+            'test_seconds_bucket{le="1"} 2\n'
+            'test_seconds_bucket{le="+Inf"} 3\n'
+            'test_seconds_sum 2.6\n'
+            'test_seconds_count 3\n')
+
+    def test_udp_client(self):
+        """Test counting received, filtered, parsed and failed datagrams."""
+        xknx = XKNX(metrics=True)
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 1234))
+        udp_client.data_received_callback(RAW_ROUTING_INDICATION)
+        with patch('logging.Logger.exception'):
+            # wrong protocol version
+            udp_client.data_received_callback(b'\x06\x20' + RAW_ROUTING_INDICATION[2:])
+        udp_client.group_address_filter = lambda group_address: False
+        udp_client.data_received_callback(RAW_ROUTING_INDICATION)
+        self.assertEqual(xknx.metrics.datagrams_received.value, 3)
+        self.assertEqual(xknx.metrics.datagrams_parsed.value, 1)
+        self.assertEqual(xknx.metrics.datagrams_failed.value, 1)
+        self.assertEqual(xknx.metrics.datagrams_filtered.value, 1)
+
+    async def test_telegram_queue(self):
+        """Test measuring queue depth, wait time and execution time of callbacks."""
+        xknx = XKNX(metrics=True)
+        xknx.knxip_interface = KNXIPInterface(xknx)
+
+        async def telegram_received_cb(telegram):
+            """Handle telegram."""
+        xknx.telegram_queue.register_telegram_received_cb(telegram_received_cb)
+        xknx.knxip_interface.telegram_received(
+            Telegram(GroupAddress('1/2/3'), direction=TelegramDirection.INCOMING, payload=DPTBinary(1)))
+        self.assertIn('xknx_telegram_queue_depth 1\n', xknx.metrics.expose())
+        await xknx.telegram_queue.process_telegrams([xknx.telegrams.get_nowait()])
+        self.assertEqual(xknx.metrics.telegram_queue_wait.count, 1)
+        self.assertEqual(xknx.metrics.callback_time(telegram_received_cb).count, 1)
+        self.assertIn('xknx_callback_seconds_count{callback="TestMetrics.test_telegram_queue.'
+                      '<locals>.telegram_received_cb"} 1\n', xknx.metrics.expose())
+
+    async def test_exporter(self):
+        """Test serving metrics via HTTP."""
+        xknx = XKNX()
+        exporter = MetricsExporter(xknx, port=0)
+        self.assertIsNotNone(xknx.metrics)
+        await exporter.start()
+        xknx.metrics.heartbeat_failures.inc()
+
+        async def get(path):
+            """Return response to GET request."""
+            reader, writer = await asyncio.open_connection('127.0.0.1', exporter.port)
+            writer.write('GET {} HTTP/1.1\r\nHost: localhost\r\n\r\n'.format(path).encode())
+            response = await reader.read()
+            writer.close()
+            return response.decode()
+
+        response = await get('/metrics')
+        self.assertTrue(response.startswith('HTTP/1.1 200 OK\r\n'))
+        self.assertIn('\r\n\r\n# HELP xknx_datagrams_received_total', response)
+        self.assertIn('\nxknx_heartbeat_failures_total 1\n', response)
+        self.assertTrue((await get('/')).startswith('HTTP/1.1 404 Not Found\r\n'))
+        await exporter.stop()
@@ -0,0 +1,59 @@
+"""Unit test for RateLimiter objects."""
+import unittest
+from unittest.mock import patch
+
+from xknx import XKNX
+from xknx.core import RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test class for RateLimiter objects."""
+
+    @patch('xknx.core.rate_limiter.time.monotonic')
+    def test_reserve(self, monotonic_mock):
+        """Test taking tokens from the bucket."""
+        monotonic_mock.return_value = 100.0
+        rate_limiter = RateLimiter(10, burst=3)
+        # burst
+        self.assertEqual(rate_limiter.reserve(), 0)
+        self.assertEqual(rate_limiter.reserve(), 0)
+        self.assertEqual(rate_limiter.reserve(), 0)
+        # bucket empty
+        self.assertAlmostEqual(rate_limiter.reserve(), 0.1)
+        self.assertAlmostEqual(rate_limiter.reserve(), 0.2)
+        # refilled after 0.5 seconds - bucket never exceeds burst
+        monotonic_mock.return_value = 100.5
+        self.assertEqual(rate_limiter.reserve(), 0)
+        monotonic_mock.return_value = 110.0
+        for _ in range(3):
+            self.assertEqual(rate_limiter.reserve(), 0)
+        self.assertAlmostEqual(rate_limiter.reserve(), 0.1)
+
+    @patch('xknx.core.rate_limiter.time.monotonic')
+    def test_disabled(self, monotonic_mock):
+        """Test rate limit of 0 disables rate limiting."""
+        monotonic_mock.return_value = 100.0
+        rate_limiter = RateLimiter(0)
+        for _ in range(100):
+            self.assertEqual(rate_limiter.reserve(), 0)
+
+    @patch('xknx.core.rate_limiter.time.monotonic')
+    def test_set_rate_and_burst(self, monotonic_mock):
+        """Test changing rate and burst."""
+        monotonic_mock.return_value = 100.0
+        rate_limiter = RateLimiter(10, burst=5)
+        rate_limiter.burst = 1
+        self.assertEqual(rate_limiter.reserve(), 0)
+        self.assertAlmostEqual(rate_limiter.reserve(), 0.1)
+        rate_limiter.rate = 2
+        self.assertAlmostEqual(rate_limiter.reserve(), 1.0)
+
+    def test_xknx_rate_limit(self):
+        """Test XKNX rate_limit and rate_limit_burst map onto the rate limiter of the telegram queue."""
+        xknx = XKNX(rate_limit=10, rate_limit_burst=4)
+        self.assertEqual(xknx.telegram_queue.rate_limiter.rate, 10)
+        self.assertEqual(xknx.telegram_queue.rate_limiter.burst, 4)
+        xknx.rate_limit = 5
+        self.assertEqual(xknx.telegram_queue.rate_limiter.rate, 5)
+        self.assertEqual(xknx.rate_limit, 5)
+        self.assertEqual(xknx.rate_limit_burst, 4)
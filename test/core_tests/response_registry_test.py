@@ -0,0 +1,123 @@
+"""Unit test for ResponseRegistry."""
+import asyncio
+import unittest
+
+import pytest
+pytestmark = pytest.mark.asyncio
+
+from xknx import XKNX
+from xknx.core import ValueReader
+from xknx.dpt import DPTBinary
+from xknx.telegram import (
+    GroupAddress, Telegram, TelegramDirection, TelegramType)
+
+
+class TestResponseRegistry(unittest.TestCase):
+    """Test class for ResponseRegistry objects."""
+
+    @staticmethod
+    def _telegram(group_address, telegramtype=TelegramType.GROUP_RESPONSE):
+        """Return incoming telegram."""
+        return Telegram(GroupAddress(group_address),
+                        telegramtype=telegramtype,
+                        direction=TelegramDirection.INCOMING,
+                        payload=DPTBinary(1))
+
+    async def test_register(self):
+        """Test resolving all futures of a group address at once."""
+        xknx = XKNX()
+        registry = xknx.response_registry
+        group_address = GroupAddress('1/2/3')
+        future1 = registry.register(group_address)
+        future2 = registry.register(group_address)
+        self.assertIs(future1, future2)
+        self.assertTrue(registry.is_pending(group_address))
+
+        self.assertFalse(registry.telegram_received(
+            self._telegram('1/2/3', TelegramType.GROUP_READ)))
+        self.assertFalse(registry.telegram_received(self._telegram('1/2/4')))
+        self.assertFalse(future1.done())
+
+        telegram = self._telegram('1/2/3', TelegramType.GROUP_WRITE)
+        self.assertTrue(registry.telegram_received(telegram))
+        self.assertEqual(future1.result(), telegram)
+        self.assertFalse(registry.is_pending(group_address))
+        registry.unregister(group_address, future1)
+        registry.unregister(group_address, future2)
+        self.assertFalse(registry.is_pending(group_address))
+
+    async def test_unregister(self):
+        """Test cancelling future when the last reader unregisters."""
+        xknx = XKNX()
+        registry = xknx.response_registry
+        group_address = GroupAddress('1/2/3')
+        future = registry.register(group_address)
+        registry.register(group_address)
+        registry.unregister(group_address, future)
+        self.assertTrue(registry.is_pending(group_address))
+        self.assertFalse(future.cancelled())
+        registry.unregister(group_address, future)
+        self.assertFalse(registry.is_pending(group_address))
+        self.assertTrue(future.cancelled())
+
+    async def test_read_deduplicated(self):
+        """Test concurrent reads of a group address sending one GroupValueRead."""
+        xknx = XKNX()
+        group_address = GroupAddress('1/2/3')
+        read1 = asyncio.ensure_future(xknx.response_registry.read(group_address))
+        read2 = asyncio.ensure_future(ValueReader(xknx, group_address).read())
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        self.assertEqual(xknx.telegrams.qsize(), 1)
+
+        telegram = self._telegram('1/2/3')
+        await xknx.telegram_queue.process_telegram_incoming(telegram)
+        self.assertEqual(await read1, telegram)
+        self.assertEqual(await read2, telegram)
+        self.assertFalse(xknx.response_registry.is_pending(group_address))
+
+    async def test_read_timeout(self):
+        """Test read returning None if no response was received in time after the GroupValueRead was sent."""
+        xknx = XKNX()
+        # GroupValueReads are sent by this test instead of a running TelegramQueue
+        xknx.telegram_queue.running = True
+        group_address = GroupAddress('1/2/3')
+        read = asyncio.ensure_future(
+            xknx.response_registry.read(group_address, timeout_in_seconds=0.01))
+        await asyncio.sleep(0.05)
+        # timeout did not start while the GroupValueRead was queued
+        self.assertFalse(read.done())
+
+        await xknx.telegram_queue.process_telegram_outgoing(xknx.telegrams.get_nowait())
+        self.assertIsNone(await read)
+        self.assertFalse(xknx.response_registry.is_pending(group_address))
+
+    async def test_read_queue_not_running(self):
+        """Test read timeout starting when the GroupValueRead was queued if the TelegramQueue is not running."""
+        xknx = XKNX()
+        await xknx.telegram_queue.start()
+        await xknx.telegram_queue.stop()
+        self.assertFalse(xknx.telegram_queue.running)
+        group_address = GroupAddress('1/2/3')
+        self.assertIsNone(await xknx.response_registry.read(group_address, timeout_in_seconds=0.01))
+        self.assertEqual(xknx.telegrams.qsize(), 1)
+        self.assertFalse(xknx.response_registry.is_pending(group_address))
+
+    async def test_read_send_timeout(self):
+        """Test read timeout starting after send_timeout_in_seconds if the GroupValueRead is never sent."""
+        xknx = XKNX()
+        xknx.telegram_queue.running = True
+        xknx.response_registry.send_timeout_in_seconds = 0.01
+        group_address = GroupAddress('1/2/3')
+        self.assertIsNone(await xknx.response_registry.read(group_address, timeout_in_seconds=0.01))
+        self.assertFalse(xknx.response_registry.is_pending(group_address))
+
+    async def test_read_response_before_sent(self):
+        """Test read returning a response received before the GroupValueRead was recorded as sent."""
+        xknx = XKNX()
+        group_address = GroupAddress('1/2/3')
+        read = asyncio.ensure_future(xknx.response_registry.read(group_address))
+        await asyncio.sleep(0)
+        telegram = self._telegram('1/2/3')
+        self.assertTrue(xknx.response_registry.telegram_received(telegram))
+        self.assertEqual(await read, telegram)
@@ -0,0 +1,137 @@
+"""Unit test for StateSnapshot."""
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+import pytest
+pytestmark = pytest.mark.asyncio
+
+from xknx import XKNX
+from xknx.core import StateSnapshot, StateUpdater
+from xknx.devices import BinarySensor, BinarySensorState, Sensor, Switch
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.telegram import (
+    GroupAddress, Telegram, TelegramDirection, TelegramType)
+
+
+class TestStateSnapshot(unittest.TestCase):
+    """Test class for StateSnapshot objects."""
+
+    def setUp(self):
+        """Set up temporary snapshot file."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'state.bin')
+
+    def tearDown(self):
+        """Remove temporary snapshot file."""
+        self.tmp_dir.cleanup()
+
+    @staticmethod
+    def _telegram(group_address, payload):
+        """Return incoming GroupValueWrite telegram."""
+        return Telegram(GroupAddress(group_address),
+                        telegramtype=TelegramType.GROUP_WRITE,
+                        direction=TelegramDirection.INCOMING,
+                        payload=payload)
+
+    def test_encode_decode(self):
+        """Test binary records of DPTBinary and DPTArray payloads."""
+        record_binary = StateSnapshot.encode_record(GroupAddress('1/2/3'), 1000.5, DPTBinary(1))
+        record_array = StateSnapshot.encode_record(GroupAddress('1/2/4'), 1001.0, DPTArray((0x0c, 0x1a)))
+        self.assertEqual(len(record_binary), 11)
+        self.assertEqual(len(record_array), 13)
+        self.assertEqual(
+            list(StateSnapshot.decode_records(record_binary + record_array + record_array[:12])),
+            [(GroupAddress('1/2/3'), 1000.5, DPTBinary(1)),
+             (GroupAddress('1/2/4'), 1001.0, DPTArray((0x0c, 0x1a)))])
+
+    def test_restore(self):
+        """Test restoring payloads into devices without executing callbacks."""
+        with open(self.path, 'wb') as snapshot_file:
+            snapshot_file.write(
+                StateSnapshot.MAGIC +
+                StateSnapshot.encode_record(GroupAddress('1/2/3'), 1000, DPTBinary(0)) +
+                StateSnapshot.encode_record(GroupAddress('1/2/4'), 1000, DPTArray((0x0c, 0x1a))) +
+                StateSnapshot.encode_record(GroupAddress('1/2/5'), 1000, DPTBinary(1)) +
+                StateSnapshot.encode_record(GroupAddress('1/2/3'), 1001, DPTBinary(1)) +
+                StateSnapshot.encode_record(GroupAddress('1/2/9'), 1001, DPTBinary(1)))
+        xknx = XKNX(state_snapshot_file=self.path)
+        device_updated_cb = Mock()
+        switch = Switch(xknx, 'TestSwitch', group_address='1/2/2', group_address_state='1/2/3',
+                        device_updated_cb=device_updated_cb)
+        sensor = Sensor(xknx, 'TestSensor', group_address_state='1/2/4', value_type='temperature')
+        binary_sensor = BinarySensor(xknx, 'TestBinarySensor', group_address_state='1/2/5')
+        for device in (switch, sensor, binary_sensor):
+            xknx.devices.add(device)
+
+        self.assertEqual(xknx.state_snapshot.load(), 4)
+        self.assertEqual(xknx.state_snapshot.restore(), 3)
+        self.assertTrue(switch.state)
+        self.assertEqual(sensor.resolve_state(), 21.0)
+        self.assertEqual(binary_sensor.state, BinarySensorState.ON)
+        device_updated_cb.assert_not_called()
+
+    def test_load_unknown_format(self):
+        """Test ignoring files with unknown format."""
+        with open(self.path, 'wb') as snapshot_file:
+            snapshot_file.write(b'something else')
+        xknx = XKNX()
+        with patch('logging.Logger.warning') as mock_warn:
+            self.assertEqual(StateSnapshot(xknx, self.path).load(), 0)
+            mock_warn.assert_called_once()
+
+    async def test_record_and_load(self):
+        """Test writing incoming payloads and marking restored values as updated within StateUpdater."""
+        xknx = XKNX(state_snapshot_file=self.path)
+        await xknx.telegram_queue.process_telegram_incoming(self._telegram('1/2/3', DPTBinary(1)))
+        await xknx.telegram_queue.process_telegram_incoming(self._telegram('1/2/4', DPTArray(0x42)))
+        self.assertFalse(os.path.exists(self.path))
+        await xknx.state_snapshot.stop()
+        self.assertEqual(os.path.getsize(self.path), 8 + 11 + 12)
+
+        xknx = XKNX(state_snapshot_file=self.path)
+        xknx.state_updater = StateUpdater(xknx)
+        xknx.devices.add(Switch(xknx, 'TestSwitch', group_address='1/2/2', group_address_state='1/2/3'))
+        xknx.state_snapshot.load()
+        xknx.state_snapshot.restore()
+        self.assertTrue(xknx.devices['TestSwitch'].state)
+        last_updated = xknx.state_updater.last_updated[GroupAddress('1/2/3')]
+        self.assertAlmostEqual(last_updated, xknx.loop.time(), delta=1)
+
+    async def test_append_and_compact(self):
+        """Test appending changed payloads and rewriting the file when it holds too many outdated records."""
+        xknx = XKNX()
+        state_snapshot = StateSnapshot(xknx, self.path)
+        state_snapshot.telegram_received(self._telegram('1/2/3', DPTBinary(0)))
+        state_snapshot.telegram_received(self._telegram('1/2/4', DPTBinary(0)))
+        await state_snapshot.flush()
+        self.assertEqual(os.path.getsize(self.path), 8 + 2 * 11)
+
+        state_snapshot.telegram_received(self._telegram('1/2/3', DPTBinary(1)))
+        await state_snapshot.flush()
+        self.assertEqual(os.path.getsize(self.path), 8 + 3 * 11)
+
+        state_snapshot.telegram_received(self._telegram('1/2/3', DPTBinary(0)))
+        state_snapshot.telegram_received(self._telegram('1/2/4', DPTBinary(1)))
+        await state_snapshot.flush()
+        self.assertEqual(os.path.getsize(self.path), 8 + 2 * 11)
+
+        loaded = StateSnapshot(xknx, self.path)
+        loaded.load()
+        self.assertEqual(loaded.entries[GroupAddress('1/2/3')][1], DPTBinary(0))
+        self.assertEqual(loaded.entries[GroupAddress('1/2/4')][1], DPTBinary(1))
+
+    async def test_debounced_flush_in_executor(self):
+        """Test writing the snapshot file within an executor after the debounce delay."""
+        xknx = XKNX()
+        state_snapshot = StateSnapshot(xknx, self.path, debounce=0)
+        with patch.object(xknx.loop, 'run_in_executor', wraps=xknx.loop.run_in_executor) as mock_executor:
+            state_snapshot.telegram_received(self._telegram('1/2/3', DPTBinary(1)))
+            self.assertFalse(os.path.exists(self.path))
+            while not mock_executor.called:
+                await asyncio.sleep(0)
+            await state_snapshot.stop()
+        self.assertEqual(os.path.getsize(self.path), 8 + 11)
+        mock_executor.assert_called_once()
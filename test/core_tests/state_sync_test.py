@@ -0,0 +1,161 @@
+"""Unit test for StateSync."""
+import asyncio
+import unittest
+
+import pytest
+pytestmark = pytest.mark.asyncio
+
+from xknx import XKNX
+from xknx.core import StateSync
+from xknx.devices import Light, Switch
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.telegram import (
+    GroupAddress, Telegram, TelegramDirection, TelegramType)
+
+
+class TestStateSync(unittest.TestCase):
+    """Test class for StateSync objects."""
+
+    @staticmethod
+    def _response(group_address, payload):
+        """Return incoming GroupValueResponse telegram."""
+        return Telegram(GroupAddress(group_address),
+                        telegramtype=TelegramType.GROUP_RESPONSE,
+                        direction=TelegramDirection.INCOMING,
+                        payload=payload)
+
+    @staticmethod
+    async def _idle():
+        """Let pending tasks run until they wait for responses."""
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    @staticmethod
+    def _send_all(xknx):
+        """Take queued group reads as sent to the KNX bus."""
+        while not xknx.telegrams.empty():
+            xknx.response_registry.telegram_sent(xknx.telegrams.get_nowait())
+
+    async def test_sync(self):
+        """Test reading state addresses concurrently and passing responses to devices."""
+        xknx = XKNX()
+        switch = Switch(xknx, 'TestSwitch', group_address='1/2/3', group_address_state='1/2/4')
+        light = Light(xknx, 'TestLight',
+                      group_address_switch='1/3/1', group_address_switch_state='1/2/4',
+                      group_address_brightness='1/3/2', group_address_brightness_state='1/3/3')
+        state_sync = StateSync(xknx, max_in_flight=10)
+        sync_task = asyncio.ensure_future(state_sync.sync([switch, light]))
+        await self._idle()
+
+        # state address shared by switch and light is read once
+        self.assertEqual(state_sync.total, 2)
+        self.assertEqual(xknx.telegrams.qsize(), 2)
+        read_addresses = set()
+        while not xknx.telegrams.empty():
+            telegram = xknx.telegrams.get_nowait()
+            self.assertEqual(telegram.telegramtype, TelegramType.GROUP_READ)
+            self.assertTrue(telegram.background)
+            read_addresses.add(telegram.group_address)
+        self.assertEqual(read_addresses, {GroupAddress('1/2/4'), GroupAddress('1/3/3')})
+
+        await xknx.telegram_queue.process_telegram_incoming(
+            self._response('1/2/4', DPTBinary(1)))
+        await xknx.telegram_queue.process_telegram_incoming(
+            self._response('1/3/3', DPTArray(0x80)))
+        await sync_task
+
+        self.assertEqual(state_sync.succeeded, 2)
+        self.assertEqual(state_sync.failed, [])
+        self.assertTrue(switch.state)
+        self.assertTrue(light.state)
+        self.assertEqual(light.current_brightness, 0x80)
+        self.assertEqual(xknx.telegram_queue.telegram_received_cbs, [])
+
+    async def test_max_in_flight(self):
+        """Test limiting number of unanswered reads."""
+        xknx = XKNX()
+        switches = [
+            Switch(xknx, 'TestSwitch{}'.format(i), group_address='1/2/{}'.format(i),
+                   group_address_state='1/3/{}'.format(i))
+            for i in range(5)]
+        progress = []
+
+        async def progress_cb(state_sync):
+            """Record progress."""
+            progress.append(state_sync.completed)
+
+        state_sync = StateSync(xknx, max_in_flight=2, progress_cb=progress_cb)
+        sync_task = asyncio.ensure_future(state_sync.sync(switches))
+        await self._idle()
+        self.assertEqual(xknx.telegrams.qsize(), 2)
+
+        for i in range(5):
+            await xknx.telegram_queue.process_telegram_incoming(
+                self._response('1/3/{}'.format(i), DPTBinary(1)))
+            await self._idle()
+        await sync_task
+
+        self.assertEqual(xknx.telegrams.qsize(), 5)
+        self.assertEqual(state_sync.succeeded, 5)
+        self.assertEqual(progress, [1, 2, 3, 4, 5])
+        self.assertTrue(all(switch.state for switch in switches))
+
+    async def test_failed(self):
+        """Test aggregating group addresses not responding in time."""
+        xknx = XKNX()
+        switches = [
+            Switch(xknx, 'TestSwitch{}'.format(i), group_address='1/2/{}'.format(i),
+                   group_address_state='1/3/{}'.format(i))
+            for i in range(3)]
+        state_sync = StateSync(xknx, timeout_in_seconds=0.01)
+        sync_task = asyncio.ensure_future(state_sync.sync(switches))
+        await self._idle()
+        self._send_all(xknx)
+        await xknx.telegram_queue.process_telegram_incoming(
+            self._response('1/3/1', DPTBinary(1)))
+        await sync_task
+
+        self.assertEqual(state_sync.succeeded, 1)
+        self.assertEqual(set(state_sync.failed),
+                         {GroupAddress('1/3/0'), GroupAddress('1/3/2')})
+        self.assertEqual(state_sync.completed, 3)
+
+    async def test_timeout_after_sent(self):
+        """Test timeout starting when a read was sent, not while it waits within the outgoing queue."""
+        xknx = XKNX(state_sync_timeout=0.01)
+        # GroupValueReads are sent by this test instead of a running TelegramQueue
+        xknx.telegram_queue.running = True
+        switch = Switch(xknx, 'TestSwitch', group_address='1/2/3', group_address_state='1/2/4')
+        state_sync = StateSync(xknx)
+        self.assertEqual(state_sync.timeout_in_seconds, 0.01)
+        sync_task = asyncio.ensure_future(state_sync.sync([switch]))
+        await asyncio.sleep(0.05)
+        self.assertFalse(sync_task.done())
+
+        self._send_all(xknx)
+        await sync_task
+        self.assertEqual(state_sync.failed, [GroupAddress('1/2/4')])
+
+    async def test_devices_sync(self):
+        """Test syncing all devices of xknx.devices concurrently."""
+        xknx = XKNX()
+        xknx.devices.add(
+            Switch(xknx, 'TestSwitch', group_address='1/2/3', group_address_state='1/2/4'))
+        sync_task = asyncio.ensure_future(xknx.devices.sync(max_in_flight=5))
+        await self._idle()
+        await xknx.telegram_queue.process_telegram_incoming(
+            self._response('1/2/4', DPTBinary(1)))
+        state_sync = await sync_task
+        self.assertEqual(state_sync.succeeded, 1)
+        self.assertEqual(state_sync.max_in_flight, 5)
+        self.assertTrue(xknx.devices['TestSwitch'].state)
+
+    async def test_defaults(self):
+        """Test StateSync using the settings of xknx."""
+        xknx = XKNX(state_sync_max_in_flight=3, state_sync_timeout=5)
+        state_sync = StateSync(xknx)
+        self.assertEqual(state_sync.max_in_flight, 3)
+        self.assertEqual(state_sync.timeout_in_seconds, 5)
+        state_sync = StateSync(xknx, max_in_flight=2, timeout_in_seconds=0.5)
+        self.assertEqual(state_sync.max_in_flight, 2)
+        self.assertEqual(state_sync.timeout_in_seconds, 0.5)
@@ -8,7 +8,10 @@ pytestmark = pytest.mark.asyncio
 
 from xknx import XKNX
 from xknx.core import StateUpdater
-from xknx.devices import Light
+from xknx.devices import Light, Sensor, Switch
+from xknx.dpt import DPTBinary
+from xknx.telegram import (
+    GroupAddress, Telegram, TelegramDirection, TelegramType)
 
 
 class TestStateupdater(unittest.TestCase):
@@ -31,6 +34,155 @@ class TestStateupdater(unittest.TestCase):
             fut.set_result(None)
             mock_sync.return_value = fut
 
-            await state_updater.start())
-            await state_updater.run_task)
+            await state_updater.start()
+            await state_updater.run_task
             mock_sync.assert_called_with()
+
+    @staticmethod
+    def _response(group_address, payload):
+        """Return incoming GroupValueResponse telegram."""
+        return Telegram(GroupAddress(group_address),
+                        telegramtype=TelegramType.GROUP_RESPONSE,
+                        direction=TelegramDirection.INCOMING,
+                        payload=payload)
+
+    @staticmethod
+    def _read_addresses(xknx):
+        """Return group addresses of GroupValueRead telegrams within queue."""
+        read_addresses = set()
+        while not xknx.telegrams.empty():
+            telegram = xknx.telegrams.get_nowait()
+            if telegram.telegramtype == TelegramType.GROUP_READ:
+                read_addresses.add(telegram.group_address)
+        return read_addresses
+
+    async def test_max_age(self):
+        """Test resolving maximum age of state values."""
+        xknx = XKNX()
+        state_updater = StateUpdater(xknx, timeout=100, max_age_by_value_type={'temperature': 10})
+        sensor = Sensor(xknx, 'TestSensor', group_address_state='1/2/3', value_type='temperature')
+        switch = Switch(xknx, 'TestSwitch', group_address='1/2/4', group_address_state='1/2/5')
+        self.assertEqual(state_updater.max_age(sensor, sensor.sensor_value), 10)
+        self.assertEqual(state_updater.max_age(switch, switch.switch), 100)
+        switch.state_max_age = 5
+        self.assertEqual(state_updater.max_age(switch, switch.switch), 5)
+
+        xknx.devices.add(sensor)
+        xknx.devices.add(switch)
+        # shared state address uses the smaller maximum age
+        xknx.devices.add(Switch(xknx, 'TestSwitch2', group_address='1/2/6', group_address_state='1/2/3'))
+        targets, unaddressed_devices = state_updater.state_targets()
+        self.assertEqual(targets[GroupAddress('1/2/3')][0], 10)
+        self.assertEqual(len(targets[GroupAddress('1/2/3')][1]), 2)
+        self.assertEqual(targets[GroupAddress('1/2/5')][0], 5)
+        self.assertEqual(unaddressed_devices, [])
+
+    async def test_update_spread(self):
+        """Test reading unknown values at once and spreading later reads over the maximum age."""
+        xknx = XKNX()
+        switches = [
+            Switch(xknx, 'TestSwitch{}'.format(i), group_address='1/2/{}'.format(i),
+                   group_address_state='1/3/{}'.format(i))
+            for i in range(4)]
+        for switch in switches:
+            xknx.devices.add(switch)
+        state_updater = StateUpdater(xknx, timeout=100)
+        xknx.state_updater = state_updater
+
+        with patch.object(xknx.loop, 'time') as mock_time:
+            mock_time.return_value = 1000
+            update_task = asyncio.ensure_future(state_updater.update())
+            for _ in range(5):
+                await asyncio.sleep(0)
+            self.assertEqual(len(self._read_addresses(xknx)), 4)
+            for i in range(4):
+                await xknx.telegram_queue.process_telegram_incoming(
+                    self._response('1/3/{}'.format(i), DPTBinary(1)))
+            next_due = await update_task
+        self.assertTrue(all(switch.state for switch in switches))
+        self.assertEqual(next_due, 1025)
+        self.assertEqual(sorted(state_updater._due.values()), [1025, 1050, 1075, 1100])
+
+    async def test_update_passive(self):
+        """Test not reading values updated passively on the bus."""
+        xknx = XKNX()
+        xknx.devices.add(Switch(xknx, 'TestSwitch', group_address='1/2/3', group_address_state='1/2/4'))
+        state_updater = StateUpdater(xknx, timeout=100)
+        xknx.state_updater = state_updater
+
+        with patch.object(xknx.loop, 'time') as mock_time:
+            mock_time.return_value = 1000
+            await xknx.telegram_queue.process_telegram_incoming(
+                self._response('1/2/4', DPTBinary(1)))
+            self.assertEqual(await state_updater.update(), 1100)
+            self.assertEqual(xknx.telegrams.qsize(), 0)
+
+            mock_time.return_value = 1090
+            await xknx.telegram_queue.process_telegram_incoming(
+                self._response('1/2/4', DPTBinary(0)))
+            mock_time.return_value = 1100
+            # not read, due time moved to last update + maximum age
+            self.assertEqual(await state_updater.update(), 1190)
+            self.assertEqual(xknx.telegrams.qsize(), 0)
+
+            mock_time.return_value = 1190
+            update_task = asyncio.ensure_future(state_updater.update())
+            for _ in range(5):
+                await asyncio.sleep(0)
+            self.assertEqual(self._read_addresses(xknx), {GroupAddress('1/2/4')})
+            await xknx.telegram_queue.process_telegram_incoming(
+                self._response('1/2/4', DPTBinary(1)))
+            self.assertEqual(await update_task, 1290)
+
+    async def test_update_retry(self):
+        """Test retrying failed reads with backoff instead of waiting for the maximum age."""
+        xknx = XKNX()
+        xknx.devices.add(Switch(xknx, 'TestSwitch', group_address='1/2/3', group_address_state='1/2/4'))
+        state_updater = StateUpdater(xknx, timeout=100, retry_delay=10)
+        xknx.state_updater = state_updater
+
+        async def no_response(group_address, timeout_in_seconds):
+            """Simulate read not answered in time."""
+            # pylint: disable=unused-argument
+            return None
+        xknx.response_registry.read = no_response
+
+        with patch.object(xknx.loop, 'time') as mock_time:
+            mock_time.return_value = 1000
+            self.assertEqual(await state_updater.update(), 1010)
+            mock_time.return_value = 1010
+            self.assertEqual(await state_updater.update(), 1030)
+            mock_time.return_value = 1030
+            self.assertEqual(await state_updater.update(), 1070)
+            mock_time.return_value = 1070
+            self.assertEqual(await state_updater.update(), 1150)
+            # backoff is limited by the maximum age
+            mock_time.return_value = 1150
+            self.assertEqual(await state_updater.update(), 1250)
+
+            # successful read resets the backoff
+            del xknx.response_registry.read
+            mock_time.return_value = 1250
+            update_task = asyncio.ensure_future(state_updater.update())
+            for _ in range(5):
+                await asyncio.sleep(0)
+            await xknx.telegram_queue.process_telegram_incoming(
+                self._response('1/2/4', DPTBinary(1)))
+            self.assertEqual(await update_task, 1350)
+            self.assertEqual(state_updater._failures, {})
+
+    async def test_cached_state_targets(self):
+        """Test building state targets again only if devices were added or removed."""
+        xknx = XKNX()
+        switch = Switch(xknx, 'TestSwitch', group_address='1/2/3', group_address_state='1/2/4')
+        xknx.devices.add(switch)
+        state_updater = StateUpdater(xknx)
+        targets = state_updater.cached_state_targets()
+        self.assertIs(state_updater.cached_state_targets(), targets)
+        self.assertEqual(set(targets[0]), {GroupAddress('1/2/4')})
+
+        xknx.devices.add(Switch(xknx, 'TestSwitch2', group_address='1/2/5', group_address_state='1/2/6'))
+        targets = state_updater.cached_state_targets()
+        self.assertEqual(set(targets[0]), {GroupAddress('1/2/4'), GroupAddress('1/2/6')})
+        xknx.devices.remove(switch)
+        self.assertEqual(set(state_updater.cached_state_targets()[0]), {GroupAddress('1/2/6')})
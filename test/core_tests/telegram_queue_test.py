@@ -7,10 +7,13 @@ import pytest
 pytestmark = pytest.mark.asyncio
 
 from xknx import XKNX
+from xknx.devices import Switch
 from xknx.dpt import DPTBinary
 from xknx.exceptions import CouldNotParseTelegram
+from xknx.io import KNXIPInterface
 from xknx.telegram import (
-    AddressFilter, GroupAddress, Telegram, TelegramDirection)
+    AddressFilter, GroupAddress, Telegram, TelegramDirection, TelegramPriority,
+    TelegramType)
 
 
 class TestTelegramQueue(unittest.TestCase):
@@ -46,13 +49,15 @@ class TestTelegramQueue(unittest.TestCase):
         await xknx.telegram_queue.stop()
         self.assertTrue(xknx.telegram_queue.queue_stopped.is_set())
 
+    @patch('xknx.core.rate_limiter.time.monotonic')
     @patch('asyncio.sleep')
-    async def test_rate_limit(self, async_sleep_mock):
+    async def test_rate_limit(self, async_sleep_mock, monotonic_mock):
         """Test rate limit."""
         # pylint: disable=no-self-use
         async def async_none():
             return None
         async_sleep_mock.return_value = asyncio.ensure_future(async_none())
+        monotonic_mock.return_value = 100.0
 
         xknx = XKNX()
         xknx.rate_limit = 20  # 50 ms per outgoing telegram
@@ -75,15 +80,121 @@ class TestTelegramQueue(unittest.TestCase):
         xknx.telegrams.put_nowait(telegram_in)
         await xknx.telegrams.join()
         self.assertEqual(async_sleep_mock.call_count, 0)
-        # sleep for outgoing telegrams
+        # sleep for outgoing telegrams exceeding the burst of one telegram
+        xknx.telegrams.put_nowait(telegram_out)
         xknx.telegrams.put_nowait(telegram_out)
         xknx.telegrams.put_nowait(telegram_out)
         await xknx.telegrams.join()
         self.assertEqual(async_sleep_mock.call_count, 2)
-        async_sleep_mock.assert_called_with(sleep_time)
+        async_sleep_mock.assert_called_with(sleep_time * 2)
 
         await xknx.telegram_queue.stop()
 
+    async def test_run_batch(self):
+        """Test telegrams already queued are processed as one batch."""
+        xknx = XKNX()
+        knxip_interface = KNXIPInterface(xknx)
+        telegram_in = Telegram(
+            direction=TelegramDirection.INCOMING,
+            payload=DPTBinary(1),
+            group_address=GroupAddress("1/2/3"))
+        for _ in range(3):
+            knxip_interface.telegram_received(telegram_in)
+        self.assertEqual(xknx.telegrams.qsize(), 3)
+        xknx.telegrams.put_nowait(None)
+
+        with patch('xknx.core.TelegramQueue.process_telegram') as process_telegram_mock:
+            fut = asyncio.Future()
+            fut.set_result(None)
+            process_telegram_mock.return_value = fut
+            with patch('xknx.core.TelegramQueue.process_telegrams',
+                       wraps=xknx.telegram_queue.process_telegrams) as process_telegrams_mock:
+                await xknx.telegram_queue.run()
+                process_telegrams_mock.assert_called_once_with([telegram_in] * 3)
+            self.assertEqual(process_telegram_mock.call_count, 3)
+        self.assertTrue(xknx.telegram_queue.queue_stopped.is_set())
+        await xknx.telegrams.join()
+
+    async def test_outgoing_priority(self):
+        """Test interactive and high priority telegrams are sent before background telegrams."""
+        xknx = XKNX(rate_limit=0)
+        telegram_read = Telegram(GroupAddress("1/2/3"), TelegramType.GROUP_READ, background=True)
+        telegram_read2 = Telegram(GroupAddress("1/2/4"), TelegramType.GROUP_READ, background=True)
+        telegram_write = Telegram(GroupAddress("1/2/5"), payload=DPTBinary(1))
+        telegram_urgent = Telegram(GroupAddress("1/2/6"), payload=DPTBinary(1),
+                                   priority=TelegramPriority.URGENT, background=True)
+        for telegram in (telegram_read, telegram_read2, telegram_write, telegram_urgent, None):
+            xknx.telegrams.put_nowait(telegram)
+
+        sent = []
+
+        async def process_telegram(telegram):
+            """Record sent telegram."""
+            sent.append(telegram.group_address)
+
+        with patch.object(xknx.telegram_queue, 'process_telegram', side_effect=process_telegram):
+            await xknx.telegram_queue.run()
+        self.assertEqual(sent, [GroupAddress("1/2/6"), GroupAddress("1/2/5"),
+                                GroupAddress("1/2/3"), GroupAddress("1/2/4")])
+
+    async def test_coalesce_writes(self):
+        """Test pending coalescable writes are replaced by newer writes to the same group address."""
+        xknx = XKNX(rate_limit=0)
+        telegrams = (
+            Telegram(GroupAddress("1/2/3"), payload=DPTBinary(0), coalesce=True),
+            Telegram(GroupAddress("1/2/4"), payload=DPTBinary(0), coalesce=True),
+            Telegram(GroupAddress("1/2/3"), payload=DPTBinary(1), coalesce=True),
+            Telegram(GroupAddress("1/2/4"), payload=DPTBinary(1)),
+            Telegram(GroupAddress("1/2/4"), TelegramType.GROUP_RESPONSE,
+                     payload=DPTBinary(0), coalesce=True),
+        )
+        for telegram in telegrams + (None,):
+            xknx.telegrams.put_nowait(telegram)
+
+        sent = []
+
+        async def process_telegram(telegram):
+            """Record sent telegram."""
+            sent.append(telegram)
+
+        with patch.object(xknx.telegram_queue, 'process_telegram', side_effect=process_telegram):
+            await xknx.telegram_queue.run()
+        self.assertEqual(sent, [telegrams[2], telegrams[1], telegrams[3], telegrams[4]])
+        self.assertEqual(xknx.telegram_queue.coalesced_writes[GroupAddress("1/2/3")], 1)
+        self.assertEqual(sum(xknx.telegram_queue.coalesced_writes.values()), 1)
+        await asyncio.wait_for(xknx.telegrams.join(), 1)
+
+    async def test_coalesce_writes_priority(self):
+        """Test coalesced writes being sent with the higher priority of the replaced and the newer write."""
+        # pylint: disable=protected-access
+        xknx = XKNX(rate_limit=0)
+        telegrams = (
+            Telegram(GroupAddress("1/2/3"), payload=DPTBinary(0), coalesce=True, background=True),
+            Telegram(GroupAddress("1/2/4"), payload=DPTBinary(0)),
+            Telegram(GroupAddress("1/2/5"), payload=DPTBinary(0), coalesce=True),
+            Telegram(GroupAddress("1/2/3"), payload=DPTBinary(1), coalesce=True),
+            Telegram(GroupAddress("1/2/5"), payload=DPTBinary(1), coalesce=True, background=True),
+        )
+        for telegram in telegrams:
+            xknx.telegrams.put_nowait(telegram)
+        await xknx.telegram_queue.process_telegrams(
+            [xknx.telegrams.get_nowait() for _ in telegrams])
+        # replaced background write is moved to the interactive lane, keeping its place within the queue
+        self.assertEqual(xknx.telegram_queue.outgoing_queue_depth, 3)
+        xknx.telegram_queue._put_outgoing(None)
+
+        sent = []
+
+        async def process_telegram(telegram):
+            """Record sent telegram."""
+            sent.append(telegram)
+
+        with patch.object(xknx.telegram_queue, 'process_telegram', side_effect=process_telegram):
+            await xknx.telegram_queue.run_outgoing()
+        self.assertEqual(sent, [telegrams[3], telegrams[1], telegrams[4]])
+        self.assertEqual(xknx.telegram_queue.outgoing_queue_depth, 0)
+        await asyncio.wait_for(xknx.telegrams.join(), 1)
+
     #
     # TEST REGISTER
     #
@@ -324,3 +435,138 @@ class TestTelegramQueue(unittest.TestCase):
             group_address=GroupAddress("1/2/3"))
         await xknx.telegram_queue.process_telegram(telegram)
         telegram_received_callback.assert_not_called()
+
+    #
+    # TEST SUBSCRIPTIONS
+    #
+    def test_is_subscribed(self):
+        """Test if group addresses are consumed by callbacks or devices."""
+        xknx = XKNX()
+        xknx.devices.add(Switch(xknx, "TestOutlet", group_address="1/2/3"))
+        self.assertTrue(xknx.telegram_queue.is_subscribed(GroupAddress("1/2/3")))
+        self.assertFalse(xknx.telegram_queue.is_subscribed(GroupAddress("2/4/5")))
+
+        callback = xknx.telegram_queue.register_telegram_received_cb(
+            Mock(), [AddressFilter("2/4-8/*")])
+        self.assertTrue(xknx.telegram_queue.is_subscribed(GroupAddress("2/4/5")))
+        self.assertFalse(xknx.telegram_queue.is_subscribed(GroupAddress("3/4/5")))
+        xknx.telegram_queue.unregister_telegram_received_cb(callback)
+
+        xknx.telegram_queue.register_telegram_received_cb(Mock())
+        self.assertTrue(xknx.telegram_queue.is_subscribed(GroupAddress("3/4/5")))
+
+    #
+    # TEST CALLBACKS
+    #
+    async def test_slow_callback(self):
+        """Test warning about callbacks taking longer than slow_callback_threshold."""
+        xknx = XKNX(slow_callback_threshold=0.01)
+
+        async def slow_callback(telegram):
+            """Take longer than threshold."""
+            await asyncio.sleep(0.02)
+
+        xknx.telegram_queue.register_telegram_received_cb(slow_callback)
+        telegram = Telegram(direction=TelegramDirection.INCOMING, payload=DPTBinary(1),
+                            group_address=GroupAddress("1/2/3"))
+        with patch('logging.Logger.warning') as mock_warning:
+            await xknx.telegram_queue.process_telegram(telegram)
+            mock_warning.assert_called_once()
+            self.assertEqual(mock_warning.call_args[0][1],
+                             'TestTelegramQueue.test_slow_callback.<locals>.slow_callback')
+
+            xknx.telegram_queue.slow_callback_threshold = None
+            await xknx.telegram_queue.process_telegram(telegram)
+            mock_warning.assert_called_once()
+
+    async def test_callback_workers(self):
+        """Test running telegram_received_cbs and device_updated_cbs by workers without delaying telegrams."""
+        release = asyncio.Event()
+        calls = []
+
+        async def telegram_received_cb(telegram):
+            """Block until released."""
+            await release.wait()
+            calls.append(telegram.group_address)
+
+        async def device_updated_cb(device):
+            """Block until released."""
+            await release.wait()
+            calls.append(device.name)
+
+        xknx = XKNX(callback_workers=2, slow_callback_threshold=None,
+                    device_updated_cb=device_updated_cb)
+        xknx.devices.add(Switch(xknx, "TestOutlet", group_address="1/2/3"))
+        xknx.telegram_queue.register_telegram_received_cb(telegram_received_cb)
+        await xknx.telegram_queue.start()
+        xknx.telegrams.put_nowait(Telegram(direction=TelegramDirection.INCOMING, payload=DPTBinary(1),
+                                           group_address=GroupAddress("1/2/3")))
+        # telegram is processed while callbacks are still waiting
+        await xknx.telegrams.join()
+        self.assertTrue(xknx.devices["TestOutlet"].state)
+        self.assertEqual(calls, [])
+
+        release.set()
+        await xknx.telegram_queue.stop()
+        self.assertCountEqual(calls, [GroupAddress("1/2/3"), "TestOutlet"])
+
+    async def test_callback_workers_order(self):
+        """Test running callbacks of the same group address in order although an earlier one is slower."""
+        calls = []
+
+        async def telegram_received_cb(telegram):
+            """Take longer for the first telegram."""
+            await asyncio.sleep(0.02 if telegram.payload == DPTBinary(1) else 0)
+            calls.append(telegram.payload)
+
+        xknx = XKNX(callback_workers=4, slow_callback_threshold=None)
+        xknx.telegram_queue.register_telegram_received_cb(telegram_received_cb)
+        await xknx.telegram_queue.start()
+        for payload in (DPTBinary(1), DPTBinary(0)):
+            xknx.telegrams.put_nowait(Telegram(direction=TelegramDirection.INCOMING, payload=payload,
+                                               group_address=GroupAddress("1/2/3")))
+        await xknx.telegram_queue.stop()
+        self.assertEqual(calls, [DPTBinary(1), DPTBinary(0)])
+
+    async def test_callback_workers_device_order(self):
+        """Test running device_updated_cbs registered at Devices in order of the updates of a device."""
+        calls = []
+
+        async def device_updated_cb(device):
+            """Take longer for the first update."""
+            first = not calls
+            calls.append(None)
+            await asyncio.sleep(0.02 if first else 0)
+            calls[calls.index(None)] = 'first' if first else 'second'
+
+        xknx = XKNX(callback_workers=4, slow_callback_threshold=None,
+                    device_updated_cb=device_updated_cb)
+        xknx.devices.add(Switch(xknx, "TestOutlet", group_address="1/2/3"))
+        await xknx.telegram_queue.start()
+        for payload in (DPTBinary(1), DPTBinary(0)):
+            xknx.telegrams.put_nowait(Telegram(direction=TelegramDirection.INCOMING, payload=payload,
+                                               group_address=GroupAddress("1/2/3")))
+        await xknx.telegram_queue.stop()
+        self.assertEqual(calls, ['first', 'second'])
+
+    async def test_callback_workers_full(self):
+        """Test dropping callbacks if the queue of a callback worker is full."""
+        release = asyncio.Event()
+
+        async def callback(telegram):
+            """Block until released."""
+            await release.wait()
+
+        xknx = XKNX(callback_workers=1, slow_callback_threshold=None)
+        xknx.telegram_queue.max_queued_callbacks = 1
+        await xknx.telegram_queue.start()
+        await asyncio.sleep(0)
+        telegram = Telegram(direction=TelegramDirection.INCOMING, payload=DPTBinary(1),
+                            group_address=GroupAddress("1/2/3"))
+        with patch('logging.Logger.warning') as mock_warning:
+            for _ in range(3):
+                await xknx.telegram_queue.run_callback(callback, telegram, key=telegram.group_address)
+            self.assertEqual(xknx.telegram_queue.dropped_callbacks, 2)
+            mock_warning.assert_called_once()
+        release.set()
+        await xknx.telegram_queue.stop()
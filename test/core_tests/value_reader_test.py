@@ -16,8 +16,8 @@ from xknx.telegram import (
 class TestValueReader(unittest.TestCase):
     """Test class for value reader."""
 
-    @patch('xknx.core.ValueReader.timeout')
-    async def test_value_reader_read_success(self, timeout_mock):
+    @patch('logging.Logger.warning')
+    async def test_value_reader_read_success(self, logger_warning_mock):
         """Test value reader: successfull read."""
         xknx = XKNX()
         test_group_address = GroupAddress("0/0/0")
@@ -29,22 +29,19 @@ class TestValueReader(unittest.TestCase):
         value_reader = ValueReader(xknx, test_group_address)
         # Create a task for read() (3.5 compatible)
         read_task = asyncio.ensure_future(value_reader.read())
+        await asyncio.sleep(0)
         # receive the response
-        await value_reader.telegram_received(response_telegram)
+        self.assertTrue(xknx.response_registry.telegram_received(response_telegram))
         # and yield the result
-        successfull_read = await asyncio.gather(read_task)[0]
+        successfull_read = (await asyncio.gather(read_task))[0]
 
         # GroupValueRead telegram is still in the queue because we are not actually processing it
         self.assertEqual(xknx.telegrams.qsize(), 1)
         # Callback was removed again
         self.assertEqual(xknx.telegram_queue.telegram_received_cbs,
                          [])
-        # Timeout handle was cancelled (cancelled method requires Python 3.7)
-        event_has_cancelled = getattr(value_reader.timeout_handle, "cancelled", None)
-        if callable(event_has_cancelled):
-            self.assertTrue(value_reader.timeout_handle.cancelled())
-        # timeout() was never called because there was no timeout
-        timeout_mock.assert_not_called()
+        # No warning was logged because there was no timeout
+        logger_warning_mock.assert_not_called()
         # Telegram was received
         self.assertEqual(value_reader.received_telegram,
                          response_telegram)
@@ -56,22 +53,25 @@ class TestValueReader(unittest.TestCase):
     async def test_value_reader_read_timeout(self, logger_warning_mock):
         """Test value reader: read timeout."""
         xknx = XKNX()
+        # GroupValueReads are sent by this test instead of a running TelegramQueue
+        xknx.telegram_queue.running = True
         value_reader = ValueReader(xknx, GroupAddress('0/0/0'), timeout_in_seconds=0)
 
-        timed_out_read = await value_reader.read()
-
+        read_task = asyncio.ensure_future(value_reader.read())
+        await asyncio.sleep(0)
         # GroupValueRead telegram is still in the queue because we are not actually processing it
         self.assertEqual(xknx.telegrams.qsize(), 1)
+        # the timeout starts when the GroupValueRead was sent
+        self.assertFalse(read_task.done())
+        xknx.response_registry.telegram_sent(xknx.telegrams.get_nowait())
+        timed_out_read = await read_task
         # Warning was logged
         logger_warning_mock.assert_called_once_with(
             "Error: KNX bus did not respond in time to GroupValueRead request for: %s", GroupAddress('0/0/0'))
         # Callback was removed again
         self.assertEqual(xknx.telegram_queue.telegram_received_cbs,
                          [])
-        # Timeout handle was cancelled (cancelled method requires Python 3.7)
-        event_has_cancelled = getattr(value_reader.timeout_handle, "cancelled", None)
-        if callable(event_has_cancelled):
-            self.assertTrue(value_reader.timeout_handle.cancelled())
+        self.assertFalse(xknx.response_registry.is_pending(GroupAddress('0/0/0')))
         # No telegram was received
         self.assertIsNone(value_reader.received_telegram)
         # Unsuccessfull read() returns None
@@ -90,17 +90,13 @@ class TestValueReader(unittest.TestCase):
                                   telegramtype=TelegramType.GROUP_READ))
 
     async def test_value_reader_telegram_received(self):
-        """Test value reader: telegram_received."""
+        """Test value reader: only responses and writes of its group address are received via ResponseRegistry."""
         xknx = XKNX()
         test_group_address = GroupAddress("0/0/0")
-        expected_telegram_1 = Telegram(group_address=test_group_address,
-                                       telegramtype=TelegramType.GROUP_RESPONSE,
-                                       direction=TelegramDirection.INCOMING,
-                                       payload=DPTBinary(1))
-        expected_telegram_2 = Telegram(group_address=test_group_address,
-                                       telegramtype=TelegramType.GROUP_WRITE,
-                                       direction=TelegramDirection.INCOMING,
-                                       payload=DPTBinary(1))
+        expected_telegram = Telegram(group_address=test_group_address,
+                                     telegramtype=TelegramType.GROUP_WRITE,
+                                     direction=TelegramDirection.INCOMING,
+                                     payload=DPTBinary(1))
         telegram_wrong_address = Telegram(group_address=GroupAddress("0/0/1"),
                                           telegramtype=TelegramType.GROUP_RESPONSE,
                                           direction=TelegramDirection.INCOMING,
@@ -111,16 +107,15 @@ class TestValueReader(unittest.TestCase):
                                        payload=DPTBinary(1))
 
         value_reader = ValueReader(xknx, test_group_address)
+        read_task = asyncio.ensure_future(value_reader.read())
+        await asyncio.sleep(0)
 
-        def async_telegram_received(test_telegram):
-            return await value_reader.telegram_received(test_telegram)
-
-        self.assertFalse(async_telegram_received(telegram_wrong_address))
-        self.assertFalse(async_telegram_received(telegram_wrong_type))
+        self.assertFalse(xknx.response_registry.telegram_received(telegram_wrong_address))
+        self.assertFalse(xknx.response_registry.telegram_received(telegram_wrong_type))
+        await asyncio.sleep(0)
+        self.assertFalse(read_task.done())
         self.assertIsNone(value_reader.received_telegram)
 
-        self.assertTrue(async_telegram_received(expected_telegram_1))
-        self.assertEqual(value_reader.received_telegram, expected_telegram_1)
-
-        self.assertTrue(async_telegram_received(expected_telegram_2))
-        self.assertEqual(value_reader.received_telegram, expected_telegram_2)
+        self.assertTrue(xknx.response_registry.telegram_received(expected_telegram))
+        self.assertEqual(await read_task, expected_telegram)
+        self.assertEqual(value_reader.received_telegram, expected_telegram)
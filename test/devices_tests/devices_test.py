@@ -96,6 +96,92 @@ class TestDevices(unittest.TestCase):
             tuple(devices.devices_by_group_address(GroupAddress('3/0/1'))),
             (sensor1, sensor2))
 
+    def test_device_by_group_address_unindexed(self):
+        """Test get devices by group address for devices not announcing their group addresses."""
+        xknx = XKNX()
+        devices = Devices()
+
+        class CustomDevice(Device):
+            """Device only implementing has_group_address."""
+
+            def has_group_address(self, group_address):
+                """Test if device has given group address."""
+                return group_address == GroupAddress('1/6/7')
+
+        light1 = Light(xknx,
+                       'Living-Room.Light_1',
+                       group_address_switch='1/6/7')
+        devices.add(light1)
+        custom = CustomDevice(xknx, 'Custom')
+        devices.add(custom)
+        light2 = Light(xknx,
+                       'Living-Room.Light_2',
+                       group_address_switch_state='1/6/7')
+        devices.add(light2)
+
+        self.assertEqual(
+            tuple(devices.devices_by_group_address(GroupAddress('1/6/7'))),
+            (light1, custom, light2))
+        self.assertEqual(
+            tuple(devices.devices_by_group_address(GroupAddress('1/6/8'))),
+            ())
+
+    def test_reindex(self):
+        """Test updating the group address index after group addresses of a device were changed."""
+        xknx = XKNX()
+        devices = Devices()
+
+        switch1 = Switch(xknx,
+                         "TestOutlet_1",
+                         group_address='1/6/7')
+        devices.add(switch1)
+        switch2 = Switch(xknx,
+                         "TestOutlet_2",
+                         group_address='1/6/8')
+        devices.add(switch2)
+        generation = devices.generation
+
+        switch1.switch.group_address = GroupAddress('1/6/8')
+        devices.reindex(switch1)
+        self.assertEqual(devices.generation, generation + 1)
+        self.assertEqual(
+            tuple(devices.devices_by_group_address(GroupAddress('1/6/7'))),
+            ())
+        self.assertFalse(devices.has_group_address(GroupAddress('1/6/7')))
+        # order in which the devices were added is kept
+        self.assertEqual(
+            tuple(devices.devices_by_group_address(GroupAddress('1/6/8'))),
+            (switch1, switch2))
+
+        with self.assertRaises(ValueError):
+            devices.reindex(Switch(xknx, "TestOutlet_3", group_address='1/6/9'))
+
+    def test_remove(self):
+        """Test removing devices from devices vector."""
+        xknx = XKNX()
+        devices = Devices()
+
+        light1 = Light(xknx,
+                       'Living-Room.Light_1',
+                       group_address_switch='1/6/7')
+        devices.add(light1)
+        switch1 = Switch(xknx,
+                         "TestOutlet_1",
+                         group_address='1/6/7')
+        devices.add(switch1)
+
+        devices.remove(light1)
+        self.assertEqual(len(devices), 1)
+        self.assertFalse('Living-Room.Light_1' in devices)
+        self.assertEqual(devices["TestOutlet_1"], switch1)
+        self.assertEqual(
+            tuple(devices.devices_by_group_address(GroupAddress('1/6/7'))),
+            (switch1,))
+        self.assertEqual(light1.device_updated_cbs, [])
+
+        with self.assertRaises(ValueError):
+            devices.remove(light1)
+
     def test_iter(self):
         """Test __iter__() function."""
         xknx = XKNX()
@@ -257,6 +257,25 @@ class TestLight(unittest.TestCase):
         self.assertEqual(telegram,
                          Telegram(GroupAddress('1/2/5'), payload=DPTArray(23)))
 
+    async def test_set_brightness_coalesce_writes(self):
+        """Test writes of a Light with coalesce_writes may be replaced by newer writes."""
+        xknx = XKNX()
+        light = Light(xknx,
+                      name="TestLight",
+                      group_address_switch='1/2/3',
+                      group_address_brightness='1/2/5')
+        self.assertFalse(light.coalesce_writes)
+        light.coalesce_writes = True
+        self.assertTrue(light.brightness.coalesce_writes)
+        self.assertTrue(light.switch.coalesce_writes)
+        await light.set_brightness(23)
+        telegram = xknx.telegrams.get_nowait()
+        self.assertTrue(telegram.coalesce)
+        light.coalesce_writes = False
+        await light.set_brightness(24)
+        telegram = xknx.telegrams.get_nowait()
+        self.assertFalse(telegram.coalesce)
+
     async def test_set_brightness_not_dimmable(self):
         """Test setting the brightness of a non dimmable Light."""
         # pylint: disable=invalid-name
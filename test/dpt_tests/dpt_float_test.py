@@ -108,6 +108,28 @@ class TestDPTFloat(unittest.TestCase):
         with self.assertRaises(ConversionError):
             DPT2ByteFloat().from_knx((0xF8, "0x23"))
 
+    def test_from_knx_decode_table(self):
+        """Test parsing of DPT2ByteFloat by lookup table for all raw values."""
+        for data in range(65536):
+            exponent = (data >> 11) & 0x0f
+            significand = (data & 0x7ff) - (2048 if data >> 15 else 0)
+            self.assertEqual(DPT2ByteFloat.decode_table()[data], float(significand << exponent) / 100)
+            self.assertEqual(DPT2ByteFloat.from_knx((data >> 8, data & 0xff)), float(significand << exponent) / 100)
+
+    def test_to_knx_exponent(self):
+        """Test choosing the smallest exponent for the significand."""
+        self.assertEqual(DPT2ByteFloat.to_knx(20.47), (0x07, 0xFF))
+        self.assertEqual(DPT2ByteFloat.to_knx(20.49), (0x0C, 0x00))
+        self.assertEqual(DPT2ByteFloat.to_knx(81.88), (0x17, 0xFF))
+        self.assertEqual(DPT2ByteFloat.to_knx(-1), (0x87, 0x9C))
+        self.assertEqual(DPT2ByteFloat.to_knx(670760.96), (0x7F, 0xFF))
+
+    def test_from_knx_subclass_boundaries(self):
+        """Test parsing of values of the shared lookup table outside the boundaries of a subclass."""
+        with self.assertRaises(ConversionError):
+            DPTTemperature.from_knx((0xB1, 0xE6))
+        self.assertEqual(DPT2ByteFloat.from_knx((0xB1, 0xE6)), -999.68)
+
     #
     # DPTTemperature
     #
@@ -0,0 +1,75 @@
+"""Unit test for parsing and serializing many KNX values at once with NumPy."""
+import unittest
+
+import pytest
+
+from xknx.dpt import (
+    DPT2ByteFloat, DPT2ByteSigned, DPT2ByteUnsigned, DPT4ByteFloat,
+    DPT4ByteSigned, DPT4ByteUnsigned, DPTScaling, DPTTemperature)
+from xknx.exceptions import ConversionError
+
+numpy = pytest.importorskip('numpy')
+
+
+class TestDPTNumPy(unittest.TestCase):
+    """Test class for from_knx_many and to_knx_many."""
+
+    def test_2byte_float_all_values(self):
+        """Test parsing all raw values of DPT2ByteFloat like from_knx."""
+        raw = numpy.arange(65536, dtype='>u2').tobytes()
+        values = DPT2ByteFloat.from_knx_many(raw)
+        self.assertEqual(values.tolist(), [DPT2ByteFloat.from_knx((data >> 8, data & 0xff)) for data in range(65536)])
+
+    def test_2byte_float_to_knx_many(self):
+        """Test serializing values of DPT2ByteFloat like to_knx."""
+        values = numpy.concatenate((
+            numpy.linspace(DPT2ByteFloat.value_min, DPT2ByteFloat.value_max, 10001),
+            numpy.linspace(-100, 100, 20001),
+            [20.47, 20.48, 20.49, 81.88, 81.92, -1000, 499.84, 500.16]))
+        payloads = DPT2ByteFloat.to_knx_many(values)
+        self.assertEqual(payloads.shape, (len(values), 2))
+        self.assertEqual([tuple(payload) for payload in payloads.tolist()],
+                         [DPT2ByteFloat.to_knx(value) for value in values.tolist()])
+
+    def test_2byte_float_boundaries(self):
+        """Test boundaries of subclasses of DPT2ByteFloat."""
+        with self.assertRaises(ConversionError):
+            DPTTemperature.from_knx_many(bytes((0x0c, 0x1a, 0xB1, 0xE6)))
+        with self.assertRaises(ConversionError):
+            DPTTemperature.to_knx_many([21, -274])
+        with self.assertRaises(ConversionError):
+            DPTTemperature.to_knx_many([21, "fnord"])
+
+    def test_integer_and_4byte_float(self):
+        """Test parsing and serializing DPT 7, 8, 12, 13 and 14 with big endian dtypes."""
+        rng = numpy.random.RandomState(42)
+        for dpt_class in (DPT2ByteUnsigned, DPT2ByteSigned, DPT4ByteUnsigned, DPT4ByteSigned, DPT4ByteFloat):
+            payloads = rng.randint(0, 256, size=(100, dpt_class.payload_length)).astype(numpy.uint8)
+            payloads[:, 0] &= 0x7f  # no NaN of DPT4ByteFloat
+            values = dpt_class.from_knx_many(payloads)
+            self.assertEqual(values.tolist(), [dpt_class.from_knx(tuple(payload)) for payload in payloads.tolist()])
+            self.assertEqual(dpt_class.from_knx_many(payloads.tobytes()).tolist(), values.tolist())
+            self.assertTrue((dpt_class.to_knx_many(values) == payloads).all())
+
+    def test_to_knx_many_exceeded(self):
+        """Test serializing values out of range."""
+        with self.assertRaises(ConversionError):
+            DPT2ByteUnsigned.to_knx_many([1, 65536])
+        with self.assertRaises(ConversionError):
+            DPT4ByteSigned.to_knx_many([1, float('nan')])
+        with self.assertRaises(ConversionError):
+            DPT4ByteFloat.to_knx_many([1, 1e40])
+
+    def test_fallback(self):
+        """Test parsing and serializing DPT classes without dtype value by value."""
+        self.assertEqual(DPTScaling.from_knx_many(bytes((0x00, 0x80, 0xff))).tolist(), [0, 50, 100])
+        self.assertEqual(DPTScaling.to_knx_many([0, 50, 100]).tolist(), [[0x00], [0x80], [0xff]])
+
+    def test_invalid_raw(self):
+        """Test parsing buffers not consisting of complete payloads."""
+        with self.assertRaises(ConversionError):
+            DPT2ByteFloat.from_knx_many(b'\x0c\x1a\x0c')
+        with self.assertRaises(ConversionError):
+            DPT4ByteFloat.from_knx_many(numpy.zeros((2, 2), dtype=numpy.uint8))
+        with self.assertRaises(ConversionError):
+            DPT4ByteFloat.from_knx_many(numpy.zeros((2, 4), dtype=numpy.int32))
@@ -1,7 +1,9 @@
 """Unit test for KNX binary/integer objects."""
 import unittest
 
-from xknx.dpt import DPTArray, DPTBinary, DPTComparator
+from xknx.dpt import (
+    DPT2ByteFloat, DPTArray, DPTBase, DPTBinary, DPTComparator, DPTPower,
+    DPTTemperature, DPTValue1Ucount)
 from xknx.exceptions import ConversionError
 
 
@@ -28,6 +30,8 @@ class TestDPT(unittest.TestCase):
         self.assertNotEqual(DPTArray((1, 2, 3)), DPTArray([1, 2, 3, 4]))
         self.assertNotEqual(DPTArray((1, 2, 3, 4)), DPTArray([1, 2, 3]))
         self.assertNotEqual(DPTArray((1, 2, 3)), DPTArray([1, 2, 4]))
+        self.assertEqual(DPTArray(memoryview(bytes((1, 2, 3)))), DPTArray((1, 2, 3)))
+        self.assertEqual(DPTArray(bytearray((1, 2, 3))).value, (1, 2, 3))
 
     def test_compare_none(self):
         """Test comparison of empty DPTArray objects with None."""
@@ -78,3 +82,53 @@ class TestDPT(unittest.TestCase):
         """Test comperator for DPTBinary and DPTBinary - wrong parameter."""
         with self.assertRaises(TypeError):
             DPTComparator.compare("bla", DPTBinary(0))
+
+    def test_transcoder_by_dpt(self):
+        """Test finding DPT classes by DPT number."""
+        self.assertEqual(DPTBase.transcoder_by_dpt(9, 1), DPTTemperature)
+        self.assertEqual(DPTBase.transcoder_by_dpt(9), DPT2ByteFloat)
+        self.assertEqual(DPTBase.transcoder_by_dpt(14, 56), DPTPower)
+        self.assertIsNone(DPTBase.transcoder_by_dpt(9, 1000))
+
+    def test_parse_transcoder(self):
+        """Test finding DPT classes by value type or DPT number."""
+        self.assertEqual(DPTBase.parse_transcoder("temperature"), DPTTemperature)
+        self.assertEqual(DPTBase.parse_transcoder("9.001"), DPTTemperature)
+        self.assertEqual(DPTBase.parse_transcoder("DPT-9.001"), DPTTemperature)
+        self.assertEqual(DPTBase.parse_transcoder("DPT-9"), DPT2ByteFloat)
+        self.assertEqual(DPTBase.parse_transcoder("9.***"), DPT2ByteFloat)
+        self.assertEqual(DPTBase.parse_transcoder("DPT-5"), DPTValue1Ucount)
+        self.assertEqual(DPTBase.parse_transcoder("1byte_unsigned"), DPTValue1Ucount)
+        self.assertIsNone(DPTBase.parse_transcoder("fnord"))
+        self.assertIsNone(DPTBase.parse_transcoder(None))
+
+    def test_transcoder_defined_later(self):
+        """Test finding DPT classes defined after the first lookup."""
+        DPTBase.parse_transcoder("temperature")
+
+        class DPTTestTemperature(DPTTemperature):
+            """DPT 9.999 for testing."""
+
+            dpt_main_number = 9
+            dpt_sub_number = 999
+            value_type = "test_temperature"
+
+        self.assertEqual(DPTBase.parse_transcoder("test_temperature"), DPTTestTemperature)
+        self.assertEqual(DPTBase.parse_transcoder("9.999"), DPTTestTemperature)
+        # not inherited
+        self.assertEqual(DPTBase.parse_transcoder("temperature"), DPTTemperature)
+
+    def test_value_types_unique(self):
+        """Test that no DPT number or value type is defined twice."""
+        dpt_numbers = []
+        value_types = []
+        dpt_classes = DPTBase.__subclasses__()
+        while dpt_classes:
+            dpt_class = dpt_classes.pop()
+            dpt_classes.extend(dpt_class.__subclasses__())
+            if 'dpt_main_number' in vars(dpt_class):
+                dpt_numbers.append((dpt_class.dpt_main_number, dpt_class.dpt_sub_number))
+            if 'value_type' in vars(dpt_class):
+                value_types.append(dpt_class.value_type)
+        self.assertEqual(len(dpt_numbers), len(set(dpt_numbers)))
+        self.assertEqual(len(value_types), len(set(value_types)))
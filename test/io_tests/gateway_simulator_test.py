@@ -0,0 +1,164 @@
+"""Unit test for GatewaySimulator - clients talking to the simulator over loopback UDP."""
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import pytest
+pytestmark = pytest.mark.asyncio
+
+from xknx import XKNX
+from xknx.dpt import DPTBinary
+from xknx.io import GatewaySimulator, Tunnel, UDPClient
+from xknx.knxip import (
+    HPAI, DIBServiceFamily, DIBSuppSVCFamilies, KNXIPFrame, KNXIPServiceType)
+from xknx.telegram import GroupAddress, PhysicalAddress, Telegram
+
+
+class TestGatewaySimulator(unittest.TestCase):
+    """Test class for GatewaySimulator."""
+
+    async def _start_tunnel(self, xknx, simulator, telegrams):
+        """Return tunnel connected to simulator."""
+        tunnel = Tunnel(xknx, PhysicalAddress('1.1.255'),
+                        local_ip='127.0.0.1',
+                        gateway_ip=simulator.local_addr[0],
+                        gateway_port=simulator.local_addr[1],
+                        telegram_received_callback=telegrams.append)
+        await tunnel.start()
+        return tunnel
+
+    @staticmethod
+    async def _wait_for(condition, timeout=1):
+        """Wait until condition() is true."""
+        for _ in range(int(timeout / 0.01)):
+            if condition():
+                return
+            await asyncio.sleep(0.01)
+
+    async def test_tunnel(self):
+        """Test connecting, sending and receiving telegrams through a tunnel."""
+        xknx = XKNX()
+        simulator = GatewaySimulator(xknx)
+        await simulator.start()
+        telegrams1 = []
+        telegrams2 = []
+        tunnel1 = await self._start_tunnel(xknx, simulator, telegrams1)
+        tunnel2 = await self._start_tunnel(xknx, simulator, telegrams2)
+        self.assertEqual(sorted(simulator.connections), [1, 2])
+        self.assertEqual(xknx.own_address, PhysicalAddress('1.1.2'))
+        self.assertTrue(await tunnel1.connectionstate())
+
+        await tunnel1.send_telegram(Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1)))
+        self.assertEqual(simulator.bus_telegrams, 1)
+        await self._wait_for(lambda: telegrams2)
+        self.assertEqual(telegrams1, [])
+        self.assertEqual(telegrams2[0].group_address, GroupAddress('1/2/3'))
+        self.assertEqual(telegrams2[0].payload, DPTBinary(1))
+
+        simulator.send_telegram(Telegram(GroupAddress('1/2/4'), payload=DPTBinary(0)))
+        await self._wait_for(lambda: telegrams1 and len(telegrams2) == 2)
+        self.assertEqual(telegrams1[0].group_address, GroupAddress('1/2/4'))
+
+        simulator.drop_connections()
+        self.assertFalse(await tunnel1.connectionstate())
+
+        await tunnel1.stop()
+        await tunnel2.stop()
+        await simulator.stop()
+
+    async def test_tunnelling_sequence_counter(self):
+        """Test acking repeated TunnellingRequests again and discarding out-of-order requests without ack."""
+        xknx = XKNX()
+        simulator = GatewaySimulator(xknx)
+        addr = ('127.0.0.1', 12345)
+        simulator.connections[1] = GatewaySimulator.Connection(1, addr, PhysicalAddress('1.1.1'))
+        bus_telegrams = []
+        simulator.bus_telegram_cb = bus_telegrams.append
+
+        def tunnelling_request(sequence_counter):
+            """Return TunnellingRequest of channel 1."""
+            knxipframe = KNXIPFrame(xknx)
+            knxipframe.init(KNXIPServiceType.TUNNELLING_REQUEST)
+            knxipframe.body.communication_channel_id = 1
+            knxipframe.body.sequence_counter = sequence_counter
+            knxipframe.body.cemi.telegram = Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1))
+            return knxipframe
+
+        with patch.object(simulator, '_send') as mock_send:
+            for sequence_counter in (0, 0, 5, 1, 0):
+                simulator._tunnelling_request(tunnelling_request(sequence_counter), addr)
+        self.assertEqual([call[0][0].body.sequence_counter for call in mock_send.call_args_list],
+                         [0, 0, 1])
+        self.assertEqual(len(bus_telegrams), 2)
+        self.assertEqual(simulator.connections[1].expected_sequence_counter, 2)
+
+    async def test_search(self):
+        """Test answering SearchRequest."""
+        xknx = XKNX()
+        simulator = GatewaySimulator(xknx, name='Test Gateway')
+        await simulator.start()
+        udp_client = UDPClient(xknx, ('127.0.0.1', 0), simulator.local_addr)
+        responses = []
+        udp_client.register_callback(
+            lambda knxipframe, _: responses.append(knxipframe), [KNXIPServiceType.SEARCH_RESPONSE])
+        await udp_client.connect()
+        search_request = KNXIPFrame(xknx)
+        search_request.init(KNXIPServiceType.SEARCH_REQUEST)
+        search_request.body.discovery_endpoint = HPAI(*udp_client.getsockname())
+        search_request.normalize()
+        udp_client.send(search_request)
+
+        await self._wait_for(lambda: responses)
+        body = responses[0].body
+        self.assertEqual(body.device_name, 'Test Gateway')
+        self.assertEqual(body.control_endpoint, HPAI(*simulator.local_addr))
+        self.assertTrue(body[DIBSuppSVCFamilies].supports(DIBServiceFamily.TUNNELING))
+        await udp_client.stop()
+        await simulator.stop()
+
+    async def test_routing_bus_rate(self):
+        """Test forwarding RoutingIndications to routing peers limited by bus rate."""
+        xknx = XKNX()
+        simulator = GatewaySimulator(xknx, bus_rate=20)
+        await simulator.start()
+        received = []
+        peers = []
+        for _ in range(2):
+            udp_client = UDPClient(xknx, ('127.0.0.1', 0), simulator.local_addr)
+            udp_client.register_callback(
+                lambda knxipframe, _: received.append(xknx.loop.time()),
+                [KNXIPServiceType.ROUTING_INDICATION])
+            await udp_client.connect()
+            peers.append(udp_client)
+        for udp_client in peers:
+            indication = KNXIPFrame(xknx)
+            indication.init(KNXIPServiceType.ROUTING_INDICATION)
+            indication.body.telegram = Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1))
+            indication.body.src_addr = PhysicalAddress('1.1.7')
+            indication.normalize()
+            udp_client.send(indication)
+            await asyncio.sleep(0.01)
+
+        await self._wait_for(lambda: len(received) == 2)
+        # second peer was not known when the first indication was delivered
+        self.assertEqual(len(received), 1)
+        simulator.send_telegram(Telegram(GroupAddress('1/2/3'), payload=DPTBinary(0)))
+        await self._wait_for(lambda: len(received) == 3)
+        self.assertEqual(len(received), 3)
+        # bus is busy for 1/20 s per telegram
+        self.assertGreaterEqual(received[2] - received[0], 0.08)
+        for udp_client in peers:
+            await udp_client.stop()
+        await simulator.stop()
+
+    async def test_loss_repeatable(self):
+        """Test dropping datagrams repeatably by seed."""
+        xknx = XKNX()
+        results = []
+        for _ in range(2):
+            simulator = GatewaySimulator(xknx, loss=0.5, seed=42)
+            lost = [simulator._lost() for _ in range(20)]
+            results.append(lost)
+            self.assertEqual(simulator.lost_datagrams, sum(lost))
+        self.assertEqual(results[0], results[1])
+        self.assertTrue(0 < sum(results[0]) < 20)
@@ -0,0 +1,144 @@
+"""Unit test for TelegramRecorder, TelegramRecording and TelegramReplayer."""
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pytest
+pytestmark = pytest.mark.asyncio
+
+from xknx import XKNX
+from xknx.dpt import DPTArray
+from xknx.exceptions import XKNXException
+from xknx.io import (
+    TelegramRecorder, TelegramRecording, TelegramReplayer, UDPClient)
+from xknx.telegram import (
+    GroupAddress, Telegram, TelegramDirection, TelegramType)
+
+# ROUTING_INDICATION with L_DATA_IND GroupValueResponse 0xf0 to 0/1/81
+RAW_ROUTING_INDICATION = bytes((0x06, 0x10, 0x05, 0x30, 0x00, 0x12, 0x29, 0x00,
+                                0xbc, 0xd0, 0x12, 0x02, 0x01, 0x51, 0x02, 0x00,
+                                0x40, 0xf0))
+# TUNNELLING_REQUEST with L_DATA_IND GroupValueWrite 1 to 0/0/1
+RAW_TUNNELLING_REQUEST = bytes((0x06, 0x10, 0x04, 0x20, 0x00, 0x15, 0x04, 0x01,
+                                0x17, 0x00, 0x29, 0x00, 0xbc, 0xd0, 0x12, 0x01,
+                                0x00, 0x01, 0x01, 0x00, 0x81))
+# SEARCH_REQUEST
+RAW_SEARCH_REQUEST = bytes((0x06, 0x10, 0x02, 0x01, 0x00, 0x0e, 0x08, 0x01,
+                            0xc0, 0xa8, 0x2a, 0x01, 0x84, 0x95))
+
+
+class TestTelegramRecorder(unittest.TestCase):
+    """Test class for telegram recording and replay."""
+
+    def setUp(self):
+        """Set up temporary recording file."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'telegrams.rec')
+
+    def tearDown(self):
+        """Remove temporary recording file."""
+        self.tmp_dir.cleanup()
+
+    def _record(self, frames):
+        """Record frames at given seconds since start of recording."""
+        xknx = XKNX()
+        recorder = TelegramRecorder(xknx, self.path)
+        with patch('time.monotonic') as mock_monotonic:
+            mock_monotonic.return_value = 100
+            recorder.start()
+            for timestamp, raw in frames:
+                mock_monotonic.return_value = 100 + timestamp
+                recorder.frame_received(raw)
+        recorder.stop()
+        return recorder
+
+    def test_record(self):
+        """Test recording cEMI frames of received KNX/IP frames with fixed-size records."""
+        xknx = XKNX()
+        xknx.telegram_recorder = TelegramRecorder(xknx, self.path)
+        xknx.telegram_recorder.start()
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 1234))
+        # frames dropped by the group address filter are recorded as well
+        udp_client.group_address_filter = lambda group_address: False
+        udp_client.data_received_callback(RAW_ROUTING_INDICATION)
+        udp_client.data_received_callback(RAW_SEARCH_REQUEST)
+        xknx.telegram_recorder.stop()
+
+        self.assertEqual(xknx.telegram_recorder.records, 1)
+        self.assertEqual(os.path.getsize(self.path), 2 * 64)
+        recording = TelegramRecording(self.path)
+        self.assertEqual(len(recording), 1)
+        self.assertEqual([cemi for _, cemi in recording.records()],
+                         [RAW_ROUTING_INDICATION[6:]])
+        recording.close()
+
+    def test_seek(self):
+        """Test seeking records by time."""
+        self._record([(0.5, RAW_ROUTING_INDICATION),
+                      (1.0, RAW_TUNNELLING_REQUEST),
+                      (1.0, RAW_ROUTING_INDICATION),
+                      (2.5, RAW_TUNNELLING_REQUEST)])
+        recording = TelegramRecording(self.path)
+        self.assertEqual(len(recording), 4)
+        self.assertEqual(recording.seek(0), 0)
+        self.assertEqual(recording.seek(1.0), 1)
+        self.assertEqual(recording.seek(1.1), 3)
+        self.assertEqual(recording.seek(3), 4)
+        self.assertEqual(
+            list(recording.records(0.6, 2.0)),
+            [(1.0, RAW_TUNNELLING_REQUEST[10:]), (1.0, RAW_ROUTING_INDICATION[6:])])
+        recording.close()
+
+    def test_invalid_recording(self):
+        """Test opening a file not written by TelegramRecorder."""
+        with open(self.path, 'wb') as recording_file:
+            recording_file.write(b'no recording')
+        with self.assertRaises(XKNXException):
+            TelegramRecording(self.path)
+
+    async def test_replay(self):
+        """Test replaying recorded telegrams into the telegram queue at maximum speed."""
+        self._record([(0.5, RAW_ROUTING_INDICATION),
+                      (1.0, RAW_TUNNELLING_REQUEST)])
+        xknx = XKNX()
+        replayer = TelegramReplayer(xknx, self.path, speed=None)
+        self.assertEqual(await replayer.replay(), 2)
+        self.assertEqual(xknx.telegrams.qsize(), 2)
+        self.assertEqual(xknx.telegrams.get_nowait(),
+                         Telegram(GroupAddress('0/1/81'),
+                                  telegramtype=TelegramType.GROUP_RESPONSE,
+                                  direction=TelegramDirection.INCOMING,
+                                  payload=DPTArray(0xf0)))
+
+    async def test_replay_processed(self):
+        """Test replaying at maximum speed returns after the running telegram queue processed all telegrams."""
+        self._record([(0.5, RAW_ROUTING_INDICATION),
+                      (1.0, RAW_TUNNELLING_REQUEST)])
+        xknx = XKNX()
+        telegrams = []
+
+        async def telegram_received_cb(telegram):
+            """Collect processed telegrams."""
+            telegrams.append(telegram)
+        xknx.telegram_queue.register_telegram_received_cb(telegram_received_cb)
+        await xknx.telegram_queue.start()
+        replayer = TelegramReplayer(xknx, self.path, speed=None)
+        self.assertEqual(await replayer.replay(), 2)
+        self.assertEqual(len(telegrams), 2)
+        self.assertEqual(telegrams[1].group_address, GroupAddress('0/0/1'))
+        await xknx.telegram_queue.stop()
+
+    async def test_replay_scaled(self):
+        """Test replaying recorded telegrams timed like the recording."""
+        self._record([(0.5, RAW_ROUTING_INDICATION),
+                      (1.0, RAW_TUNNELLING_REQUEST),
+                      (3.0, RAW_TUNNELLING_REQUEST)])
+        xknx = XKNX()
+        telegrams = []
+        replayer = TelegramReplayer(xknx, self.path, speed=10,
+                                    telegram_received_callback=telegrams.append)
+        start = xknx.loop.time()
+        self.assertEqual(await replayer.replay(start=0.5, end=1.5), 2)
+        self.assertAlmostEqual(xknx.loop.time() - start, 0.05, delta=0.04)
+        self.assertEqual(telegrams[1].group_address, GroupAddress('0/0/1'))
@@ -0,0 +1,145 @@
+"""Unit test for KNX/IP TunnellingSender."""
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import pytest
+pytestmark = pytest.mark.asyncio
+
+from xknx import XKNX
+from xknx.dpt import DPTBinary
+from xknx.io import TunnellingSender, UDPClient
+from xknx.knxip import ErrorCode, KNXIPFrame, KNXIPServiceType
+from xknx.telegram import GroupAddress, PhysicalAddress, Telegram
+
+
+class TestTunnellingSender(unittest.TestCase):
+    """Test class for xknx/io/TunnellingSender objects."""
+
+    @staticmethod
+    def _tunnelling_ack(xknx, communication_channel_id, sequence_counter,
+                        status_code=ErrorCode.E_NO_ERROR):
+        """Return TUNNELLING_ACK frame."""
+        knxipframe = KNXIPFrame(xknx)
+        knxipframe.init(KNXIPServiceType.TUNNELLING_ACK)
+        knxipframe.body.communication_channel_id = communication_channel_id
+        knxipframe.body.sequence_counter = sequence_counter
+        knxipframe.body.status_code = status_code
+        return knxipframe
+
+    async def test_send(self):
+        """Test sending telegram and matching TunnellingAck by sequence counter."""
+        xknx = XKNX()
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 1234))
+        sender = TunnellingSender(xknx, udp_client, 23, PhysicalAddress('2.2.2'))
+        telegram = Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1))
+
+        with patch('xknx.io.UDPClient.send') as mock_udp_send:
+            acknowledged = await sender.send(telegram)
+            knxipframe = mock_udp_send.call_args[0][0]
+        self.assertEqual(knxipframe.body.communication_channel_id, 23)
+        self.assertEqual(knxipframe.body.sequence_counter, 0)
+        self.assertEqual(knxipframe.body.cemi.telegram, telegram)
+        self.assertEqual(sender.sequence_counter, 1)
+        self.assertFalse(acknowledged.done())
+
+        # wrong communication channel and wrong sequence counter are ignored
+        udp_client.handle_knxipframe(self._tunnelling_ack(xknx, 24, 0))
+        udp_client.handle_knxipframe(self._tunnelling_ack(xknx, 23, 5))
+        self.assertFalse(acknowledged.done())
+
+        udp_client.handle_knxipframe(self._tunnelling_ack(xknx, 23, 0))
+        self.assertTrue(await acknowledged)
+        sender.stop()
+
+    async def test_repeat_once(self):
+        """Test not acknowledged request is repeated once with the same sequence counter."""
+        xknx = XKNX()
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 1234))
+        sender = TunnellingSender(xknx, udp_client, 23, PhysicalAddress('2.2.2'),
+                                  timeout_in_seconds=0.01)
+        telegram = Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1))
+
+        with patch('xknx.io.UDPClient.send') as mock_udp_send:
+            acknowledged = await sender.send(telegram)
+            self.assertFalse(await acknowledged)
+            self.assertEqual(mock_udp_send.call_count, 2)
+            self.assertEqual(mock_udp_send.call_args_list[0], mock_udp_send.call_args_list[1])
+
+            # error status is repeated as well
+            acknowledged = await sender.send(telegram)
+            udp_client.handle_knxipframe(
+                self._tunnelling_ack(xknx, 23, 1, status_code=ErrorCode.E_CONNECTION_ID))
+            self.assertEqual(mock_udp_send.call_count, 4)
+            udp_client.handle_knxipframe(self._tunnelling_ack(xknx, 23, 1))
+            self.assertTrue(await acknowledged)
+        sender.stop()
+
+    async def test_metrics(self):
+        """Test measuring round-trip time, retries and failures of requests."""
+        xknx = XKNX(metrics=True)
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 1234))
+        sender = TunnellingSender(xknx, udp_client, 23, PhysicalAddress('2.2.2'),
+                                  timeout_in_seconds=0.01)
+        telegram = Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1))
+
+        with patch('xknx.io.UDPClient.send'):
+            self.assertFalse(await (await sender.send(telegram)))
+            acknowledged = await sender.send(telegram)
+            udp_client.handle_knxipframe(self._tunnelling_ack(xknx, 23, 1))
+            self.assertTrue(await acknowledged)
+        self.assertEqual(xknx.metrics.tunnelling_retries.value, 1)
+        self.assertEqual(xknx.metrics.tunnelling_failures.value, 1)
+        self.assertEqual(xknx.metrics.tunnelling_ack_time.count, 1)
+        self.assertLess(xknx.metrics.tunnelling_ack_time.sum, 0.01)
+        sender.stop()
+
+    async def test_window(self):
+        """Test sending several requests before they were acknowledged."""
+        xknx = XKNX()
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 1234))
+        sender = TunnellingSender(xknx, udp_client, 23, PhysicalAddress('2.2.2'), window=2)
+        telegram = Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1))
+
+        with patch('xknx.io.UDPClient.send') as mock_udp_send:
+            acknowledged0 = await sender.send(telegram)
+            acknowledged1 = await sender.send(telegram)
+            self.assertEqual(mock_udp_send.call_count, 2)
+            # window is full
+            send2 = asyncio.ensure_future(sender.send(telegram))
+            await asyncio.sleep(0)
+            self.assertFalse(send2.done())
+            self.assertEqual(mock_udp_send.call_count, 2)
+
+            udp_client.handle_knxipframe(self._tunnelling_ack(xknx, 23, 1))
+            acknowledged2 = await send2
+            self.assertEqual(mock_udp_send.call_count, 3)
+            self.assertEqual(mock_udp_send.call_args[0][0].body.sequence_counter, 2)
+
+        self.assertTrue(await acknowledged1)
+        self.assertFalse(acknowledged0.done())
+        sender.stop()
+        self.assertFalse(await acknowledged0)
+        self.assertFalse(await acknowledged2)
+
+    async def test_stop_window_full(self):
+        """Test requests waiting for the window are not sent after the sender was stopped."""
+        xknx = XKNX()
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 1234))
+        sender = TunnellingSender(xknx, udp_client, 23, PhysicalAddress('2.2.2'))
+        telegram = Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1))
+
+        with patch('xknx.io.UDPClient.send') as mock_udp_send:
+            acknowledged0 = await sender.send(telegram)
+            # window is full
+            send1 = asyncio.ensure_future(sender.send(telegram))
+            send2 = asyncio.ensure_future(sender.send(telegram))
+            await asyncio.sleep(0)
+            self.assertFalse(send1.done())
+
+            sender.stop()
+            self.assertFalse(await acknowledged0)
+            self.assertFalse(await (await send1))
+            self.assertFalse(await (await send2))
+            self.assertEqual(mock_udp_send.call_count, 1)
+        self.assertEqual(sender.sequence_counter, 1)
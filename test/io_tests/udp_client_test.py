@@ -0,0 +1,110 @@
+"""Unit test for UDPClient callback dispatching."""
+import unittest
+from unittest.mock import Mock, patch
+
+from xknx import XKNX
+from xknx.exceptions import XKNXException
+from xknx.io import UDPClient
+from xknx.knxip import KNXIPFrame, KNXIPServiceType
+from xknx.telegram import GroupAddress
+
+
+class TestUDPClient(unittest.TestCase):
+    """Test class for xknx/io/UDPClient objects."""
+
+    @staticmethod
+    def _tunnelling_ack(xknx, communication_channel_id, sequence_counter):
+        """Return TUNNELLING_ACK frame."""
+        knxipframe = KNXIPFrame(xknx)
+        knxipframe.init(KNXIPServiceType.TUNNELLING_ACK)
+        knxipframe.body.communication_channel_id = communication_channel_id
+        knxipframe.body.sequence_counter = sequence_counter
+        return knxipframe
+
+    def test_callback_by_service_type(self):
+        """Test dispatching frames to callbacks by service type."""
+        xknx = XKNX()
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 1234))
+        ack_callback = Mock()
+        request_callback = Mock()
+        all_callback = Mock()
+        callb_ack = udp_client.register_callback(ack_callback, [KNXIPServiceType.TUNNELLING_ACK])
+        udp_client.register_callback(request_callback, [KNXIPServiceType.TUNNELLING_REQUEST])
+        callb_all = udp_client.register_callback(all_callback)
+
+        knxipframe = self._tunnelling_ack(xknx, 1, 2)
+        udp_client.handle_knxipframe(knxipframe)
+        ack_callback.assert_called_once_with(knxipframe, udp_client)
+        request_callback.assert_not_called()
+        all_callback.assert_called_once_with(knxipframe, udp_client)
+
+        udp_client.unregister_callback(callb_ack)
+        udp_client.unregister_callback(callb_all)
+        udp_client.handle_knxipframe(knxipframe)
+        self.assertEqual(ack_callback.call_count, 1)
+        self.assertEqual(all_callback.call_count, 1)
+        with self.assertRaises(ValueError):
+            udp_client.unregister_callback(callb_ack)
+
+    def test_response_callback(self):
+        """Test dispatching responses to callbacks by response key."""
+        xknx = XKNX()
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 1234))
+        callbacks = [Mock() for _ in range(3)]
+        callbs = [
+            udp_client.register_response_callback(
+                callback, KNXIPServiceType.TUNNELLING_ACK, (23, sequence_counter))
+            for sequence_counter, callback in enumerate(callbacks)]
+
+        knxipframe = self._tunnelling_ack(xknx, 23, 1)
+        udp_client.handle_knxipframe(knxipframe)
+        callbacks[0].assert_not_called()
+        callbacks[1].assert_called_once_with(knxipframe, udp_client)
+        callbacks[2].assert_not_called()
+
+        # wrong communication channel
+        udp_client.handle_knxipframe(self._tunnelling_ack(xknx, 24, 0))
+        callbacks[0].assert_not_called()
+
+        udp_client.unregister_callback(callbs[1])
+        udp_client.handle_knxipframe(knxipframe)
+        self.assertEqual(callbacks[1].call_count, 1)
+
+    def test_response_callback_without_key(self):
+        """Test registering response callback for service type without response key."""
+        xknx = XKNX()
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 1234))
+        with self.assertRaises(XKNXException):
+            udp_client.register_response_callback(Mock(), KNXIPServiceType.CONNECT_RESPONSE, 1)
+
+    def test_group_address_filter(self):
+        """Test dropping telegrams by group address before parsing them."""
+        xknx = XKNX()
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 1234))
+        callback = Mock()
+        filtered_frame_callback = Mock()
+        udp_client.register_callback(callback)
+        udp_client.group_address_filter = lambda group_address: group_address == GroupAddress('0/1/81')
+        udp_client.filtered_frame_callback = filtered_frame_callback
+
+        raw_matching = bytes((0x06, 0x10, 0x05, 0x30, 0x00, 0x12, 0x29, 0x00,
+                              0xbc, 0xd0, 0x12, 0x02, 0x01, 0x51, 0x02, 0x00,
+                              0x40, 0xf0))
+        raw_other = bytes((0x06, 0x10, 0x05, 0x30, 0x00, 0x12, 0x29, 0x00,
+                           0xbc, 0xd0, 0x12, 0x02, 0x01, 0x52, 0x02, 0x00,
+                           0x40, 0xf0))
+        with patch('xknx.knxip.KNXIPFrame.from_knx') as mock_from_knx:
+            udp_client.data_received_callback(raw_other)
+            mock_from_knx.assert_not_called()
+        callback.assert_not_called()
+        filtered_frame_callback.assert_called_once_with(raw_other)
+
+        udp_client.data_received_callback(raw_matching)
+        self.assertEqual(callback.call_count, 1)
+        knxipframe = callback.call_args[0][0]
+        self.assertEqual(knxipframe.body.dst_addr, GroupAddress('0/1/81'))
+        self.assertEqual(filtered_frame_callback.call_count, 1)
+
+        # frames not carrying a telegram are never filtered
+        udp_client.data_received_callback(self._tunnelling_ack(xknx, 1, 2).to_bytes())
+        self.assertEqual(callback.call_count, 2)
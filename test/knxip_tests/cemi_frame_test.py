@@ -7,8 +7,9 @@ from pytest import fixture, raises
 from xknx.dpt import DPTBinary
 from xknx.exceptions import CouldNotParseKNXIP, UnsupportedCEMIMessage
 from xknx.knxip.cemi_frame import CEMIFrame
-from xknx.knxip.knxip_enum import APCICommand, CEMIMessageCode
-from xknx.telegram import PhysicalAddress
+from xknx.knxip.knxip_enum import APCICommand, CEMIFlags, CEMIMessageCode
+from xknx.telegram import (
+    GroupAddress, PhysicalAddress, Telegram, TelegramPriority)
 
 
 def get_data(code, adil, flags, src, dst, mpdu_len, tpci_apci, payload):
@@ -64,3 +65,15 @@ def test_invalid_invalid_len(frame):
     """Test for invalid cemi len"""
     with raises(UnsupportedCEMIMessage, match=r".*CEMI too small.*"):
         frame.from_knx_data_link_layer(get_data(0x29, 0, 0, 0, 0, 2, 0, [])[:5])
+
+
+def test_telegram_priority(frame):
+    """Test priority of telegram is carried within CEMI flags"""
+    frame.telegram = Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1))
+    assert frame.flags & CEMIFlags.PRIORITY_MASK == CEMIFlags.PRIORITY_LOW
+    assert frame.telegram.priority == TelegramPriority.LOW
+
+    frame.telegram = Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1),
+                              priority=TelegramPriority.URGENT)
+    assert frame.flags & CEMIFlags.PRIORITY_MASK == CEMIFlags.PRIORITY_URGENT
+    assert frame.telegram.priority == TelegramPriority.URGENT
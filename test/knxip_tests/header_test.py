@@ -24,6 +24,9 @@ class Test_KNXIP_Header(unittest.TestCase):
         self.assertEqual(header.b4_reserve, 0)
         self.assertEqual(header.total_length, 10)
         self.assertEqual(header.to_knx(), list(raw))
+        buffer = bytearray(8)
+        self.assertEqual(header.to_knx_into(buffer, 2), 8)
+        self.assertEqual(buffer, bytes((0, 0) + raw))
 
     def test_set_length(self):
         """Test setting length."""
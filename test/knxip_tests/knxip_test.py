@@ -3,8 +3,10 @@ import asyncio
 import unittest
 
 from xknx import XKNX
+from xknx.dpt import DPTArray
 from xknx.exceptions import CouldNotParseKNXIP
 from xknx.knxip import KNXIPFrame
+from xknx.telegram import GroupAddress
 
 
 class Test_KNXIP(unittest.TestCase):
@@ -27,3 +29,47 @@ class Test_KNXIP(unittest.TestCase):
         knxipframe = KNXIPFrame(xknx)
         with self.assertRaises(CouldNotParseKNXIP):
             knxipframe.from_knx(raw)
+
+    def test_parsing_bytes(self):
+        """Test parsing a received datagram without keeping references to it."""
+        raw = bytes((0x06, 0x10, 0x05, 0x30, 0x00, 0x13, 0x29, 0x00,
+                     0xbc, 0xd0, 0x12, 0x02, 0x01, 0x51, 0x03, 0x00,
+                     0x80, 0x0c, 0x1a))
+        xknx = XKNX()
+        knxipframe = KNXIPFrame(xknx)
+        view = memoryview(raw)
+        self.assertEqual(knxipframe.from_knx(view), 19)
+        # raises BufferError if a slice of the datagram is still referenced
+        view.release()
+
+        self.assertEqual(knxipframe.body.dst_addr, GroupAddress('0/1/81'))
+        self.assertEqual(knxipframe.body.payload, DPTArray((0x0c, 0x1a)))
+        self.assertEqual(knxipframe.to_bytes(), raw)
+
+        knxipframe2 = KNXIPFrame(xknx)
+        knxipframe2.from_knx(raw)
+        self.assertEqual(knxipframe2.body.telegram, knxipframe.body.telegram)
+
+    def test_peek_group_address(self):
+        """Test reading the destination group address from raw data without parsing the frame."""
+        routing_indication = bytes((0x06, 0x10, 0x05, 0x30, 0x00, 0x12, 0x29, 0x00,
+                                    0xbc, 0xd0, 0x12, 0x02, 0x01, 0x51, 0x02, 0x00,
+                                    0x40, 0xf0))
+        self.assertEqual(KNXIPFrame.peek_group_address(routing_indication), 337)
+        tunnelling_request = bytes((0x06, 0x10, 0x04, 0x20, 0x00, 0x15, 0x04, 0x01,
+                                    0x17, 0x00, 0x11, 0x00, 0xbc, 0xe0, 0x00, 0x00,
+                                    0x48, 0x08, 0x01, 0x00, 0x81))
+        self.assertEqual(KNXIPFrame.peek_group_address(tunnelling_request),
+                         GroupAddress('9/0/8').raw)
+        # destination is a physical address
+        individual = bytes((0x06, 0x10, 0x05, 0x30, 0x00, 0x12, 0x29, 0x00,
+                            0xbc, 0x50, 0x12, 0x02, 0x01, 0x51, 0x02, 0x00,
+                            0x40, 0xf0))
+        self.assertIsNone(KNXIPFrame.peek_group_address(individual))
+        # other service type
+        connectionstate_request = bytes((0x06, 0x10, 0x02, 0x07, 0x00, 0x10, 0x15, 0x00,
+                                         0x08, 0x01, 0xC0, 0xA8, 0xC8, 0x0C, 0xC3, 0xB4))
+        self.assertIsNone(KNXIPFrame.peek_group_address(connectionstate_request))
+        # too short
+        self.assertIsNone(KNXIPFrame.peek_group_address(routing_indication[:12]))
+        self.assertIsNone(KNXIPFrame.peek_group_address(b''))
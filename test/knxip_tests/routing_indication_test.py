@@ -44,6 +44,7 @@ class Test_KNXIP(unittest.TestCase):
         self.assertEqual(knxipframe.header.to_knx(), list(raw[0:6]))
         self.assertEqual(knxipframe.body.to_knx(), list(raw[6:]))
         self.assertEqual(knxipframe.to_knx(), list(raw))
+        self.assertEqual(knxipframe.to_bytes(), bytes(raw))
 
     def test_telegram_set(self):
         """Test parsing and streaming CEMIFrame KNX/IP packet with DPTArray/DPTTime as payload."""
@@ -70,6 +71,7 @@ class Test_KNXIP(unittest.TestCase):
         self.assertEqual(knxipframe.header.to_knx(), list(raw[0:6]))
         self.assertEqual(knxipframe.body.to_knx(), list(raw[6:]))
         self.assertEqual(knxipframe.to_knx(), list(raw))
+        self.assertEqual(knxipframe.to_bytes(), bytes(raw))
 
     def test_telegram_get(self):
         """Test parsing and streaming CEMIFrame KNX/IP packet, group read."""
@@ -118,6 +120,7 @@ class Test_KNXIP(unittest.TestCase):
         self.assertEqual(knxipframe2.header.to_knx(), list(raw[0:6]))
         self.assertEqual(knxipframe2.body.to_knx(), list(raw[6:]))
         self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.to_bytes(), bytes(raw))
 
     def test_EndTOEnd_group_write_binary_off(self):
         """Test parsing and streaming CEMIFrame KNX/IP packet, switch off light in my kitchen."""
@@ -142,6 +145,7 @@ class Test_KNXIP(unittest.TestCase):
         self.assertEqual(knxipframe2.header.to_knx(), list(raw[0:6]))
         self.assertEqual(knxipframe2.body.to_knx(), list(raw[6:]))
         self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.to_bytes(), bytes(raw))
 
     def test_EndTOEnd_group_write_1byte(self):
         """Test parsing and streaming CEMIFrame KNX/IP packet, dimm light in my kitchen."""
@@ -166,6 +170,7 @@ class Test_KNXIP(unittest.TestCase):
         self.assertEqual(knxipframe2.header.to_knx(), list(raw[0:6]))
         self.assertEqual(knxipframe2.body.to_knx(), list(raw[6:]))
         self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.to_bytes(), bytes(raw))
 
     def test_EndTOEnd_group_write_2bytes(self):
         """Test parsing and streaming CEMIFrame KNX/IP packet, setting value of thermostat."""
@@ -192,6 +197,7 @@ class Test_KNXIP(unittest.TestCase):
         self.assertEqual(knxipframe2.header.to_knx(), list(raw[0:6]))
         self.assertEqual(knxipframe2.body.to_knx(), list(raw[6:]))
         self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.to_bytes(), bytes(raw))
 
     def test_EndTOEnd_group_read(self):
         """Test parsing and streaming CEMIFrame KNX/IP packet, group read."""
@@ -216,6 +222,7 @@ class Test_KNXIP(unittest.TestCase):
         self.assertEqual(knxipframe2.header.to_knx(), list(raw[0:6]))
         self.assertEqual(knxipframe2.body.to_knx(), list(raw[6:]))
         self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.to_bytes(), bytes(raw))
 
     def test_EndTOEnd_group_response(self):
         """Test parsing and streaming CEMIFrame KNX/IP packet, group response."""
@@ -242,6 +249,7 @@ class Test_KNXIP(unittest.TestCase):
         self.assertEqual(knxipframe2.header.to_knx(), list(raw[0:6]))
         self.assertEqual(knxipframe2.body.to_knx(), list(raw[6:]))
         self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.to_bytes(), bytes(raw))
 
     def test_maximum_apci(self):
         """Test parsing and streaming CEMIFrame KNX/IP packet, testing maximum APCI."""
@@ -260,6 +268,7 @@ class Test_KNXIP(unittest.TestCase):
                 0xbc, 0xd0, 0x13, 0x01, 0x01, 0x51, 0x01, 0x00,
                 0xbf))
         self.assertEqual(knxipframe.to_knx(), list(raw))
+        self.assertEqual(knxipframe.to_bytes(), bytes(raw))
 
         knxipframe2 = KNXIPFrame(xknx)
         knxipframe2.init(KNXIPServiceType.ROUTING_INDICATION)
@@ -31,3 +31,4 @@ class Test_KNXIP_Discovery(unittest.TestCase):
         knxipframe2.normalize()
 
         self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.to_bytes(), bytes(raw))
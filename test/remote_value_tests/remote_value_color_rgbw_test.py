@@ -107,6 +107,23 @@ class TestRemoteValueColorRGBW(unittest.TestCase):
         await remote_value.process(telegram)
         self.assertEqual(remote_value.value, [100, 101, 102, 103])
 
+    async def test_process_partial(self):
+        """Test process telegrams with some valid colors, merged with the previous value once."""
+        xknx = XKNX()
+        remote_value = RemoteValueColorRGBW(
+            xknx,
+            group_address=GroupAddress("1/2/3"))
+        await remote_value.process(Telegram(
+            group_address=GroupAddress("1/2/3"),
+            payload=DPTArray((0x64, 0x65, 0x66, 0x67, 0x00, 0x0f))))
+        self.assertEqual(remote_value.value, [100, 101, 102, 103])
+        await remote_value.process(Telegram(
+            group_address=GroupAddress("1/2/3"),
+            payload=DPTArray((0x00, 0x00, 0x00, 0x20, 0x00, 0x01))))
+        self.assertEqual(remote_value.value, [100, 101, 102, 32])
+        self.assertEqual(remote_value.value, [100, 101, 102, 32])
+        self.assertEqual(remote_value.previous_value, [100, 101, 102, 32])
+
     async def test_to_process_error(self):
         """Test process errornous telegram."""
         xknx = XKNX()
@@ -3,6 +3,7 @@ import asyncio
 import unittest
 
 from xknx import XKNX
+from xknx.dpt import DPT4ByteFloat, DPTBase, DPTTemperature
 from xknx.exceptions import ConversionError
 from xknx.remote_value import RemoteValueSensor
 
@@ -17,8 +18,18 @@ class TestRemoteValueSensor(unittest.TestCase):
             RemoteValueSensor(xknx=xknx, value_type="wrong_value_type")
 
     def test_payload_length_defined(self):
-        """Test if all members of DPTMAP implement payload_length."""
-        for value_type in RemoteValueSensor.DPTMAP:
+        """Test if all DPT classes of value types implement payload_length."""
+        for value_type, dpt_class in DPTBase.value_types().items():
             self.assertTrue(
-                isinstance(RemoteValueSensor.DPTMAP[value_type].payload_length,
-                           int))
+                isinstance(dpt_class.payload_length, int), value_type)
+
+    def test_value_type_dpt_number(self):
+        """Test initializing with DPT number as value_type."""
+        xknx = XKNX()
+        remote_value = RemoteValueSensor(xknx=xknx, value_type="9.001")
+        self.assertEqual(remote_value.dpt_class, DPTTemperature)
+        self.assertEqual(remote_value.unit_of_measurement, "°C")
+        remote_value = RemoteValueSensor(xknx=xknx, value_type="DPT-14")
+        self.assertEqual(remote_value.dpt_class, DPT4ByteFloat)
+        with self.assertRaises(ConversionError):
+            RemoteValueSensor(xknx=xknx, value_type="10.001")
@@ -9,7 +9,7 @@ pytestmark = pytest.mark.asyncio
 from xknx import XKNX
 from xknx.dpt import DPTArray, DPTBinary
 from xknx.exceptions import CouldNotParseTelegram
-from xknx.remote_value import RemoteValue
+from xknx.remote_value import RemoteValue, RemoteValueSwitch
 from xknx.telegram import GroupAddress, Telegram
 
 
@@ -77,6 +77,39 @@ class TestRemoteValue(unittest.TestCase):
             with self.assertRaises(CouldNotParseTelegram):
                 await remote_value.process(telegram)
 
+    def test_value_cached(self):
+        """Test if value is decoded only once per payload."""
+        xknx = XKNX()
+        remote_value = RemoteValueSwitch(xknx, group_address=GroupAddress('1/1/1'))
+        remote_value.payload = DPTBinary(1)
+        with patch('xknx.remote_value.RemoteValueSwitch.from_knx') as patch_from_knx:
+            patch_from_knx.return_value = True
+            self.assertTrue(remote_value.value)
+            self.assertTrue(remote_value.value)
+            self.assertEqual(patch_from_knx.call_count, 1)
+            # setting an equal payload keeps the decoded value
+            remote_value.payload = DPTBinary(1)
+            self.assertTrue(remote_value.value)
+            self.assertEqual(patch_from_knx.call_count, 1)
+            remote_value.payload = DPTBinary(0)
+            patch_from_knx.return_value = False
+            self.assertFalse(remote_value.value)
+            self.assertEqual(patch_from_knx.call_count, 2)
+            remote_value.payload = None
+            self.assertIsNone(remote_value.value)
+            self.assertEqual(patch_from_knx.call_count, 2)
+
+    async def test_value_cached_process_set(self):
+        """Test if value decoded before is replaced by process and set."""
+        xknx = XKNX()
+        remote_value = RemoteValueSwitch(xknx, group_address=GroupAddress('1/1/1'))
+        await remote_value.process(Telegram(GroupAddress('1/1/1'), payload=DPTBinary(1)))
+        self.assertTrue(remote_value.value)
+        await remote_value.process(Telegram(GroupAddress('1/1/1'), payload=DPTBinary(0)))
+        self.assertFalse(remote_value.value)
+        await remote_value.set(True)
+        self.assertTrue(remote_value.value)
+
     def test_eq(self):
         """Test __eq__ operator."""
         xknx = XKNX()
@@ -99,3 +132,7 @@ class TestRemoteValue(unittest.TestCase):
         self.assertNotEqual(remote_value4, remote_value1)
         self.assertEqual(remote_value1, remote_value5)
         self.assertEqual(remote_value5, remote_value1)
+        remote_value1.payload = DPTBinary(1)
+        remote_value2.payload = DPTBinary(1)
+        remote_value1.value  # pylint: disable=pointless-statement
+        self.assertEqual(remote_value1, remote_value2)
@@ -2,7 +2,8 @@
 import unittest
 
 from xknx.exceptions import ConversionError
-from xknx.telegram import AddressFilter, GroupAddress
+from xknx.telegram import (
+    AddressFilter, CompiledAddressFilter, GroupAddress, GroupAddressType)
 
 
 class TestAddressFilter(unittest.TestCase):
@@ -149,3 +150,31 @@ class TestAddressFilter(unittest.TestCase):
         # pylint: disable=protected-access
         self.assertEqual(AddressFilter.Range._adjust_range(GroupAddress.MAX_FREE+1), GroupAddress.MAX_FREE)
         self.assertEqual(AddressFilter.Range._adjust_range(-1), 0)
+
+    def test_compile(self):
+        """Test compiled bitmap matching exactly the addresses AddressFilter.match accepts."""
+        for pattern in ("1/2/2-3,5-", "1/*/2-5", "2-/2,3,5-/*", "1-3,4,5/*", "*/2-5", "2-5,300-", "-10"):
+            address_filter = AddressFilter(pattern)
+            for levels in GroupAddressType:
+                if len(address_filter.level_filters) > 1 and levels == GroupAddressType.FREE or \
+                        len(address_filter.level_filters) > 2 and levels != GroupAddressType.LONG:
+                    # parts of the pattern don't exist within address format
+                    self.assertFalse(any(address_filter.compile(levels)))
+                    continue
+                bitmap = address_filter.compile(levels)
+                self.assertEqual(len(bitmap), 65536)
+                for raw in range(65536):
+                    self.assertEqual(
+                        bitmap[raw] == 1, address_filter.match(GroupAddress.from_raw(raw, levels)),
+                        msg="{} {} {}".format(pattern, levels, raw))
+
+    def test_compiled_address_filter(self):
+        """Test matching several AddressFilters by CompiledAddressFilter."""
+        compiled_filter = CompiledAddressFilter([AddressFilter("1/2/3"), AddressFilter("2-/2,3,5-/*")])
+        self.assertTrue(compiled_filter.match("1/2/3"))
+        self.assertTrue(compiled_filter.match(GroupAddress("2/3/8")))
+        self.assertTrue(compiled_filter.match("4/7/10"))
+        self.assertFalse(compiled_filter.match("1/2/4"))
+        self.assertFalse(compiled_filter.match("2/4/10"))
+        self.assertEqual(sum(compiled_filter.bitmap()), 1 + 30 * 5 * 256)
+        self.assertFalse(CompiledAddressFilter([]).match("1/2/3"))
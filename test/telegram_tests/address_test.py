@@ -84,6 +84,25 @@ class TestPhysicalAddress(TestCase):
         with self.assertRaises(TypeError):
             PhysicalAddress('1.0.0') == 'example'  # pylint: disable=expression-not-assigned
 
+    def test_hash(self):
+        """Test if addresses can be used as dict keys."""
+        addresses = {PhysicalAddress('1.0.0'): 1}
+        self.assertEqual(addresses[PhysicalAddress(4096)], 1)
+        self.assertNotIn(PhysicalAddress('1.1.1'), addresses)
+
+    def test_from_raw(self):
+        """Test creating interned addresses from raw values."""
+        address = PhysicalAddress.from_raw(4353)
+        self.assertEqual(address, PhysicalAddress('1.1.1'))
+        self.assertIs(PhysicalAddress.from_raw(4353), address)
+        with self.assertRaises(CouldNotParseAddress):
+            PhysicalAddress.from_raw(65536)
+
+    def test_slots(self):
+        """Test that addresses do not carry a __dict__."""
+        with self.assertRaises(AttributeError):
+            PhysicalAddress('1.1.1').foo = 'bar'
+
     def test_representation(self):
         """Test string representation of address."""
         self.assertEqual(
@@ -218,6 +237,25 @@ class TestGroupAddress(TestCase):
         with self.assertRaises(TypeError):
             GroupAddress('1/0') == 'example'  # pylint: disable=expression-not-assigned
 
+    def test_hash(self):
+        """Test if addresses can be used as dict keys and set members."""
+        addresses = {GroupAddress('1/0'): 1}
+        self.assertEqual(addresses[GroupAddress(2048)], 1)
+        self.assertNotIn(GroupAddress('1/1'), addresses)
+        self.assertEqual(len({GroupAddress('1/2/3'), GroupAddress('1/2/3'), GroupAddress('1/2/4')}), 2)
+
+    def test_from_raw(self):
+        """Test creating interned addresses from raw values."""
+        address = GroupAddress.from_raw(2305)
+        self.assertEqual(address, GroupAddress('1/1/1'))
+        self.assertEqual(address.levels, GroupAddressType.LONG)
+        self.assertIs(GroupAddress.from_raw(2305), address)
+        short_address = GroupAddress.from_raw(2305, levels=GroupAddressType.SHORT)
+        self.assertIsNot(short_address, address)
+        self.assertEqual(str(short_address), '1/257')
+        with self.assertRaises(CouldNotParseAddress):
+            GroupAddress.from_raw(-1)
+
     def test_representation(self):
         """Test string representation of address."""
         self.assertEqual(
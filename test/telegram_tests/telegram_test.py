@@ -2,7 +2,7 @@
 import unittest
 
 from xknx.telegram import (
-    GroupAddress, Telegram, TelegramDirection, TelegramType)
+    GroupAddress, Telegram, TelegramDirection, TelegramPriority, TelegramType)
 
 
 class TestTelegram(unittest.TestCase):
@@ -16,6 +16,9 @@ class TestTelegram(unittest.TestCase):
         self.assertEqual(
             Telegram(GroupAddress('1/2/3'), TelegramType.GROUP_READ),
             Telegram(GroupAddress('1/2/3'), TelegramType.GROUP_READ))
+        self.assertEqual(
+            Telegram(GroupAddress('1/2/3'), TelegramType.GROUP_READ),
+            Telegram(GroupAddress('1/2/3'), TelegramType.GROUP_READ, background=True))
 
     def test_telegram_not_equal(self):
         """Test not equals operator."""
@@ -29,3 +32,7 @@ class TestTelegram(unittest.TestCase):
             Telegram(GroupAddress('1/2/3'), TelegramType.GROUP_READ),
             Telegram(GroupAddress('1/2/3'), TelegramType.GROUP_READ,
                      TelegramDirection.INCOMING))
+        self.assertNotEqual(
+            Telegram(GroupAddress('1/2/3'), TelegramType.GROUP_READ),
+            Telegram(GroupAddress('1/2/3'), TelegramType.GROUP_READ,
+                     priority=TelegramPriority.URGENT))
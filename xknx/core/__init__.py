@@ -1,6 +1,11 @@
 """Module for the automations and business logic of XKNX."""
 # flake8: noqa
 from .config import Config
+from .metrics import Metrics
+from .rate_limiter import RateLimiter
+from .response_registry import ResponseRegistry
+from .state_snapshot import StateSnapshot
+from .state_sync import StateSync
 from .stateupdater import StateUpdater
 from .telegram_queue import TelegramQueue
 from .value_reader import ValueReader
@@ -14,6 +14,8 @@ from xknx.exceptions import XKNXException
 from xknx.io import ConnectionConfig, ConnectionType
 from xknx.telegram import PhysicalAddress
 
+from .state_snapshot import StateSnapshot
+
 
 class Config:
     """Class for parsing xknx.yaml."""
@@ -43,6 +45,24 @@ class Config:
             if "rate_limit" in doc["general"]:
                 self.xknx.rate_limit = \
                     doc["general"]["rate_limit"]
+            if "rate_limit_burst" in doc["general"]:
+                self.xknx.rate_limit_burst = \
+                    doc["general"]["rate_limit_burst"]
+            if "slow_callback_threshold" in doc["general"]:
+                self.xknx.telegram_queue.slow_callback_threshold = \
+                    doc["general"]["slow_callback_threshold"]
+            if "callback_workers" in doc["general"]:
+                self.xknx.telegram_queue.callback_workers = \
+                    doc["general"]["callback_workers"]
+            if "state_sync_max_in_flight" in doc["general"]:
+                self.xknx.state_sync_max_in_flight = \
+                    doc["general"]["state_sync_max_in_flight"]
+            if "state_sync_timeout" in doc["general"]:
+                self.xknx.state_sync_timeout = \
+                    doc["general"]["state_sync_timeout"]
+            if "state_snapshot_file" in doc["general"]:
+                self.xknx.state_snapshot = StateSnapshot(
+                    self.xknx, doc["general"]["state_snapshot_file"])
 
     def parse_connection(self, doc):
         """Parse the connection section of xknx.yaml."""
@@ -74,6 +94,8 @@ class Config:
                     connection_config.gateway_port = value
                 elif pref == "local_ip":
                     connection_config.local_ip = value
+                elif pref == "window":
+                    connection_config.window = value
         self.xknx.connection_config = connection_config
 
     def parse_groups(self, doc):
@@ -0,0 +1,192 @@
+"""
+Module for collecting metrics of the hot paths of XKNX.
+
+Metrics is an optional registry (`XKNX(metrics=True)`, available as `xknx.metrics`) of
+* counters - e.g. datagrams received, parsed, filtered and failed by UDPClient, retries of TunnellingRequests,
+* gauges - e.g. the depth of the telegram queue, evaluated when exposed,
+* histograms - e.g. the time incoming telegrams waited within the queue, the delay of the rate limiter,
+  the round-trip time of TunnellingRequests and the execution time of every user callback.
+
+Instrumented code checks `xknx.metrics is not None` before measuring anything, so disabled metrics
+cost a single attribute lookup. Recording a value is an addition (histograms: a bisect over the buckets).
+`expose()` returns all metrics in the Prometheus text format, served by MetricsExporter.
+"""
+from bisect import bisect_left
+
+
+class Metrics:
+    """Class for registering and exposing metrics."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    # Upper bounds of histogram buckets in seconds
+    DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                       0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    class Counter:
+        """Monotonically increasing value."""
+
+        # pylint: disable=too-few-public-methods
+
+        def __init__(self):
+            """Initialize Counter class."""
+            self.value = 0
+
+        def inc(self, amount=1):
+            """Increase counter."""
+            self.value += amount
+
+        def samples(self, name, labels):
+            """Return samples in Prometheus text format."""
+            return ['{}{} {}'.format(name, Metrics.format_labels(labels), self.value)]
+
+    class Gauge:
+        """Value which may go up and down, or is evaluated by `function` when exposed."""
+
+        def __init__(self, function=None):
+            """Initialize Gauge class."""
+            self.function = function
+            self._value = 0
+
+        @property
+        def value(self):
+            """Return current value."""
+            if self.function is not None:
+                return self.function()
+            return self._value
+
+        def set(self, value):
+            """Set value."""
+            self._value = value
+
+        def samples(self, name, labels):
+            """Return samples in Prometheus text format."""
+            return ['{}{} {}'.format(name, Metrics.format_labels(labels), self.value)]
+
+    class Histogram:
+        """Distribution of observed values within buckets."""
+
+        def __init__(self, buckets):
+            """Initialize Histogram class."""
+            self.buckets = buckets
+            # Number of observations by bucket, not cumulative. Last one is +Inf.
+            self.counts = [0] * (len(buckets) + 1)
+            self.sum = 0
+            self.count = 0
+
+        def observe(self, value):
+            """Add observation."""
+            self.counts[bisect_left(self.buckets, value)] += 1
+            self.sum += value
+            self.count += 1
+
+        def samples(self, name, labels):
+            """Return samples in Prometheus text format."""
+            samples = []
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+                cumulative += count
+                samples.append('{}_bucket{} {}'.format(
+                    name, Metrics.format_labels(labels, le=bound), cumulative))
+            labels = Metrics.format_labels(labels)
+            samples.append('{}_sum{} {}'.format(name, labels, self.sum))
+            samples.append('{}_count{} {}'.format(name, labels, self.count))
+            return samples
+
+    class Family:
+        """Metrics of the same name, one for every combination of label values."""
+
+        # pylint: disable=too-few-public-methods
+
+        def __init__(self, metric_type, documentation):
+            """Initialize Family class."""
+            self.metric_type = metric_type
+            self.documentation = documentation
+            self.metrics = {}
+
+    def __init__(self, xknx):
+        """Initialize Metrics class and register the metrics of XKNX."""
+        self.xknx = xknx
+        self._families = {}
+        self.datagrams_received = self.counter(
+            'xknx_datagrams_received_total', 'Datagrams received by UDPClient.')
+        self.datagrams_filtered = self.counter(
+            'xknx_datagrams_filtered_total', 'Datagrams dropped by the group address filter without parsing.')
+        self.datagrams_parsed = self.counter(
+            'xknx_datagrams_parsed_total', 'Datagrams parsed to KNX/IP frames.')
+        self.datagrams_failed = self.counter(
+            'xknx_datagrams_failed_total', 'Datagrams which could not be parsed.')
+        self.gauge('xknx_telegram_queue_depth', 'Telegrams waiting within the telegram queue.',
+                   function=xknx.telegrams.qsize)
+        self.gauge('xknx_outgoing_queue_depth', 'Outgoing telegrams waiting for the rate limiter.',
+                   function=lambda: xknx.telegram_queue.outgoing_queue_depth)
+        self.telegram_queue_wait = self.histogram(
+            'xknx_telegram_queue_wait_seconds', 'Time received telegrams waited within the telegram queue.')
+        self.rate_limiter_delay = self.histogram(
+            'xknx_rate_limiter_delay_seconds', 'Time outgoing telegrams were delayed by the rate limiter.')
+        self.tunnelling_ack_time = self.histogram(
+            'xknx_tunnelling_ack_seconds', 'Time from sending a TunnellingRequest until its TunnellingAck.')
+        self.tunnelling_retries = self.counter(
+            'xknx_tunnelling_retries_total', 'TunnellingRequests repeated after timeout or error.')
+        self.tunnelling_failures = self.counter(
+            'xknx_tunnelling_failures_total', 'TunnellingRequests not acknowledged after being repeated.')
+        self.callbacks_dropped = self.counter(
+            'xknx_callbacks_dropped_total', 'Callbacks dropped because the queue of their callback worker was full.')
+        self.heartbeat_failures = self.counter(
+            'xknx_heartbeat_failures_total', 'ConnectionStateRequests of tunnels not answered successfully.')
+
+    def _metric(self, name, metric_type, documentation, labels, factory):
+        """Return metric of name and labels, registered by factory if not yet existing."""
+        # pylint: disable=too-many-arguments
+        family = self._families.get(name)
+        if family is None:
+            family = Metrics.Family(metric_type, documentation)
+            self._families[name] = family
+        key = tuple(sorted(labels.items())) if labels else ()
+        metric = family.metrics.get(key)
+        if metric is None:
+            metric = factory()
+            family.metrics[key] = metric
+        return metric
+
+    def counter(self, name, documentation, labels=None):
+        """Return counter of name and labels."""
+        return self._metric(name, 'counter', documentation, labels, Metrics.Counter)
+
+    def gauge(self, name, documentation, labels=None, function=None):
+        """Return gauge of name and labels. `function` is evaluated on exposition."""
+        return self._metric(name, 'gauge', documentation, labels, lambda: Metrics.Gauge(function))
+
+    def histogram(self, name, documentation, labels=None, buckets=DEFAULT_BUCKETS):
+        """Return histogram of name and labels."""
+        return self._metric(name, 'histogram', documentation, labels, lambda: Metrics.Histogram(tuple(buckets)))
+
+    def callback_time(self, callback):
+        """Return histogram of execution times of a telegram_received_cb or device_updated_cb."""
+        name = getattr(callback, '__qualname__', None) or repr(callback)
+        return self.histogram(
+            'xknx_callback_seconds', 'Execution time of telegram_received_cbs and device_updated_cbs.',
+            labels={'callback': name})
+
+    @staticmethod
+    def format_labels(labels, **extra):
+        """Return labels as Prometheus label set."""
+        labels = list(labels) + list(extra.items())
+        if not labels:
+            return ''
+        return '{' + ','.join('{}="{}"'.format(key, Metrics.escape(value)) for key, value in labels) + '}'
+
+    @staticmethod
+    def escape(value):
+        """Return label value escaped for Prometheus text format."""
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    def expose(self):
+        """Return all metrics in Prometheus text format."""
+        lines = []
+        for name, family in self._families.items():
+            lines.append('# HELP {} {}'.format(name, family.documentation))
+            lines.append('# TYPE {} {}'.format(name, family.metric_type))
+            for labels, metric in family.metrics.items():
+                lines.extend(metric.samples(name, labels))
+        return '\n'.join(lines) + '\n'
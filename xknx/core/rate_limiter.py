@@ -0,0 +1,68 @@
+"""
+Module for limiting the rate of outgoing telegrams.
+
+RateLimiter implements a token bucket: up to `burst` telegrams may be sent at once,
+afterwards the bucket is refilled with `rate` tokens per second.
+"""
+import asyncio
+import time
+
+
+class RateLimiter:
+    """Token bucket for limiting the rate of telegrams sent to the KNX bus."""
+
+    def __init__(self, rate, burst=1):
+        """Initialize RateLimiter class."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._last_refill = time.monotonic()
+
+    @property
+    def rate(self):
+        """Return refill rate in tokens per second. 0 or None disables rate limiting."""
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate):
+        """Set refill rate in tokens per second."""
+        self._refill()
+        self._rate = rate
+
+    @property
+    def burst(self):
+        """Return maximum number of tokens within the bucket."""
+        return self._burst
+
+    @burst.setter
+    def burst(self, burst):
+        """Set maximum number of tokens within the bucket."""
+        self._refill()
+        self._burst = burst
+        self._tokens = min(self._tokens, burst)
+
+    def _refill(self):
+        """Add tokens for the time passed since the last refill."""
+        now = time.monotonic()
+        if self._rate:
+            self._tokens = min(
+                self._burst,
+                self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+
+    def reserve(self):
+        """Take a token from the bucket. Return the time in seconds to wait until the token is available."""
+        if not self._rate:
+            return 0
+        self._refill()
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0
+        return -self._tokens / self._rate
+
+    async def acquire(self):
+        """Wait until a token is available and take it. Return the time in seconds waited."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
@@ -0,0 +1,124 @@
+"""
+Module for waiting for responses to GroupValueRead requests.
+
+ResponseRegistry
+* ... holds one future per group address, shared by all readers waiting for a value of this address.
+* ... resolves it by a dictionary lookup when a GroupValueResponse or GroupValueWrite is received,
+  instead of every reader registering its own telegram_received_cb.
+* ... lets concurrent readers of the same group address share one GroupValueRead on the bus.
+* ... records when the GroupValueRead was actually sent, so timeouts of readers don't include the time it
+  waited within the rate limited outgoing queue. If the TelegramQueue is not running, nobody sends it - the
+  timeout starts when it was queued then. Waiting for the send is limited by `send_timeout_in_seconds`.
+"""
+import asyncio
+
+from xknx.telegram import GroupAddress, Telegram, TelegramType
+
+
+class ResponseRegistry:
+    """Class for resolving futures waiting for a value of a group address."""
+
+    class Waiter:
+        """Future of a group address shared by several readers."""
+
+        # pylint: disable=too-few-public-methods
+
+        def __init__(self, future, sent):
+            """Initialize Waiter class."""
+            self.future = future
+            self.sent = sent
+            self.readers = 0
+
+    DEFAULT_SEND_TIMEOUT = 60
+
+    def __init__(self, xknx):
+        """Initialize ResponseRegistry class."""
+        self.xknx = xknx
+        # Waiters by raw group address
+        self._waiters = {}
+        # Seconds a reader waits for its GroupValueRead to be sent before its timeout starts anyway
+        self.send_timeout_in_seconds = ResponseRegistry.DEFAULT_SEND_TIMEOUT
+
+    def is_pending(self, group_address):
+        """Test if a reader is waiting for a value of group address."""
+        return group_address.raw in self._waiters
+
+    def register(self, group_address):
+        """Return future resolved with the next GroupValueResponse or GroupValueWrite telegram of group address."""
+        waiter = self._waiters.get(group_address.raw)
+        if waiter is None:
+            waiter = ResponseRegistry.Waiter(self.xknx.loop.create_future(), self.xknx.loop.create_future())
+            self._waiters[group_address.raw] = waiter
+        waiter.readers += 1
+        return waiter.future
+
+    def unregister(self, group_address, future):
+        """Release future returned by register(). The future is cancelled if no other reader waits for it."""
+        waiter = self._waiters.get(group_address.raw)
+        if waiter is None or waiter.future is not future:
+            # already resolved
+            return
+        waiter.readers -= 1
+        if waiter.readers <= 0:
+            del self._waiters[group_address.raw]
+            future.cancel()
+            waiter.sent.cancel()
+
+    async def wait_until_sent(self, group_address, future):
+        """
+        Wait until the GroupValueRead of group address was sent to the KNX bus or future returned by register() was resolved.
+
+        Returns at once if the TelegramQueue is not running, and after `send_timeout_in_seconds` at the latest.
+        """
+        waiter = self._waiters.get(group_address.raw)
+        if waiter is None or waiter.future is not future:
+            # already resolved
+            return
+        if not self.xknx.telegram_queue.running:
+            return
+        await asyncio.wait((waiter.sent, future), timeout=self.send_timeout_in_seconds,
+                           return_when=asyncio.FIRST_COMPLETED)
+
+    async def read(self, group_address, timeout_in_seconds=1):
+        """
+        Send GroupValueRead unless one is pending for group address and wait for the value.
+
+        The timeout starts when the GroupValueRead was sent to the KNX bus, not when it was queued.
+        Returns the received telegram or None if no value was received within timeout.
+        """
+        read_pending = self.is_pending(group_address)
+        future = self.register(group_address)
+        try:
+            if not read_pending:
+                await self.xknx.telegrams.put(
+                    Telegram(group_address, TelegramType.GROUP_READ, background=True))
+            await self.wait_until_sent(group_address, future)
+            return await asyncio.wait_for(asyncio.shield(future), timeout_in_seconds)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self.unregister(group_address, future)
+
+    def telegram_sent(self, telegram):
+        """Record GroupValueRead of telegram as sent. Called by TelegramQueue for every outgoing telegram."""
+        if telegram.telegramtype != TelegramType.GROUP_READ:
+            return
+        if not isinstance(telegram.group_address, GroupAddress):
+            return
+        waiter = self._waiters.get(telegram.group_address.raw)
+        if waiter is not None and not waiter.sent.done():
+            waiter.sent.set_result(None)
+
+    def telegram_received(self, telegram):
+        """Resolve future of the group address of telegram. Return True if any reader was waiting for it."""
+        if telegram.telegramtype not in (
+                TelegramType.GROUP_RESPONSE, TelegramType.GROUP_WRITE):
+            return False
+        if not isinstance(telegram.group_address, GroupAddress):
+            return False
+        waiter = self._waiters.pop(telegram.group_address.raw, None)
+        if waiter is None:
+            return False
+        if not waiter.future.done():
+            waiter.future.set_result(telegram)
+        return True
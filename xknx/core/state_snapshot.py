@@ -0,0 +1,177 @@
+"""
+Module for persisting the last known payloads of group addresses for warm restarts.
+
+StateSnapshot
+* ... records the payload of every incoming GroupValueWrite/GroupValueResponse.
+* ... appends changed payloads to a compact binary file, debounced by `debounce` seconds.
+  The file is rewritten once it holds more outdated than current records. Files are written
+  within an executor, so the event loop is not blocked by disk I/O.
+* ... restores the payloads into the devices at startup (without executing callbacks or actions) and marks
+  them as updated at their original time within the StateUpdater, so only stale values are read from the bus.
+
+File format: 8 byte magic, followed by records of
+    group address (2 bytes), unix time (8 byte double), payload type/length (1 byte), payload
+where the type/length byte is 0x80 | value for DPTBinary and the length of the payload for DPTArray.
+"""
+import asyncio
+import os
+import struct
+import time
+
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.exceptions import ConversionError
+from xknx.telegram import GroupAddress, TelegramType
+
+
+class StateSnapshot:
+    """Class for persisting the last known payloads of group addresses."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    MAGIC = b'XKNXST01'
+    RECORD_HEADER = struct.Struct('>HdB')
+    BINARY_FLAG = 0x80
+
+    def __init__(self, xknx, path, debounce=1):
+        """Initialize StateSnapshot class."""
+        self.xknx = xknx
+        self.path = path
+        self.debounce = debounce
+        # (unix time, payload) by group address
+        self.entries = {}
+        self._dirty = set()
+        self._records_in_file = 0
+        self._flush_handle = None
+        # Serializes writes of flush(), which run within an executor
+        self._write_lock = asyncio.Lock()
+
+    @classmethod
+    def encode_record(cls, group_address, timestamp, payload):
+        """Return binary record of payload."""
+        if isinstance(payload, DPTBinary):
+            return cls.RECORD_HEADER.pack(group_address.raw, timestamp, cls.BINARY_FLAG | payload.value)
+        value = bytes(payload.value)
+        return cls.RECORD_HEADER.pack(group_address.raw, timestamp, len(value)) + value
+
+    @classmethod
+    def decode_records(cls, data):
+        """Parse records of file content (without magic). Yield (group address, unix time, payload)."""
+        pos = 0
+        while pos + cls.RECORD_HEADER.size <= len(data):
+            raw, timestamp, length = cls.RECORD_HEADER.unpack_from(data, pos)
+            pos += cls.RECORD_HEADER.size
+            if length & cls.BINARY_FLAG:
+                payload = DPTBinary(length & ~cls.BINARY_FLAG)
+            else:
+                if pos + length > len(data):
+                    # truncated by an interrupted write
+                    return
+                payload = DPTArray(data[pos:pos + length])
+                pos += length
+            yield GroupAddress.from_raw(raw), timestamp, payload
+
+    def load(self):
+        """Read snapshot file. Return number of entries."""
+        try:
+            with open(self.path, 'rb') as snapshot_file:
+                data = snapshot_file.read()
+        except FileNotFoundError:
+            return 0
+        except OSError as ex:
+            self.xknx.logger.error("Error while reading state snapshot %s: %s", self.path, ex)
+            return 0
+        if not data.startswith(self.MAGIC):
+            self.xknx.logger.warning("Ignoring state snapshot %s with unknown format", self.path)
+            return 0
+        self._records_in_file = 0
+        for group_address, timestamp, payload in self.decode_records(data[len(self.MAGIC):]):
+            self.entries[group_address] = (timestamp, payload)
+            self._records_in_file += 1
+        return len(self.entries)
+
+    def restore(self):
+        """Restore payloads into devices and StateUpdater. Return number of restored group addresses."""
+        restored = 0
+        state_updater = self.xknx.state_updater
+        if state_updater is not None:
+            # convert unix time into loop time used by StateUpdater
+            loop_offset = self.xknx.loop.time() - time.time()
+        for group_address, (timestamp, payload) in sorted(self.entries.items(), key=lambda item: item[1][0]):
+            devices = list(self.xknx.devices.devices_by_group_address(group_address))
+            if not devices:
+                continue
+            for device in devices:
+                try:
+                    device.restore_payload(group_address, payload)
+                except ConversionError as ex:
+                    self.xknx.logger.warning("Could not restore state of %s: %s", device.name, ex)
+            if state_updater is not None:
+                state_updater.last_updated[group_address] = timestamp + loop_offset
+            restored += 1
+        self.xknx.logger.debug("Restored %s group addresses from state snapshot", restored)
+        return restored
+
+    def telegram_received(self, telegram):
+        """Record payload of incoming value. Called by TelegramQueue for every incoming telegram."""
+        if telegram.telegramtype not in (
+                TelegramType.GROUP_RESPONSE, TelegramType.GROUP_WRITE):
+            return
+        if not isinstance(telegram.group_address, GroupAddress) or \
+                not isinstance(telegram.payload, (DPTBinary, DPTArray)):
+            return
+        self.entries[telegram.group_address] = (time.time(), telegram.payload)
+        self._dirty.add(telegram.group_address)
+        if self._flush_handle is None:
+            self._flush_handle = self.xknx.loop.call_later(self.debounce, self._flush_due)
+
+    def _flush_due(self):
+        """Start writing changed payloads. Called by the debounce timer."""
+        self._flush_handle = None
+        self.xknx.loop.create_task(self.flush())
+
+    async def flush(self):
+        """Write changed payloads to snapshot file. The file is written within an executor, not on the event loop."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        async with self._write_lock:
+            if not self._dirty:
+                return
+            dirty, self._dirty = self._dirty, set()
+            if not self._records_in_file or self._records_in_file + len(dirty) > 2 * len(self.entries):
+                data = self.MAGIC + b''.join(
+                    self.encode_record(group_address, timestamp, payload)
+                    for group_address, (timestamp, payload) in self.entries.items())
+                records_in_file = len(self.entries)
+                write = self._write_all
+            else:
+                data = b''.join(
+                    self.encode_record(group_address, *self.entries[group_address])
+                    for group_address in dirty)
+                records_in_file = self._records_in_file + len(dirty)
+                write = self._append
+            try:
+                await self.xknx.loop.run_in_executor(None, write, data)
+            except OSError as ex:
+                self.xknx.logger.error("Error while writing state snapshot %s: %s", self.path, ex)
+                self._dirty.update(dirty)
+                return
+            self._records_in_file = records_in_file
+
+    def _append(self, data):
+        """Append records to snapshot file. A missing file is created with magic."""
+        with open(self.path, 'ab') as snapshot_file:
+            if not snapshot_file.tell():
+                snapshot_file.write(self.MAGIC)
+            snapshot_file.write(data)
+
+    def _write_all(self, data):
+        """Replace snapshot file by data."""
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as snapshot_file:
+            snapshot_file.write(data)
+        os.replace(tmp_path, self.path)
+
+    async def stop(self):
+        """Write pending changes to snapshot file."""
+        await self.flush()
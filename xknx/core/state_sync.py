@@ -0,0 +1,87 @@
+"""
+Module for reading the state of many devices from KNX bus concurrently.
+
+StateSync
+* ... collects the state addresses of all devices (reading an address shared by several devices once).
+* ... sends group reads concurrently, limited to `max_in_flight` unanswered reads.
+  Reads are background telegrams, so they are rate limited by the TelegramQueue and don't delay interactive telegrams.
+* ... waits for responses within the ResponseRegistry of xknx (sharing reads with concurrent ValueReaders).
+  The timeout of a read starts when it was sent, not while it waits for the rate limiter.
+* ... defaults to `state_sync_max_in_flight` and `state_sync_timeout` of xknx.
+* ... reports progress and failed group addresses in aggregate.
+
+Devices without state addresses (e.g. DateTime broadcasting the time) are synced by their own `sync()`.
+"""
+import asyncio
+
+from xknx.exceptions import XKNXException
+
+
+class StateSync:
+    """Class for reading the state of many devices from KNX bus concurrently."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, xknx, max_in_flight=None, timeout_in_seconds=None, progress_cb=None):
+        """Initialize StateSync class."""
+        # pylint: disable=too-many-arguments
+        self.xknx = xknx
+        self.max_in_flight = max_in_flight or xknx.state_sync_max_in_flight
+        self.timeout_in_seconds = timeout_in_seconds or xknx.state_sync_timeout
+        self.progress_cb = progress_cb
+        self.total = 0
+        self.succeeded = 0
+        self.failed = []
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+
+    @property
+    def completed(self):
+        """Return number of group addresses read or failed so far."""
+        return self.succeeded + len(self.failed)
+
+    async def sync(self, devices):
+        """Read state of devices from KNX bus."""
+        devices_by_address = {}
+        unaddressed_devices = []
+        for device in devices:
+            state_addresses = device.state_addresses()
+            if not state_addresses:
+                unaddressed_devices.append(device)
+            for group_address in state_addresses:
+                address_devices = devices_by_address.setdefault(group_address, [])
+                if not any(other is device for other in address_devices):
+                    address_devices.append(device)
+        self.xknx.logger.debug("Syncing %s group addresses of %s devices", len(devices_by_address), len(devices))
+
+        await asyncio.gather(
+            *(device.sync() for device in unaddressed_devices),
+            self.sync_group_addresses(devices_by_address))
+
+    async def sync_group_addresses(self, devices_by_address):
+        """Read group addresses and pass the responses to their devices. `devices_by_address` maps group addresses to lists of devices."""
+        self.total += len(devices_by_address)
+        await asyncio.gather(
+            *(self._read(group_address, devices)
+              for group_address, devices in devices_by_address.items()))
+
+        if self.failed:
+            self.xknx.logger.warning("Could not sync %s of %s group addresses: %s",
+                                     len(self.failed), self.total,
+                                     ", ".join(str(group_address) for group_address in self.failed))
+
+    async def _read(self, group_address, devices):
+        """Send group read, wait for response and pass it to devices."""
+        async with self._in_flight:
+            telegram = await self.xknx.response_registry.read(group_address, self.timeout_in_seconds)
+
+        if telegram is None:
+            self.failed.append(group_address)
+        else:
+            self.succeeded += 1
+            for device in devices:
+                try:
+                    await device.process(telegram)
+                except XKNXException as ex:
+                    self.xknx.logger.error("Error while syncing device: %s", ex)
+        if self.progress_cb is not None:
+            await self.progress_cb(self)
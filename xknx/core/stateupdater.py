@@ -1,20 +1,65 @@
-"""Module for reading the values of all devices from device vector from KNX bus in periodic cycles."""
+"""
+Module for keeping the values of all devices from device vector up to date.
+
+StateUpdater
+* ... records when each state group address was last updated by an incoming telegram.
+* ... reads a state group address only if its value is older than its maximum age
+  (`Device.state_max_age`, else `max_age_by_value_type` of the RemoteValue, else `timeout`).
+  Values passively observed on the bus are not read again.
+* ... schedules reads within a heap ordered by due time. Reads of the initial sync are spread evenly over
+  the maximum age, so later reads don't happen in bursts.
+* ... retries failed reads after `retry_delay` seconds, doubling the delay with every further failure up to the maximum age.
+* ... syncs devices without state addresses (e.g. DateTime broadcasting the time) every `timeout` seconds.
+* ... caches the state group addresses of all devices until devices are added or removed.
+* ... reads via StateSync with `max_in_flight` and `read_timeout_in_seconds`, defaulting to the settings of xknx.
+"""
 import asyncio
+import heapq
+from itertools import count
+
+from xknx.telegram import GroupAddress, TelegramType
+
+from .state_sync import StateSync
 
 
 class StateUpdater():
-    """Class for reading the values of all devices from KNX bus."""
+    """Class for keeping the values of all devices from KNX bus up to date."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    DEFAULT_RETRY_DELAY = 10
 
     def __init__(self,
                  xknx,
                  timeout=3600,
-                 start_timeout=10):
+                 start_timeout=10,
+                 max_age_by_value_type=None,
+                 max_in_flight=None,
+                 read_timeout_in_seconds=None,
+                 retry_delay=DEFAULT_RETRY_DELAY):
         """Initialize StateUpdater class."""
+        # pylint: disable=too-many-arguments
         self.xknx = xknx
         self.timeout = timeout
         self.start_timeout = start_timeout
+        self.max_age_by_value_type = max_age_by_value_type or {}
+        self.max_in_flight = max_in_flight
+        self.read_timeout_in_seconds = read_timeout_in_seconds
+        self.retry_delay = retry_delay
         self.run_forever = True
         self.run_task = None
+        # Time of last incoming value by group address
+        self.last_updated = {}
+        # Due time of next read by group address, and heap of [due time, sequence number, group address]
+        self._due = {}
+        self._schedule = []
+        self._schedule_sequence = count()
+        self._unaddressed_devices_due = None
+        # Number of consecutive failed reads by group address
+        self._failures = {}
+        # state_targets() with generation of xknx.devices they were built from
+        self._targets = None
+        self._targets_generation = None
 
     async def start(self):
         """Start StateUpdater."""
@@ -31,12 +76,148 @@ class StateUpdater():
             except asyncio.CancelledError:
                 self.run_task = None
 
+    def telegram_received(self, telegram):
+        """Record time of incoming value. Called by TelegramQueue for every incoming telegram."""
+        if telegram.telegramtype not in (
+                TelegramType.GROUP_RESPONSE, TelegramType.GROUP_WRITE):
+            return
+        if isinstance(telegram.group_address, GroupAddress):
+            self.last_updated[telegram.group_address] = self.xknx.loop.time()
+
+    def max_age(self, device, remote_value=None):
+        """Return maximum age in seconds of a state value of device."""
+        if device.state_max_age is not None:
+            return device.state_max_age
+        value_type = getattr(remote_value, 'value_type', None)
+        return self.max_age_by_value_type.get(value_type, self.timeout)
+
+    def state_targets(self):
+        """Return state group addresses of all devices with their maximum age and devices, and devices without state addresses."""
+        targets = {}
+        unaddressed_devices = []
+        for device in self.xknx.devices:
+            state_addresses = device.state_addresses()
+            if not state_addresses:
+                unaddressed_devices.append(device)
+                continue
+            max_ages = {}
+            for remote_value in device.remote_values():
+                for group_address in remote_value.state_addresses():
+                    max_ages[group_address] = self.max_age(device, remote_value)
+            for group_address in state_addresses:
+                max_age = max_ages.get(group_address, self.max_age(device))
+                target = targets.setdefault(group_address, [max_age, []])
+                target[0] = min(target[0], max_age)
+                if not any(other is device for other in target[1]):
+                    target[1].append(device)
+        return targets, unaddressed_devices
+
+    def cached_state_targets(self):
+        """Return state_targets(), built again only if devices were added or removed."""
+        generation = self.xknx.devices.generation
+        if self._targets is None or self._targets_generation != generation:
+            self._targets = self.state_targets()
+            self._targets_generation = generation
+        return self._targets
+
+    def retry_due(self, group_address, max_age, now):
+        """Return due time of the next read of group address after a failed read."""
+        failures = self._failures.get(group_address, 0) + 1
+        self._failures[group_address] = failures
+        return now + min(self.retry_delay * 2 ** (failures - 1), max_age)
+
+    def _schedule_read(self, group_address, due):
+        """Schedule read of group address at due time, replacing a previous one."""
+        self._due[group_address] = due
+        heapq.heappush(self._schedule, [due, next(self._schedule_sequence), group_address])
+
+    def _pop_due(self, targets, now):
+        """Return state group addresses due for reading at time now, mapped to their devices."""
+        due_addresses = {}
+        while self._schedule and self._schedule[0][0] <= now:
+            due, _, group_address = heapq.heappop(self._schedule)
+            if self._due.get(group_address) != due:
+                # superseded by a later entry
+                continue
+            target = targets.get(group_address)
+            if target is None:
+                # device was removed
+                del self._due[group_address]
+                self._failures.pop(group_address, None)
+                continue
+            max_age, devices = target
+            last_updated = self.last_updated.get(group_address)
+            if last_updated is not None and last_updated + max_age > now:
+                # value was updated passively in the meantime
+                self._failures.pop(group_address, None)
+                self._schedule_read(group_address, last_updated + max_age)
+                continue
+            due_addresses[group_address] = devices
+        return due_addresses
+
+    async def update(self):
+        """Read state group addresses due for reading. Return time of next due read."""
+        now = self.xknx.loop.time()
+        targets, unaddressed_devices = self.cached_state_targets()
+
+        # addresses seen for the first time: read now if value is unknown, their reads are spread afterwards
+        initial_addresses = []
+        for group_address, (max_age, _) in targets.items():
+            if group_address in self._due:
+                continue
+            last_updated = self.last_updated.get(group_address)
+            if last_updated is not None and last_updated + max_age > now:
+                self._schedule_read(group_address, last_updated + max_age)
+            else:
+                initial_addresses.append(group_address)
+                self._schedule_read(group_address, now)
+
+        due_addresses = self._pop_due(targets, now)
+        if unaddressed_devices and (self._unaddressed_devices_due is None or self._unaddressed_devices_due <= now):
+            self._unaddressed_devices_due = now + self.timeout
+        else:
+            unaddressed_devices = []
+        failed = set()
+        if due_addresses or unaddressed_devices:
+            self.xknx.logger.debug("Reading %s state group addresses", len(due_addresses))
+            state_sync = StateSync(self.xknx,
+                                   max_in_flight=self.max_in_flight,
+                                   timeout_in_seconds=self.read_timeout_in_seconds)
+            await asyncio.gather(
+                *(device.sync() for device in unaddressed_devices),
+                state_sync.sync_group_addresses(due_addresses))
+            failed.update(state_sync.failed)
+
+        now = self.xknx.loop.time()
+        for group_address in failed:
+            # unknown or outdated value: read again soon instead of after a full maximum age
+            self._schedule_read(group_address, self.retry_due(group_address, targets[group_address][0], now))
+            del due_addresses[group_address]
+        for group_address in due_addresses:
+            self._failures.pop(group_address, None)
+        initial_addresses = [group_address for group_address in initial_addresses if group_address in due_addresses]
+        for index, group_address in enumerate(initial_addresses):
+            max_age = targets[group_address][0]
+            self._schedule_read(group_address, now + max_age * (index + 1) / len(initial_addresses))
+            del due_addresses[group_address]
+        for group_address in due_addresses:
+            self._schedule_read(group_address, now + targets[group_address][0])
+
+        next_due = self._unaddressed_devices_due
+        if self._schedule and (next_due is None or self._schedule[0][0] < next_due):
+            next_due = self._schedule[0][0]
+        return next_due
+
     async def run(self):
         """Worker thread. Endless loop for updating states."""
         await asyncio.sleep(self.start_timeout)
         self.xknx.logger.debug("Starting StateUpdater")
         while True:
-            await self.xknx.devices.sync()
-            await asyncio.sleep(self.timeout)
+            next_due = await self.update()
             if not self.run_forever:
                 break
+            if next_due is None:
+                delay = self.timeout
+            else:
+                delay = max(next_due - self.xknx.loop.time(), 0)
+            await asyncio.sleep(delay)
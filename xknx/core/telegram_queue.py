@@ -5,41 +5,104 @@ When a device wants to sends a telegram to the KNX bus, it has to queue it to th
 
 The underlaying KNXIPInterface will poll the queue and send the packets to the correct KNX/IP abstraction (Tunneling or Routing).
 
+Outgoing telegrams are handed over to a separate pipeline limiting the rate of telegrams sent to the bus,
+so incoming telegrams are processed at full speed even while a burst of outgoing telegrams is being sent.
+Within this pipeline telegrams are sent by priority: higher KNX priorities first, and interactive telegrams
+before `background` telegrams (e.g. reads of the StateUpdater) of the same priority.
+A pending write marked as `coalesce` is replaced by a newer one to the same group address; the write keeps
+its place within the queue, and moves to the lane of the newer one if that has the higher priority.
+
 You may register callbacks to be notified if a telegram was pushed to the queue.
+
+User callbacks (telegram_received_cbs and device_updated_cbs) are run by `run_callback()`, which times them
+and logs a warning if one takes longer than `slow_callback_threshold` seconds. With `callback_workers` set,
+callbacks are handed over to a pool of that many worker tasks, so the dispatch loop never waits for consumer
+code - return values of telegram_received_cbs are ignored then. Callbacks are assigned to workers by a key
+(the group address of the telegram, the name of the updated device), so callbacks of the same key run in order.
+Each worker queues at most `max_queued_callbacks` callbacks; further ones are dropped with a warning and counted
+in `dropped_callbacks`.
 """
 import asyncio
+import time
+from collections import Counter
+from itertools import count
 
 from xknx.exceptions import XKNXException
-from xknx.telegram import TelegramDirection
+from xknx.telegram import (
+    AddressFilter, CompiledAddressFilter, TelegramDirection, TelegramPriority,
+    TelegramType)
+
+from .rate_limiter import RateLimiter
+
+# Marks a queued outgoing item re-queued with a higher priority by _coalesce()
+_SUPERSEDED = object()
 
 
 class TelegramQueue():
     """Class for telegram queue."""
 
+    # pylint: disable=too-many-instance-attributes
+
     class Callback:
         """Callback class for handling telegram received callbacks."""
 
         # pylint: disable=too-few-public-methods
 
         def __init__(self, callback, address_filters=None):
-            """Initialize Callback class."""
+            """Initialize Callback class. address_filters may be a list of AddressFilters or a CompiledAddressFilter."""
             self.callback = callback
             self.address_filters = address_filters
+            self._compiled_filter = None
+            if isinstance(address_filters, CompiledAddressFilter):
+                self._compiled_filter = address_filters
+            elif address_filters is not None and \
+                    all(isinstance(address_filter, AddressFilter) for address_filter in address_filters):
+                self._compiled_filter = CompiledAddressFilter(address_filters)
 
         def is_within_filter(self, telegram):
+            """Test if callback is filtering for group address."""
+            return self.is_within_filter_address(telegram.group_address)
+
+        def is_within_filter_address(self, group_address):
             """Test if callback is filtering for group address."""
             if self.address_filters is None:
                 return True
+            if self._compiled_filter is not None:
+                return self._compiled_filter.match(group_address)
             for address_filter in self.address_filters:
-                if address_filter.match(telegram.group_address):
+                if address_filter.match(group_address):
                     return True
             return False
 
+    DEFAULT_MAX_QUEUED_CALLBACKS = 1000
+
     def __init__(self, xknx):
         """Initialize TelegramQueue class."""
         self.xknx = xknx
         self.telegram_received_cbs = []
         self.queue_stopped = asyncio.Event()
+        # True from start() until run() stopped - outgoing telegrams are only sent meanwhile
+        self.running = False
+        self.rate_limiter = RateLimiter(xknx.DEFAULT_RATE_LIMIT, xknx.DEFAULT_RATE_LIMIT_BURST)
+        # Items are [lane, sequence number, telegram] - FIFO within a lane
+        self._outgoing_telegrams = asyncio.PriorityQueue()
+        self._outgoing_sequence = count()
+        # Number of superseded items still within the outgoing queue
+        self._superseded_items = 0
+        # Queued items of coalescable writes by raw group address
+        self._pending_writes = {}
+        # Number of writes replaced by newer ones by group address
+        self.coalesced_writes = Counter()
+        # Seconds a callback may take before a warning is logged. None disables warnings.
+        self.slow_callback_threshold = xknx.DEFAULT_SLOW_CALLBACK_THRESHOLD
+        # Number of worker tasks running callbacks concurrently. 0 runs callbacks within the dispatch loop.
+        self.callback_workers = 0
+        # Number of callbacks waiting for a worker, and number of callbacks dropped because a worker was that busy
+        self.max_queued_callbacks = TelegramQueue.DEFAULT_MAX_QUEUED_CALLBACKS
+        self.dropped_callbacks = 0
+        self._dropping_callbacks = False
+        self._callback_queues = []
+        self._callback_worker_tasks = []
 
     def register_telegram_received_cb(self, telegram_received_cb, address_filters=None):
         """Register callback for a telegram beeing received from KNX bus."""
@@ -51,28 +114,186 @@ class TelegramQueue():
         """Unregister callback for a telegram beeing received from KNX bus."""
         self.telegram_received_cbs.remove(telegram_received_cb)
 
+    def is_subscribed(self, group_address):
+        """
+        Test if telegrams to group address are consumed by a registered callback or a device.
+
+        Used as prefilter for received frames, so telegrams nobody listens to are not decoded at all.
+        """
+        for telegram_received_cb in self.telegram_received_cbs:
+            if telegram_received_cb.is_within_filter_address(group_address):
+                return True
+        return self.xknx.response_registry.is_pending(group_address) or \
+            self.xknx.devices.has_group_address(group_address)
+
     async def start(self):
         """Start telegram queue."""
+        self.running = True
         self.xknx.loop.create_task(self.run())
 
     async def run(self):
         """Endless loop for processing telegrams."""
+        self.running = True
+        outgoing_task = self.xknx.loop.create_task(self.run_outgoing())
+        self._callback_queues = [
+            asyncio.Queue(maxsize=self.max_queued_callbacks) for _ in range(self.callback_workers)]
+        self._callback_worker_tasks = [
+            self.xknx.loop.create_task(self.run_callbacks(callback_queue)) for callback_queue in self._callback_queues]
         while True:
-            telegram = await self.xknx.telegrams.get()
+            telegrams = [await self.xknx.telegrams.get()]
+            # Drain all telegrams already queued, so a burst is processed within one wakeup
+            while telegrams[-1] is not None and not self.xknx.telegrams.empty():
+                telegrams.append(self.xknx.telegrams.get_nowait())
 
             # Breaking up queue if None is pushed to the queue
-            if telegram is None:
+            if telegrams[-1] is None:
+                await self.process_telegrams(telegrams[:-1])
                 self.xknx.telegrams.task_done()
                 break
 
+            await self.process_telegrams(telegrams)
+
+        # Send remaining outgoing telegrams and run remaining callbacks before stopping
+        self._put_outgoing(None)
+        await outgoing_task
+        callback_queues, self._callback_queues = self._callback_queues, []
+        for callback_queue in callback_queues:
+            await callback_queue.put(None)
+        await asyncio.gather(*self._callback_worker_tasks)
+        self._callback_worker_tasks = []
+        self.running = False
+        self.queue_stopped.set()
+
+    async def run_callbacks(self, callback_queue):
+        """Worker running callbacks handed over by run_callback() in order."""
+        while True:
+            item = await callback_queue.get()
+            if item is None:
+                break
+            callback, args = item
+            try:
+                await self._run_callback_timed(callback, *args)
+            # pylint: disable=broad-except
+            except Exception:
+                self.xknx.logger.exception("Error within callback %s", _callback_name(callback))
+
+    async def run_callback(self, callback, *args, key=None):
+        """
+        Run user callback - timed within the dispatch loop, or by a worker if callback workers are running.
+
+        Callbacks of the same key are run by the same worker in the order they were passed.
+        """
+        if not self._callback_queues:
+            return await self._run_callback_timed(callback, *args)
+        callback_queue = self._callback_queues[hash(key) % len(self._callback_queues)]
+        try:
+            callback_queue.put_nowait((callback, args))
+            self._dropping_callbacks = False
+        except asyncio.QueueFull:
+            self.dropped_callbacks += 1
+            if self.xknx.metrics is not None:
+                self.xknx.metrics.callbacks_dropped.inc()
+            if not self._dropping_callbacks:
+                # warn once until a callback could be queued again
+                self._dropping_callbacks = True
+                self.xknx.logger.warning("Callback workers are busy, dropping callbacks (first: %s)",
+                                         _callback_name(callback))
+        return None
+
+    async def _run_callback_timed(self, callback, *args):
+        """Run callback, measure its execution time and warn if it was slow."""
+        start = time.monotonic()
+        try:
+            return await callback(*args)
+        finally:
+            duration = time.monotonic() - start
+            if self.xknx.metrics is not None:
+                self.xknx.metrics.callback_time(callback).observe(duration)
+            if self.slow_callback_threshold is not None and duration > self.slow_callback_threshold:
+                self.xknx.logger.warning("Callback %s took %.3f seconds", _callback_name(callback), duration)
+
+    async def run_outgoing(self):
+        """Endless loop for sending outgoing telegrams by priority within the rate limit."""
+        while True:
+            item = await self._outgoing_telegrams.get()
+            if item[2] is _SUPERSEDED:
+                self._superseded_items -= 1
+                continue
+            if item[2] is None:
+                break
+            # limit rate to knx bus - defaults to 20 per second
+            delay = await self.rate_limiter.acquire()
+            if self.xknx.metrics is not None:
+                self.xknx.metrics.rate_limiter_delay.observe(delay)
+            # a telegram with higher priority may have been queued while waiting
+            if not self._outgoing_telegrams.empty():
+                self._outgoing_telegrams.put_nowait(item)
+                item = self._outgoing_telegrams.get_nowait()
+                while item[2] is _SUPERSEDED:
+                    self._superseded_items -= 1
+                    item = self._outgoing_telegrams.get_nowait()
+            telegram = item[2]
+            if telegram.coalesce and self._pending_writes.get(telegram.group_address.raw) is item:
+                # later writes are queued again
+                del self._pending_writes[telegram.group_address.raw]
             await self.process_telegram(telegram)
+            # outgoing telegrams are done within xknx.telegrams after they were sent
             self.xknx.telegrams.task_done()
 
-            if telegram.direction == TelegramDirection.OUTGOING:
-                # limit rate to knx bus - defaults to 20 per second
-                await asyncio.sleep(1 / self.xknx.rate_limit)
+    def _put_outgoing(self, telegram):
+        """Queue telegram within outgoing pipeline. None stops run_outgoing() after all telegrams were sent."""
+        if telegram is None:
+            self._outgoing_telegrams.put_nowait(
+                [(len(TelegramPriority), True), next(self._outgoing_sequence), None])
+            return
+        coalesce = telegram.coalesce and telegram.telegramtype == TelegramType.GROUP_WRITE
+        if coalesce and self._coalesce(telegram):
+            return
+        item = [(telegram.priority.value, telegram.background), next(self._outgoing_sequence), telegram]
+        if coalesce:
+            self._pending_writes[telegram.group_address.raw] = item
+        self._outgoing_telegrams.put_nowait(item)
 
-        self.queue_stopped.set()
+    def _coalesce(self, telegram):
+        """
+        Replace pending write to the same group address by telegram. Return False if there is none.
+
+        The write keeps its place within the queue. If telegram has a higher priority than the pending write
+        (e.g. an interactive write replacing a background one), it is queued again within the lane of telegram.
+        """
+        item = self._pending_writes.get(telegram.group_address.raw)
+        if item is None:
+            return False
+        lane = (telegram.priority.value, telegram.background)
+        if lane < item[0]:
+            # queued items can't be reordered - the old one is skipped by run_outgoing()
+            item[2] = _SUPERSEDED
+            self._superseded_items += 1
+            item = [lane, item[1], telegram]
+            self._pending_writes[telegram.group_address.raw] = item
+            self._outgoing_telegrams.put_nowait(item)
+        else:
+            item[2] = telegram
+        self.coalesced_writes[telegram.group_address] += 1
+        # the superseded telegram will never be sent
+        self.xknx.telegrams.task_done()
+        return True
+
+    @property
+    def outgoing_queue_depth(self):
+        """Return number of outgoing telegrams waiting to be sent."""
+        return self._outgoing_telegrams.qsize() - self._superseded_items
+
+    async def process_telegrams(self, telegrams):
+        """Process a batch of telegrams taken from the queue in order. Outgoing telegrams are passed to run_outgoing()."""
+        for telegram in telegrams:
+            if telegram.direction == TelegramDirection.OUTGOING:
+                self._put_outgoing(telegram)
+                continue
+            if self.xknx.metrics is not None and telegram.timestamp is not None:
+                self.xknx.metrics.telegram_queue_wait.observe(time.monotonic() - telegram.timestamp)
+            await self.process_telegram(telegram)
+            self.xknx.telegrams.task_done()
 
     async def stop(self):
         """Stop telegram queue."""
@@ -101,17 +322,25 @@ class TelegramQueue():
 
     async def process_telegram_outgoing(self, telegram):
         """Process outgoing telegram."""
-        if self.xknx.knxip_interface is not None:
-            await self.xknx.knxip_interface.send_telegram(telegram)
-        else:
-            self.xknx.logger.warning("No KNXIP interface defined")
+        try:
+            if self.xknx.knxip_interface is not None:
+                await self.xknx.knxip_interface.send_telegram(telegram)
+            else:
+                self.xknx.logger.warning("No KNXIP interface defined")
+        finally:
+            # timeouts of readers start now - also if sending failed, so they don't wait forever
+            self.xknx.response_registry.telegram_sent(telegram)
 
     async def process_telegram_incoming(self, telegram):
-        """Process incoming telegram."""
-        processed = False
+        """Process incoming telegram. Telegrams awaited by readers are not passed to devices."""
+        if self.xknx.state_updater is not None:
+            self.xknx.state_updater.telegram_received(telegram)
+        if self.xknx.state_snapshot is not None:
+            self.xknx.state_snapshot.telegram_received(telegram)
+        processed = self.xknx.response_registry.telegram_received(telegram)
         for telegram_received_cb in self.telegram_received_cbs:
             if telegram_received_cb.is_within_filter(telegram):
-                ret = await telegram_received_cb.callback(telegram)
+                ret = await self.run_callback(telegram_received_cb.callback, telegram, key=telegram.group_address)
                 if ret:
                     processed = True
 
@@ -119,3 +348,8 @@ class TelegramQueue():
             for device in self.xknx.devices.devices_by_group_address(
                     telegram.group_address):
                 await device.process(telegram)
+
+
+def _callback_name(callback):
+    """Return name of callback for logging and metrics."""
+    return getattr(callback, '__qualname__', None) or repr(callback)
@@ -100,6 +100,12 @@ class BinarySensor(Device):
         """Test if device has given group address."""
         return group_address in [self.group_address_state]
 
+    def group_addresses(self):
+        """Return all group addresses this device is listening to."""
+        if isinstance(self.group_address_state, GroupAddress):
+            return [self.group_address_state]
+        return []
+
     def state_addresses(self):
         """Return group addresses which should be requested to sync state."""
         if self.sync_state and \
@@ -107,6 +113,17 @@ class BinarySensor(Device):
             return [self.group_address_state, ]
         return []
 
+    def restore_payload(self, group_address, payload):
+        """Restore state from a payload of group address received before. Actions are not executed."""
+        if not self.has_group_address(group_address) or not isinstance(payload, DPTBinary):
+            return
+        if self.reset_after is not None:
+            # state of push buttons is only temporary
+            return
+        bit_masq = 1 << (self.significant_bit-1)
+        self.state = BinarySensorState.OFF \
+            if payload.value & bit_masq == 0 else BinarySensorState.ON
+
     async def _set_internal_state(self, state):
         """Set the internal state of the device. If state was changed after update hooks and connected Actions are executed."""
         if state != self.state or self.ignore_internal_state:
@@ -41,12 +41,9 @@ class SetpointShiftValue(RemoteValue1Count):
         self.min_temp_delta = min_temp_delta
         self.max_temp_delta = max_temp_delta
 
-    @property
-    def value(self):
-        """Return current value in Kelvin."""
-        if super().value is None:
-            return None
-        return super().value * self.setpoint_shift_step
+    def from_knx(self, payload):
+        """Convert current payload to value in Kelvin."""
+        return super().from_knx(payload) * self.setpoint_shift_step
 
     async def set(self, value):
         """Set new value from Kelvin."""
@@ -197,6 +194,17 @@ class Climate(Device):
             self._setpoint_shift.has_group_address(group_address) or \
             self.on.has_group_address(group_address)
 
+    def remote_values(self):
+        """Return all RemoteValue objects of this device."""
+        return [self.temperature, self.target_temperature, self._setpoint_shift, self.on]
+
+    def group_addresses(self):
+        """Return all group addresses this device is listening to."""
+        group_addresses = super().group_addresses()
+        if self.mode is not None:
+            group_addresses.extend(self.mode.group_addresses())
+        return group_addresses
+
     @property
     def is_on(self):
         """Return power status."""
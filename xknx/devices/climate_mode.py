@@ -134,6 +134,20 @@ class ClimateMode(Device):
              self.group_address_controller_mode,
              self.group_address_controller_mode_state]
 
+    def group_addresses(self):
+        """Return all group addresses this device is listening to."""
+        return [group_address for group_address in
+                (self.group_address_operation_mode,
+                 self.group_address_operation_mode_state,
+                 self.group_address_operation_mode_protection,
+                 self.group_address_operation_mode_night,
+                 self.group_address_operation_mode_comfort,
+                 self.group_address_controller_status,
+                 self.group_address_controller_status_state,
+                 self.group_address_controller_mode,
+                 self.group_address_controller_mode_state)
+                if isinstance(group_address, GroupAddress)]
+
     async def _set_internal_operation_mode(self, operation_mode):
         """Set internal value of operation mode. Call hooks if operation mode was changed."""
         if operation_mode != self.operation_mode:
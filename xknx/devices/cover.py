@@ -131,6 +131,10 @@ class Cover(Device):
             or self.position.has_group_address(group_address) \
             or self.angle.has_group_address(group_address)
 
+    def remote_values(self):
+        """Return all RemoteValue objects of this device."""
+        return [self.updown, self.step, self.position, self.angle]
+
     def __str__(self):
         """Return object as readable string."""
         return '<Cover name="{0}" ' \
@@ -243,6 +247,12 @@ class Cover(Device):
 
         await self.angle.process(telegram)
 
+    def restore_payload(self, group_address, payload):
+        """Restore state from a payload of group address received before. Callbacks are not executed."""
+        super().restore_payload(group_address, payload)
+        if self.position.has_group_address(group_address) and self.position.payload is not None:
+            self.travelcalculator.set_position(self.position.value)
+
     def current_position(self):
         """Return current position of cover."""
         return self.travelcalculator.current_position()
@@ -57,26 +57,35 @@ class DateTime(Device):
         """Test if device has given group address."""
         return self.group_address == group_address
 
+    def group_addresses(self):
+        """Return all group addresses this device is listening to."""
+        if isinstance(self.group_address, GroupAddress):
+            return [self.group_address]
+        return []
+
     async def broadcast_time(self, response):
-        """Broadcast time to KNX bus."""
+        """Broadcast time to KNX bus. Periodic broadcasts are sent as background telegrams."""
         if self.broadcast_type == DateTimeBroadcastType.DATETIME:
             broadcast_data = DPTDateTime.current_datetime_as_knx()
             await self.send(
                 self.group_address,
                 DPTArray(broadcast_data),
-                response=response)
+                response=response,
+                background=not response)
         elif self.broadcast_type == DateTimeBroadcastType.DATE:
             broadcast_data = DPTDate.current_date_as_knx()
             await self.send(
                 self.group_address,
                 DPTArray(broadcast_data),
-                response=response)
+                response=response,
+                background=not response)
         elif self.broadcast_type == DateTimeBroadcastType.TIME:
             broadcast_data = DPTTime.current_time_as_knx()
             await self.send(
                 self.group_address,
                 DPTArray(broadcast_data),
-                response=response)
+                response=response,
+                background=not response)
 
     async def process_group_read(self, telegram):
         """Process incoming GROUP RESPONSE telegram."""
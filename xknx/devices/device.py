@@ -15,9 +15,24 @@ class Device:
         self.xknx = xknx
         self.name = name
         self.device_updated_cbs = []
+        self._coalesce_writes = False
+        # Maximum age in seconds of state values before the StateUpdater reads them again. None for default.
+        self.state_max_age = None
         if device_updated_cb is not None:
             self.register_device_updated_cb(device_updated_cb)
 
+    @property
+    def coalesce_writes(self):
+        """Return if pending writes of this device are replaced by newer ones within the outgoing queue."""
+        return self._coalesce_writes
+
+    @coalesce_writes.setter
+    def coalesce_writes(self, coalesce_writes):
+        """Set if pending writes of this device (and all its RemoteValues) are replaced by newer ones."""
+        self._coalesce_writes = coalesce_writes
+        for remote_value in self.remote_values():
+            remote_value.coalesce_writes = coalesce_writes
+
     def register_device_updated_cb(self, device_updated_cb):
         """Register device updated callback."""
         self.device_updated_cbs.append(device_updated_cb)
@@ -27,10 +42,9 @@ class Device:
         self.device_updated_cbs.remove(device_updated_cb)
 
     async def after_update(self):
-        """Execute callbacks after internal state has been changed."""
+        """Execute callbacks after internal state has been changed. Callbacks are run by the TelegramQueue."""
         for device_updated_cb in self.device_updated_cbs:
-            # pylint: disable=not-callable
-            await device_updated_cb(self)
+            await self.xknx.telegram_queue.run_callback(device_updated_cb, self, key=self.name)
 
     async def sync(self, wait_for_result=True):
         """Read state of device from KNX bus."""
@@ -54,13 +68,15 @@ class Device:
                 await value_reader.send_group_read()
 
     # TODO: remove need for send function in device - only use set and RemoteValue.send
-    async def send(self, group_address, payload=None, response=False):
-        """Send payload as telegram to KNX bus."""
+    async def send(self, group_address, payload=None, response=False, background=False):
+        """Send payload as telegram to KNX bus. Background telegrams are sent after interactive ones."""
         telegram = Telegram()
         telegram.group_address = group_address
         telegram.payload = payload
         telegram.telegramtype = TelegramType.GROUP_RESPONSE \
             if response else TelegramType.GROUP_WRITE
+        telegram.background = background
+        telegram.coalesce = self._coalesce_writes and not response
         await self.xknx.telegrams.put(telegram)
 
     def state_addresses(self):
@@ -68,6 +84,24 @@ class Device:
         # pylint: disable=no-self-use
         return []
 
+    def remote_values(self):
+        """Return all RemoteValue objects of this device."""
+        # pylint: disable=no-self-use
+        return []
+
+    def restore_payload(self, group_address, payload):
+        """Restore state from a payload of group address received before (e.g. by a StateSnapshot). Callbacks are not executed."""
+        for remote_value in self.remote_values():
+            if remote_value.has_group_address(group_address) and remote_value.payload_valid(payload):
+                remote_value.payload = payload
+
+    def group_addresses(self):
+        """Return all group addresses this device is listening to."""
+        group_addresses = []
+        for remote_value in self.remote_values():
+            group_addresses.extend(remote_value.group_addresses())
+        return group_addresses
+
     async def process(self, telegram):
         """Process incoming telegram."""
         if telegram.telegramtype == TelegramType.GROUP_WRITE:
@@ -2,16 +2,32 @@
 Module for handling a vector/array of devices.
 
 More or less an array with devices. Adds some search functionality to find devices.
+
+Devices are indexed by name and by the raw value of the group addresses they
+listen to, so looking up the receivers of an incoming telegram does not need
+to iterate over all devices. The group addresses are indexed when a device is
+added - call `reindex()` after changing group addresses of a device afterwards.
 """
+from xknx.telegram import GroupAddress
+
 from .device import Device
 
 
 class Devices:
     """Class for handling a vector/array of devices."""
 
+    # pylint: disable=too-many-instance-attributes
+
     def __init__(self):
         """Initialize Devices class."""
         self.__devices = []
+        self.__devices_by_name = {}
+        self.__devices_by_group_address = {}
+        # Devices not announcing their group addresses are scanned via has_group_address()
+        self.__unindexed_devices = []
+        self.__position = {}
+        self.__counter = 0
+        self.__generation = 0
         self.device_updated_cbs = []
 
     def register_device_updated_cb(self, device_updated_cb):
@@ -28,29 +44,47 @@ class Devices:
 
     def devices_by_group_address(self, group_address):
         """Return device(s) by group address."""
-        for device in self.__devices:
-            if device.has_group_address(group_address):
-                yield device
+        if isinstance(group_address, GroupAddress):
+            indexed = self.__devices_by_group_address.get(group_address.raw, ())
+        else:
+            indexed = ()
+        if not self.__unindexed_devices:
+            return iter(indexed)
+        scanned = [device for device in self.__unindexed_devices
+                   if device.has_group_address(group_address)]
+        if not scanned:
+            return iter(indexed)
+        return iter(sorted(list(indexed) + scanned,
+                           key=lambda device: self.__position[id(device)]))
+
+    def has_group_address(self, group_address):
+        """Test if any device listens to group address."""
+        if group_address.raw in self.__devices_by_group_address:
+            return True
+        return any(device.has_group_address(group_address)
+                   for device in self.__unindexed_devices)
 
     def __getitem__(self, key):
         """Return device by name or by index."""
-        for device in self.__devices:
-            if device.name == key:
-                return device
+        device = self.__devices_by_name.get(key)
+        if device is not None:
+            return device
         if isinstance(key, int):
             return self.__devices[key]
         raise KeyError
 
+    @property
+    def generation(self):
+        """Return number of times devices were added, removed or reindexed. Lets users cache data derived from all devices."""
+        return self.__generation
+
     def __len__(self):
         """Return number of devices within vector."""
         return len(self.__devices)
 
     def __contains__(self, key):
         """Return if devices with name 'key' is within devices."""
-        for device in self.__devices:
-            if device.name == key:
-                return True
-        return False
+        return key in self.__devices_by_name
 
     def add(self, device):
         """Add device to devices vector."""
@@ -58,13 +92,92 @@ class Devices:
             raise TypeError()
         device.register_device_updated_cb(self.device_updated)
         self.__devices.append(device)
+        self.__position[id(device)] = self.__counter
+        self.__counter += 1
+        self.__generation += 1
+        self.__devices_by_name.setdefault(device.name, device)
+        self._index_device(device)
+
+    def remove(self, device):
+        """Remove device from devices vector."""
+        for index, known_device in enumerate(self.__devices):
+            if known_device is device:
+                del self.__devices[index]
+                break
+        else:
+            raise ValueError("Device not within devices vector")
+        device.unregister_device_updated_cb(self.device_updated)
+        self.__generation += 1
+        self._unindex_device(device)
+        del self.__position[id(device)]
+        if self.__devices_by_name.get(device.name) is device:
+            del self.__devices_by_name[device.name]
+            for other_device in self.__devices:
+                if other_device.name == device.name:
+                    self.__devices_by_name[device.name] = other_device
+                    break
+
+    def reindex(self, device):
+        """Update group address index of device. Required after group addresses of an added device were changed."""
+        if id(device) not in self.__position:
+            raise ValueError("Device not within devices vector")
+        self.__generation += 1
+        self._unindex_device(device)
+        self._index_device(device)
+
+    def _index_device(self, device):
+        """Add device to the group address index."""
+        group_addresses = device.group_addresses()
+        if not group_addresses:
+            self.__unindexed_devices.append(device)
+            return
+        position = self.__position[id(device)]
+        for raw in {group_address.raw for group_address in group_addresses}:
+            indexed = self.__devices_by_group_address.setdefault(raw, [])
+            indexed.append(device)
+            if len(indexed) > 1 and self.__position[id(indexed[-2])] > position:
+                # reindexed device - keep devices in the order they were added
+                indexed.sort(key=lambda other: self.__position[id(other)])
+
+    def _unindex_device(self, device):
+        """Remove device from the group address index."""
+        self.__unindexed_devices = [
+            other for other in self.__unindexed_devices if other is not device]
+        _remove_from_index(self.__devices_by_group_address, device)
 
     async def device_updated(self, device):
-        """Call all registered device updated callbacks of device."""
+        """
+        Call all registered device updated callbacks of device. Registered at every device added.
+
+        Each callback is run by the TelegramQueue on its own, so its execution time is measured separately.
+        With callback workers they are queued behind this call for the same device, so they still run in order.
+        """
         for device_updated_cb in self.device_updated_cbs:
-            await device_updated_cb(device)
+            await device.xknx.telegram_queue.run_callback(device_updated_cb, device, key=device.name)
+
+    async def sync(self, max_in_flight=None, progress_cb=None):
+        """
+        Read state of devices from KNX bus.
+
+        Group reads are sent concurrently, at most `max_in_flight` (default `xknx.state_sync_max_in_flight`) at a time.
+        Returns the StateSync object holding the numbers of succeeded and failed reads.
+        """
+        from xknx.core.state_sync import StateSync
+        if not self.__devices:
+            return None
+        state_sync = StateSync(
+            self.__devices[0].xknx,
+            max_in_flight=max_in_flight,
+            progress_cb=progress_cb)
+        await state_sync.sync(self.__devices)
+        return state_sync
+
 
-    async def sync(self):
-        """Read state of devices from KNX bus."""
-        for device in self.__devices:
-            await device.sync()
+def _remove_from_index(index, item):
+    """Remove all occurences of item from a group address index."""
+    for raw in list(index):
+        remaining = [other for other in index[raw] if other is not item]
+        if remaining:
+            index[raw] = remaining
+        else:
+            del index[raw]
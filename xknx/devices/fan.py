@@ -54,6 +54,10 @@ class Fan(Device):
         """Test if device has given group address."""
         return self.speed.has_group_address(group_address)
 
+    def remote_values(self):
+        """Return all RemoteValue objects of this device."""
+        return [self.speed]
+
     def __str__(self):
         """Return object as readable string."""
         return '<Fan name="{0}" ' \
@@ -179,6 +179,11 @@ class Light(Device):
                 self.tunable_white.has_group_address(group_address) or
                 self.color_temperature.has_group_address(group_address))
 
+    def remote_values(self):
+        """Return all RemoteValue objects of this device."""
+        return [self.switch, self.brightness, self.color, self.rgbw,
+                self.tunable_white, self.color_temperature]
+
     def __str__(self):
         """Return object as readable string."""
         str_brightness = '' if not self.supports_brightness else \
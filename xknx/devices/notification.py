@@ -54,6 +54,10 @@ class Notification(Device):
         """Test if device has given group address."""
         return self._message.has_group_address(group_address)
 
+    def remote_values(self):
+        """Return all RemoteValue objects of this device."""
+        return [self._message]
+
     def state_addresses(self):
         """Return group addresses which should be requested to sync state."""
         return self._message.state_addresses()
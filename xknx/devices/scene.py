@@ -41,6 +41,10 @@ class Scene(Device):
         """Test if device has given group address."""
         return self.scene_value.has_group_address(group_address)
 
+    def remote_values(self):
+        """Return all RemoteValue objects of this device."""
+        return [self.scene_value]
+
     def __str__(self):
         """Return object as readable string."""
         return '<Scene name="{0}" ' \
@@ -48,6 +48,10 @@ class Switch(Device):
         """Test if device has given group address."""
         return self.switch.has_group_address(group_address)
 
+    def remote_values(self):
+        """Return all RemoteValue objects of this device."""
+        return [self.switch]
+
     @property
     def state(self):
         """Return the current switch state of the device."""
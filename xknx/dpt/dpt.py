@@ -1,8 +1,15 @@
 """Implementation of Basic KNX datatypes."""
+import re
 from enum import Enum
 
 from xknx.exceptions import ConversionError
 
+try:
+    import numpy
+except ImportError:
+    # optional dependency of the batch codecs (`pip install xknx[numpy]`)
+    numpy = None
+
 
 class DPTBase:
     """
@@ -42,6 +49,24 @@ class DPTBase:
     """
 
     # pylint: disable=too-few-public-methods
+
+    # DPT number, e.g. 9 and 1 for DPT 9.001 (sub number None for generic DPTs like DPT 9.***)
+    dpt_main_number = None
+    dpt_sub_number = None
+    # Name of the DPT used e.g. as value_type of sensors
+    value_type = None
+
+    # Value types without DPT class of their own
+    VALUE_TYPE_ALIASES = {
+        '1byte_unsigned': 'pulse',
+        'DPT-5': 'pulse',
+    }
+    DPT_NUMBER_PATTERN = re.compile(r'^(?:DPT-?)?(\d+)(?:\.(\d+|\*+))?$')
+
+    # DPT classes by (main, sub) number and by value type, indexed on first lookup
+    _transcoders_by_dpt = None
+    _transcoders_by_value_type = None
+
     @staticmethod
     def test_bytesarray(raw, length):
         """Test if array of raw bytes has the correct length and values of correct type."""
@@ -52,6 +77,123 @@ class DPTBase:
                 or any(byte > 255 for byte in raw):
             raise ConversionError("Invalid raw bytes", raw=raw)
 
+    # Big endian NumPy dtype of the payload, if from_knx/to_knx equal a plain conversion of this type
+    _numpy_dtype = None
+
+    @classmethod
+    def from_knx_many(cls, raw):
+        """
+        Parse/deserialize many payloads at once. Requires NumPy.
+
+        `raw` is a contiguous buffer of concatenated payloads (e.g. bytes) or a 2-D uint8 array
+        with one payload per row. Returns a NumPy array of the values.
+        """
+        # from_knx is defined by the DPT subclasses
+        # pylint: disable=no-member
+        payloads = cls._payload_array(raw)
+        if cls._numpy_dtype is not None:
+            return numpy.ascontiguousarray(payloads).view(cls._numpy_dtype)[:, 0].astype(cls._numpy_dtype[1:])
+        return numpy.array([cls.from_knx(tuple(payload.tolist())) for payload in payloads])
+
+    @classmethod
+    def to_knx_many(cls, values):
+        """Serialize many values at once to a 2-D uint8 array with one payload per row. Requires NumPy."""
+        # to_knx, value_min, value_max and payload_length are defined by the DPT subclasses
+        # pylint: disable=no-member
+        require_numpy()
+        if cls._numpy_dtype is None:
+            payloads = numpy.array([cls.to_knx(value) for value in values], dtype=numpy.uint8)
+            return payloads.reshape(len(payloads), -1)
+        try:
+            knx_values = numpy.asarray(values, dtype=numpy.float64).reshape(-1)
+        except (TypeError, ValueError):
+            raise ConversionError("Cant serialize %s" % cls.__name__, value=values)
+        if cls._numpy_dtype[1] == 'f':
+            limit = numpy.finfo(cls._numpy_dtype).max
+            invalid = numpy.isfinite(knx_values) & (numpy.abs(knx_values) > limit)
+        else:
+            knx_values = numpy.trunc(knx_values)
+            invalid = ~((cls.value_min <= knx_values) & (knx_values <= cls.value_max))
+        if invalid.any():
+            raise ConversionError("Cant serialize %s" % cls.__name__, value=knx_values[invalid][0])
+        return knx_values.astype(cls._numpy_dtype).view(numpy.uint8).reshape(-1, cls.payload_length)
+
+    @classmethod
+    def _payload_array(cls, raw):
+        """Return raw data as 2-D uint8 array with one payload per row."""
+        require_numpy()
+        payloads = raw if isinstance(raw, numpy.ndarray) else numpy.frombuffer(raw, dtype=numpy.uint8)
+        payload_length = getattr(cls, 'payload_length', None)
+        if payloads.ndim == 1 and payload_length and not payloads.size % payload_length:
+            payloads = payloads.reshape(-1, payload_length)
+        if payloads.dtype != numpy.uint8 or payloads.ndim != 2 \
+                or (payload_length and payloads.shape[1] != payload_length):
+            raise ConversionError("Invalid raw bytes", dtype=payloads.dtype, shape=payloads.shape)
+        return payloads
+
+    @staticmethod
+    def _index_transcoders():
+        """Index all subclasses of DPTBase by the DPT number and value type they define."""
+        transcoders_by_dpt = {}
+        transcoders_by_value_type = {}
+        dpt_classes = DPTBase.__subclasses__()
+        while dpt_classes:
+            dpt_class = dpt_classes.pop()
+            dpt_classes.extend(dpt_class.__subclasses__())
+            if 'dpt_main_number' in vars(dpt_class):
+                transcoders_by_dpt[(dpt_class.dpt_main_number, dpt_class.dpt_sub_number)] = dpt_class
+            if 'value_type' in vars(dpt_class):
+                transcoders_by_value_type[dpt_class.value_type] = dpt_class
+        DPTBase._transcoders_by_dpt = transcoders_by_dpt
+        DPTBase._transcoders_by_value_type = transcoders_by_value_type
+
+    @staticmethod
+    def transcoder_by_dpt(dpt_main_number, dpt_sub_number=None):
+        """Return DPT class of DPT number or None. Classes defined after the first lookup are indexed on a miss."""
+        key = (dpt_main_number, dpt_sub_number)
+        if DPTBase._transcoders_by_dpt is None or key not in DPTBase._transcoders_by_dpt:
+            DPTBase._index_transcoders()
+        return DPTBase._transcoders_by_dpt.get(key)
+
+    @staticmethod
+    def transcoder_by_value_type(value_type):
+        """Return DPT class of value type or None."""
+        value_type = DPTBase.VALUE_TYPE_ALIASES.get(value_type, value_type)
+        if DPTBase._transcoders_by_value_type is None or value_type not in DPTBase._transcoders_by_value_type:
+            DPTBase._index_transcoders()
+        return DPTBase._transcoders_by_value_type.get(value_type)
+
+    @staticmethod
+    def parse_transcoder(value_type):
+        """Return DPT class of value type (e.g. 'temperature') or DPT number (e.g. '9.001', 'DPT-9') or None."""
+        value_type = DPTBase.VALUE_TYPE_ALIASES.get(value_type, value_type)
+        match = DPTBase.DPT_NUMBER_PATTERN.match(str(value_type))
+        if match is None:
+            return DPTBase.transcoder_by_value_type(value_type)
+        dpt_sub_number = match.group(2)
+        return DPTBase.transcoder_by_dpt(
+            int(match.group(1)),
+            int(dpt_sub_number) if dpt_sub_number is not None and dpt_sub_number.isdigit() else None)
+
+    @staticmethod
+    def value_types():
+        """Return dict of all value types (including aliases and generic DPTs like 'DPT-9') and their DPT classes."""
+        if DPTBase._transcoders_by_value_type is None:
+            DPTBase._index_transcoders()
+        value_types = dict(DPTBase._transcoders_by_value_type)
+        for (dpt_main_number, dpt_sub_number), dpt_class in DPTBase._transcoders_by_dpt.items():
+            if dpt_sub_number is None:
+                value_types['DPT-%d' % dpt_main_number] = dpt_class
+        for alias in DPTBase.VALUE_TYPE_ALIASES:
+            value_types[alias] = DPTBase.parse_transcoder(alias)
+        return value_types
+
+
+def require_numpy():
+    """Raise ImportError if NumPy, an optional dependency of the batch codecs, is not installed."""
+    if numpy is None:
+        raise ImportError("NumPy is required for from_knx_many/to_knx_many: pip install xknx[numpy]")
+
 
 class DPTBinary(DPTBase):
     """The DPTBinary is a base class for all datatypes encoded directly into the first Byte of the payload (mostly integer)."""
@@ -88,7 +230,7 @@ class DPTArray(DPTBase):
         """Initialize DPTArray class."""
         if isinstance(value, int):
             self.value = (value,)
-        elif isinstance(value, (list, bytes)):
+        elif isinstance(value, (list, bytes, bytearray, memoryview)):
             self.value = tuple(value,)
         elif isinstance(value, tuple):
             self.value = value
@@ -12,6 +12,8 @@ class DPTSignedRelativeValue(DPTBase):
     DPT 6.***
     """
 
+    dpt_main_number = 6
+    dpt_sub_number = None
     value_min = -128
     value_max = 127
     unit = ""
@@ -50,6 +52,9 @@ class DPTPercentV8(DPTSignedRelativeValue):
     DPT 6.001
     """
 
+    dpt_main_number = 6
+    dpt_sub_number = 1
+    value_type = "percentV8"
     unit = "%"
 
 
@@ -59,4 +64,7 @@ class DPTValue1Count(DPTSignedRelativeValue):
     DPT 6.010
     """
 
+    dpt_main_number = 6
+    dpt_sub_number = 10
+    value_type = "counter_pulses"
     unit = "counter pulses"
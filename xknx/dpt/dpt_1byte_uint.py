@@ -11,6 +11,9 @@ class DPTValue1Ucount(DPTBase):
     DPT 5.010
     """
 
+    dpt_main_number = 5
+    dpt_sub_number = 10
+    value_type = "pulse"
     value_min = 0
     value_max = 255
     unit = ""
@@ -53,6 +56,9 @@ class DPTPercentU8(DPTValue1Ucount):
     DPT 5.004
     """
 
+    dpt_main_number = 5
+    dpt_sub_number = 4
+    value_type = "percentU8"
     unit = "%"
 
 
@@ -63,6 +69,9 @@ class DPTDecimalFactor(DPTValue1Ucount):
     DPT 5.005
     """
 
+    dpt_main_number = 5
+    dpt_sub_number = 5
+
 
 class DPTTariff(DPTValue1Ucount):
     """
@@ -71,6 +80,8 @@ class DPTTariff(DPTValue1Ucount):
     DPT 5.006
     """
 
+    dpt_main_number = 5
+    dpt_sub_number = 6
     value_max = 254
 
 
@@ -81,6 +92,9 @@ class DPTSceneNumber(DPTValue1Ucount):
     DPT 17.001
     """
 
+    dpt_main_number = 17
+    dpt_sub_number = 1
+    value_type = "scene_number"
     value_min = 1
     value_max = 64
 
@@ -6,7 +6,12 @@ They correspond to the the following KDN DPT 9 class.
 
 from xknx.exceptions import ConversionError
 
-from .dpt import DPTBase
+from .dpt import DPTBase, require_numpy
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class DPT2ByteFloat(DPTBase):
@@ -16,27 +21,43 @@ class DPT2ByteFloat(DPTBase):
     DPT 9.***
     """
 
+    dpt_main_number = 9
+    dpt_sub_number = None
     value_min = -671088.64
     value_max = 670760.96
     unit = ""
     resolution = 1
     payload_length = 2
 
+    # Values of all 65,536 raw values shared by all DPT 9 classes, built on first use
+    _decode_table = ()
+
+    @staticmethod
+    def decode_table():
+        """Return tuple of the values of all 65,536 raw values (unchecked boundaries), indexed by raw[0] * 256 + raw[1]."""
+        if not DPT2ByteFloat._decode_table:
+            # sign and 11 bit significand (two's complement) shifted by the 4 bit exponent, in units of 0.01
+            DPT2ByteFloat._decode_table = tuple([
+                (((data & 0x7ff) - ((data >> 15) << 11)) << ((data >> 11) & 0x0f)) / 100
+                for data in range(65536)])
+        return DPT2ByteFloat._decode_table
+
+    @staticmethod
+    def _raw_data(raw):
+        """Return 16 bit raw data of raw bytes. Plain tuples of two bytes are checked without test_bytesarray()."""
+        if raw.__class__ is tuple and len(raw) == 2:
+            high, low = raw
+            if high.__class__ is int and low.__class__ is int and 0 <= high <= 255 and 0 <= low <= 255:
+                return (high << 8) | low
+        DPTBase.test_bytesarray(raw, 2)
+        return (raw[0] << 8) | raw[1]
+
     @classmethod
     def from_knx(cls, raw):
         """Parse/deserialize from KNX/IP raw data."""
-        cls.test_bytesarray(raw, 2)
-        data = (raw[0] * 256) + raw[1]
-        exponent = (data >> 11) & 0x0f
-        significand = data & 0x7ff
-        sign = data >> 15
+        value = DPT2ByteFloat.decode_table()[cls._raw_data(raw)]
 
-        if sign == 1:
-            significand = significand - 2048
-
-        value = float(significand << exponent) / 100
-
-        if not cls._test_boundaries(value):
+        if not cls.value_min <= value <= cls.value_max:
             raise ConversionError("Cant parse %s" % cls.__name__, value=value)
 
         return value
@@ -44,28 +65,24 @@ class DPT2ByteFloat(DPTBase):
     @classmethod
     def to_knx(cls, value):
         """Serialize to KNX/IP raw data."""
-        def calc_exponent(float_value, sign):
-            """Return float exponent."""
-            exponent = 0
-            significand = abs(int(float_value * 100))
-
-            while significand < -2048 or significand > 2048:
-                exponent += 1
-                significand >>= 1
-
-            if sign:
-                significand ^= 0x7ff  # invert
-                significand += 1     # and add 1
-
-            return exponent, significand
-
         try:
             knx_value = float(value)
-            if not cls._test_boundaries(knx_value):
+            if not cls.value_min <= knx_value <= cls.value_max:
                 raise ValueError
 
             sign = 1 if knx_value < 0 else 0
-            exponent, significand = calc_exponent(knx_value, sign)
+            significand = abs(int(knx_value * 100))
+            # smallest exponent shifting the significand to 2048 or below
+            exponent = significand.bit_length() - 11
+            if exponent <= 0:
+                exponent = 0
+            elif significand >> (exponent - 1) <= 2048:
+                exponent -= 1
+            significand >>= exponent
+
+            if sign:
+                significand ^= 0x7ff  # invert
+                significand += 1     # and add 1
 
             return (sign << 7) | (exponent << 3) | (significand >> 8), \
                 significand & 0xff
@@ -73,14 +90,53 @@ class DPT2ByteFloat(DPTBase):
             raise ConversionError("Cant serialize %s" % cls.__name__, value=value)
 
     @classmethod
-    def _test_boundaries(cls, value):
-        """Test if value is within defined range for this object."""
-        return cls.value_min <= value <= cls.value_max
+    def from_knx_many(cls, raw):
+        """Parse/deserialize many payloads at once to a NumPy array. Requires NumPy."""
+        payloads = cls._payload_array(raw)
+        data = (payloads[:, 0].astype(numpy.int64) << 8) | payloads[:, 1]
+        exponent = (data >> 11) & 0x0f
+        significand = (data & 0x7ff) - ((data >> 15) << 11)
+        values = (significand << exponent) / 100
+
+        invalid = (values < cls.value_min) | (values > cls.value_max)
+        if invalid.any():
+            raise ConversionError("Cant parse %s" % cls.__name__, value=values[invalid][0])
+
+        return values
+
+    @classmethod
+    def to_knx_many(cls, values):
+        """Serialize many values at once to a 2-D uint8 array with one payload per row. Requires NumPy."""
+        require_numpy()
+        try:
+            knx_values = numpy.asarray(values, dtype=numpy.float64).reshape(-1)
+        except (TypeError, ValueError):
+            raise ConversionError("Cant serialize %s" % cls.__name__, value=values)
+        invalid = ~((cls.value_min <= knx_values) & (knx_values <= cls.value_max))
+        if invalid.any():
+            raise ConversionError("Cant serialize %s" % cls.__name__, value=knx_values[invalid][0])
+
+        sign = (knx_values < 0).astype(numpy.int64)
+        significand = numpy.abs(numpy.trunc(knx_values * 100)).astype(numpy.int64)
+        # same exponent as to_knx(): frexp returns the bit length of the significand
+        exponent = numpy.frexp(significand)[1].astype(numpy.int64) - 11
+        smaller = (exponent > 0) & ((significand >> numpy.maximum(exponent - 1, 0)) <= 2048)
+        exponent = numpy.maximum(exponent - smaller, 0)
+        significand >>= exponent
+        significand = numpy.where(sign, (significand ^ 0x7ff) + 1, significand)
+
+        payloads = numpy.empty((len(knx_values), 2), dtype=numpy.uint8)
+        payloads[:, 0] = (sign << 7) | (exponent << 3) | (significand >> 8)
+        payloads[:, 1] = significand & 0xff
+        return payloads
 
 
 class DPTTemperature(DPT2ByteFloat):
     """DPT 9.001 DPT_Value_Temp."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 1
+    value_type = "temperature"
     value_min = -273
     value_max = 670760
     unit = "°C"
@@ -91,6 +147,9 @@ class DPTTemperature(DPT2ByteFloat):
 class DPTTemperatureDifference2Byte(DPT2ByteFloat):
     """DPT 9.002 DPT_Value_Tempd."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 2
+    value_type = "temperature_difference_2byte"
     value_min = -670760
     value_max = 670760
     unit = "K"
@@ -101,6 +160,9 @@ class DPTTemperatureDifference2Byte(DPT2ByteFloat):
 class DPTTemperatureA(DPT2ByteFloat):
     """DPT 9.003 DPT_Value_Tempa."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 3
+    value_type = "temperature_a"
     value_min = -670760
     value_max = 670760
     unit = "K/h"
@@ -110,6 +172,9 @@ class DPTTemperatureA(DPT2ByteFloat):
 class DPTLux(DPT2ByteFloat):
     """DPT 9.004 DPT_Value_Lux."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 4
+    value_type = "illuminance"
     value_min = 0
     value_max = 670760
     unit = "lx"
@@ -120,6 +185,9 @@ class DPTLux(DPT2ByteFloat):
 class DPTWsp(DPT2ByteFloat):
     """DPT 9.005 DPT_Value_Ws Speed (m/s)."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 5
+    value_type = "wind_speed_ms"
     value_min = 0
     value_max = 670760
     unit = "m/s"
@@ -129,6 +197,9 @@ class DPTWsp(DPT2ByteFloat):
 class DPTPressure2Byte(DPT2ByteFloat):
     """DPT 9.006 DPT_Value_Pres (Pa)."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 6
+    value_type = "pressure_2byte"
     value_min = 0
     value_max = 670760
     unit = "Pa"
@@ -139,6 +210,9 @@ class DPTPressure2Byte(DPT2ByteFloat):
 class DPTHumidity(DPT2ByteFloat):
     """DPT 9.007 DPT_Value_Humidity."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 7
+    value_type = "humidity"
     value_min = 0
     value_max = 670760
     unit = "%"
@@ -149,12 +223,18 @@ class DPTHumidity(DPT2ByteFloat):
 class DPTPartsPerMillion(DPT2ByteFloat):
     """DPT 9.008 DPT_Value_parts/million."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 8
+    value_type = "ppm"
     unit = "ppm"
 
 
 class DPTTime1(DPT2ByteFloat):
     """DPT 9.010 DPT_Value_Time1 (s)."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 10
+    value_type = "time_1"
     value_min = -670760
     value_max = 670760
     unit = "s"
@@ -164,6 +244,9 @@ class DPTTime1(DPT2ByteFloat):
 class DPTTime2(DPT2ByteFloat):
     """DPT 9.011 DPT_Value_Time2 (ms)."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 11
+    value_type = "time_2"
     value_min = -670760
     value_max = 670760
     unit = "ms"
@@ -173,30 +256,44 @@ class DPTTime2(DPT2ByteFloat):
 class DPTVoltage(DPT2ByteFloat):
     """DPT 9.020 DPT_Value_Voltage."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 20
+    value_type = "voltage"
     unit = "mV"
 
 
 class DPTCurrent(DPT2ByteFloat):
     """DPT 9.021 DPT_Value_Curr (mA)."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 21
     unit = "mA"
 
 
 class DPTPowerDensity(DPT2ByteFloat):
     """DPT 9.022 DPT_PowerDensity (W/m²)."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 22
+    value_type = "power_density"
     unit = "W/m²"
 
 
 class DPTKelvinPerPercent(DPT2ByteFloat):
     """DPT 9.023 DPT_KelvinPerPercent (K/%)."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 23
+    value_type = "kelvin_per_percent"
     unit = "K/%"
 
 
 class DPTPower2Byte(DPT2ByteFloat):
     """DPT 9.024 DPT_Power (kW)."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 24
+    value_type = "power_2byte"
     unit = "kW"
     ha_device_class = "power"
 
@@ -204,12 +301,18 @@ class DPTPower2Byte(DPT2ByteFloat):
 class DPTVolumeFlow(DPT2ByteFloat):
     """DPT 9.025 DPT_Value_Volume_Flow (l/h)."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 25
+    value_type = "volume_flow"
     unit = "l/h"
 
 
 class DPTRainAmount(DPT2ByteFloat):
     """DPT 9.026 DPT_Rain_Amount (l/m²)."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 26
+    value_type = "rain_amount"
     value_min = -671088.64
     value_max = 670760.96
     unit = "l/m²"
@@ -218,6 +321,9 @@ class DPTRainAmount(DPT2ByteFloat):
 class DPTTemperatureF(DPT2ByteFloat):
     """DPT 9.027 DPT_Value_Temp_F."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 27
+    value_type = "temperature_f"
     value_min = -459.6
     value_max = 670760
     unit = "°F"
@@ -228,6 +334,9 @@ class DPTTemperatureF(DPT2ByteFloat):
 class DPTWspKmh(DPT2ByteFloat):
     """DPT 9.028 DPT_Value_Wsp_kmh Speed (km/h)."""
 
+    dpt_main_number = 9
+    dpt_sub_number = 28
+    value_type = "wind_speed_kmh"
     value_min = 0
     value_max = 670760
     unit = "km/h"
@@ -237,4 +346,5 @@ class DPTWspKmh(DPT2ByteFloat):
 class DPTEnthalpy(DPT2ByteFloat):
     """DPT 9.* 2-byte float value (with unit)."""
 
+    value_type = "enthalpy"
     unit = "H"
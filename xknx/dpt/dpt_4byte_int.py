@@ -20,6 +20,9 @@ class DPT4ByteUnsigned(DPTBase):
     DPT 12.***
     """
 
+    dpt_main_number = 12
+    dpt_sub_number = None
+    value_type = "4byte_unsigned"
     value_min = 0
     value_max = 4294967295
     unit = ""
@@ -27,6 +30,7 @@ class DPT4ByteUnsigned(DPTBase):
     payload_length = 4
 
     _struct_format = ">I"
+    _numpy_dtype = ">u4"
 
     @classmethod
     def from_knx(cls, raw):
@@ -62,23 +66,32 @@ class DPT4ByteSigned(DPT4ByteUnsigned):
     DPT 13.***
     """
 
+    dpt_main_number = 13
+    dpt_sub_number = None
+    value_type = "4byte_signed"
     value_min = -2147483648
     value_max = 2147483647
     unit = ""
     resolution = 1
 
     _struct_format = ">i"
+    _numpy_dtype = ">i4"
 
 
 class DPTValue4Count(DPT4ByteSigned):
     """DPT 13.001 DPT_Value_4_Count (pulse)."""
 
+    dpt_main_number = 13
+    dpt_sub_number = 1
     unit = "pulses"
 
 
 class DPTFlowRateM3H(DPT4ByteSigned):
     """DPT 13.002 DPT_FlowRate_m3/h (m³/h)."""
 
+    dpt_main_number = 13
+    dpt_sub_number = 2
+    value_type = "flow_rate_m3h"
     unit = "m³/h"
     resolution = 0.0001
 
@@ -86,40 +99,61 @@ class DPTFlowRateM3H(DPT4ByteSigned):
 class DPTActiveEnergy(DPT4ByteSigned):
     """DPT 13.010 DPT_ActiveEnergy (Wh)."""
 
+    dpt_main_number = 13
+    dpt_sub_number = 10
+    value_type = "active_energy"
     unit = "Wh"
 
 
 class DPTApparantEnergy(DPT4ByteSigned):
     """DPT 13.011 DPT_ActiveEnergy (VAh)."""
 
+    dpt_main_number = 13
+    dpt_sub_number = 11
+    value_type = "apparant_energy"
     unit = "VAh"
 
 
 class DPTReactiveEnergy(DPT4ByteSigned):
     """DPT 13.012 DPT_ActiveEnergy (VARh)."""
 
+    dpt_main_number = 13
+    dpt_sub_number = 12
+    value_type = "reactive_energy"
     unit = "VARh"
 
 
 class DPTActiveEnergykWh(DPT4ByteSigned):
     """DPT 13.013 DPT_ActiveEnergy_kWh (kWh)."""
 
+    dpt_main_number = 13
+    dpt_sub_number = 13
+    value_type = "active_energy_kwh"
     unit = "kWh"
 
 
 class DPTApparantEnergykVAh(DPT4ByteSigned):
     """DPT 13.014 DPT_ActiveEnergy_kVAh (kVAh)."""
 
+    dpt_main_number = 13
+    dpt_sub_number = 14
+    value_type = "apparant_energy_kvah"
     unit = "kVAh"
 
 
 class DPTReactiveEnergykVARh(DPT4ByteSigned):
     """DPT 13.015 DPT_ActiveEnergy (kVARh)."""
 
+    dpt_main_number = 13
+    dpt_sub_number = 15
+    value_type = "reactive_energy_kvarh"
     unit = "kVARh"
 
 
 class DPTLongDeltaTimeSec(DPT4ByteSigned):
     """DPT 13.100 DPT_LongDeltaTimeSec (s)."""
 
+    dpt_main_number = 13
+    dpt_sub_number = 100
+    value_type = "long_delta_timesec"
     unit = "s"
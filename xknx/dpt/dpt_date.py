@@ -10,6 +10,9 @@ from .dpt import DPTBase
 class DPTDate(DPTBase):
     """Abstraction for KNX 3 octet date (DPT 11.001)."""
 
+    dpt_main_number = 11
+    dpt_sub_number = 1
+
     @classmethod
     def from_knx(cls, raw):
         """Parse/deserialize from KNX/IP raw data."""
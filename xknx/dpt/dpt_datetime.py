@@ -10,6 +10,9 @@ from .dpt import DPTBase, DPTWeekday
 class DPTDateTime(DPTBase):
     """Abstraction for KNX 8 octet datetime (DPT 19.001)."""
 
+    dpt_main_number = 19
+    dpt_sub_number = 1
+
     @classmethod
     def from_knx(cls, raw):
         """Parse/deserialize from KNX/IP raw data."""
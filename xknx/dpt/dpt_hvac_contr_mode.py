@@ -13,6 +13,8 @@ class DPTHVACContrMode(DPTBase):
     DPT 20.105
     """
 
+    dpt_main_number = 20
+    dpt_sub_number = 105
     SUPPORTED_MODES = {
         0: HVACOperationMode.AUTO,
         1: HVACOperationMode.HEAT,
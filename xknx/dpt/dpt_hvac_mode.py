@@ -37,6 +37,9 @@ class DPTHVACMode(DPTBase):
     DPT 20.102
     """
 
+    dpt_main_number = 20
+    dpt_sub_number = 102
+
     @classmethod
     def from_knx(cls, raw):
         """Parse/deserialize from KNX/IP raw data."""
@@ -11,6 +11,9 @@ class DPTScaling(DPTBase):
     DPT 5.001
     """
 
+    dpt_main_number = 5
+    dpt_sub_number = 1
+    value_type = "percent"
     value_min = 0
     value_max = 100
     resolution = 100/255
@@ -58,6 +61,9 @@ class DPTAngle(DPTScaling):
     DPT 5.003
     """
 
+    dpt_main_number = 5
+    dpt_sub_number = 3
+    value_type = "angle"
     value_min = 0
     value_max = 360
     resolution = 360/255
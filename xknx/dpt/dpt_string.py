@@ -11,6 +11,9 @@ class DPTString(DPTBase):
     DPT 16.000
     """
 
+    dpt_main_number = 16
+    dpt_sub_number = 0
+    value_type = "string"
     payload_length = 14
     unit = ""
 
@@ -14,6 +14,9 @@ class DPTTime(DPTBase):
     DPT 10.001
     """
 
+    dpt_main_number = 10
+    dpt_sub_number = 1
+
     @classmethod
     def from_knx(cls, raw):
         """Parse/deserialize from KNX/IP raw data."""
@@ -5,6 +5,9 @@ This package contains all objects managing Tunneling and Routing Connections..
 - GatewayScanner searches for available KNX/IP devices in the local network.
 - Routing uses UDP/Multicast to communicate with KNX/IP device.
 - Tunnelling uses UDP packets and builds a static tunnel with KNX/IP device.
+- GatewaySimulator simulates a KNX/IP gateway on a local UDP port for testing.
+- TelegramRecorder records received frames to a file, TelegramReplayer replays them.
+- MetricsExporter serves the metrics of XKNX in Prometheus text format.
 """
 # flake8: noqa
 from .connect import Connect
@@ -12,9 +15,14 @@ from .connectionstate import ConnectionState
 from .const import DEFAULT_MCAST_GRP, DEFAULT_MCAST_PORT
 from .disconnect import Disconnect
 from .gateway_scanner import GatewayScanFilter, GatewayScanner
+from .gateway_simulator import GatewaySimulator
 from .knxip_interface import ConnectionConfig, ConnectionType, KNXIPInterface
+from .metrics_exporter import MetricsExporter
 from .request_response import RequestResponse
 from .routing import Routing
+from .telegram_recorder import TelegramRecorder, TelegramRecording
+from .telegram_replayer import TelegramReplayer
 from .tunnel import Tunnel
 from .tunnelling import Tunnelling
+from .tunnelling_sender import TunnellingSender
 from .udp_client import UDPClient
@@ -1,6 +1,7 @@
 """Abstraction to send ConnectRequest and wait for ConnectResponse."""
 from xknx.knxip import (
     HPAI, ConnectRequestType, ConnectResponse, KNXIPFrame, KNXIPServiceType)
+from xknx.telegram import PhysicalAddress
 
 from .request_response import RequestResponse
 
@@ -34,5 +35,5 @@ class Connect(RequestResponse):
         """Set communication channel and identifier after having received a valid answer."""
         self.communication_channel = knxipframe.body.communication_channel
         self.identifier = knxipframe.body.identifier
-        # Use the address they gave us
-        self.xknx.own_address.raw = self.identifier
+        # Use the address they gave us. Addresses are immutable, so replace it.
+        self.xknx.own_address = PhysicalAddress(self.identifier)
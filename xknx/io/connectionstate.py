@@ -14,6 +14,10 @@ class ConnectionState(RequestResponse):
         super().__init__(xknx, self.udp_client, ConnectionStateResponse)
         self.communication_channel_id = communication_channel_id
 
+    def response_key(self):
+        """Return key identifying the awaited response."""
+        return self.communication_channel_id
+
     def create_knxipframe(self):
         """Create KNX/IP Frame object to be sent to device."""
         (local_addr, local_port) = self.udpclient.getsockname()
@@ -0,0 +1,277 @@
+"""
+Simulated KNX/IP gateway for testing and load testing without hardware.
+
+GatewaySimulator listens on a local UDP port (e.g. loopback) and speaks
+* SEARCH_REQUEST/RESPONSE (unicast - send the request to the simulator's port),
+* CONNECT, CONNECTIONSTATE and DISCONNECT requests of tunnelling connections,
+* TUNNELLING_REQUEST/ACK in both directions,
+* ROUTING_INDICATION with peers which sent a routing indication to the simulator (or were added to `routing_peers`).
+
+Telegrams received from a client are put onto a simulated bus, limited to `bus_rate` telegrams per second,
+and delivered to all other tunnelling connections and routing peers. `send_telegram()` injects a telegram
+as if sent by a device on the bus. Datagrams are delayed by `latency`, acks additionally by `ack_delay`,
+and dropped in either direction with probability `loss` - drawn from a random generator seeded by `seed`,
+so runs are repeatable. Frames are built with the knxip body classes used by the clients.
+"""
+import asyncio
+import random
+
+from xknx.exceptions import CouldNotParseKNXIP
+from xknx.knxip import (
+    HPAI, CEMIMessageCode, ConnectRequestType, DIBDeviceInformation,
+    DIBServiceFamily, DIBSuppSVCFamilies, ErrorCode, KNXIPFrame,
+    KNXIPServiceType)
+from xknx.telegram import PhysicalAddress, TelegramDirection
+
+
+class GatewaySimulator:
+    """Class for simulating a KNX/IP tunnelling server and router."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    class Connection:
+        """Tunnelling connection of a client."""
+
+        # pylint: disable=too-few-public-methods
+
+        def __init__(self, communication_channel_id, addr, individual_address):
+            """Initialize Connection class."""
+            self.communication_channel_id = communication_channel_id
+            self.addr = addr
+            self.individual_address = individual_address
+            # sequence counter of next TunnellingRequest sent to the client
+            self.sequence_counter = 0
+            # sequence counter of next TunnellingRequest expected from the client
+            self.expected_sequence_counter = 0
+
+    class Protocol(asyncio.DatagramProtocol):
+        """Datagram protocol passing received datagrams to the simulator."""
+
+        def __init__(self, simulator):
+            """Initialize Protocol class."""
+            self.simulator = simulator
+
+        def datagram_received(self, data, addr):
+            """Pass datagram to simulator."""
+            self.simulator.datagram_received(data, addr)
+
+    def __init__(self, xknx, local_addr=('127.0.0.1', 0),
+                 individual_address=PhysicalAddress('1.1.0'), name='xknx simulator',
+                 latency=0, loss=0, ack_delay=0, bus_rate=None, max_connections=4, seed=None):
+        """Initialize GatewaySimulator class."""
+        # pylint: disable=too-many-arguments
+        self.xknx = xknx
+        self.local_addr = local_addr
+        self.individual_address = individual_address
+        self.name = name
+        self.latency = latency
+        self.loss = loss
+        self.ack_delay = ack_delay
+        self.bus_rate = bus_rate
+        self.max_connections = max_connections
+        self.connections = {}
+        self.routing_peers = set()
+        # Number of telegrams put onto the simulated bus by clients and of datagrams dropped
+        self.bus_telegrams = 0
+        self.lost_datagrams = 0
+        # Called with every telegram put onto the simulated bus by a client
+        self.bus_telegram_cb = None
+        self.transport = None
+        self._random = random.Random(seed)
+        self._bus_free_at = 0
+        self._handlers = {
+            KNXIPServiceType.SEARCH_REQUEST: self._search_request,
+            KNXIPServiceType.CONNECT_REQUEST: self._connect_request,
+            KNXIPServiceType.CONNECTIONSTATE_REQUEST: self._connectionstate_request,
+            KNXIPServiceType.DISCONNECT_REQUEST: self._disconnect_request,
+            KNXIPServiceType.TUNNELLING_REQUEST: self._tunnelling_request,
+            KNXIPServiceType.TUNNELLING_ACK: self._tunnelling_ack,
+            KNXIPServiceType.ROUTING_INDICATION: self._routing_indication,
+        }
+
+    async def start(self):
+        """Open UDP port. `local_addr` is updated to the bound address."""
+        (self.transport, _) = await self.xknx.loop.create_datagram_endpoint(
+            lambda: GatewaySimulator.Protocol(self), local_addr=self.local_addr)
+        self.local_addr = self.transport.get_extra_info('sockname')[:2]
+
+    async def stop(self):
+        """Close UDP port."""
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+
+    def drop_connections(self):
+        """Forget all tunnelling connections, e.g. to test reconnecting of clients."""
+        self.connections.clear()
+
+    def _lost(self):
+        """Test if the next datagram is lost."""
+        if self.loss and self._random.random() < self.loss:
+            self.lost_datagrams += 1
+            return True
+        return False
+
+    def _frame(self, service_type):
+        """Return KNXIPFrame of service type."""
+        knxipframe = KNXIPFrame(self.xknx)
+        knxipframe.init(service_type)
+        return knxipframe
+
+    def _send(self, knxipframe, addr, delay=0):
+        """Send frame after latency (and additional delay)."""
+        if self._lost():
+            return
+        knxipframe.normalize()
+        data = knxipframe.to_bytes()
+        delay += self.latency
+        if delay:
+            self.xknx.loop.call_later(delay, self._sendto, data, addr)
+        else:
+            self._sendto(data, addr)
+
+    def _sendto(self, data, addr):
+        """Send datagram if port is still open."""
+        if self.transport is not None:
+            self.transport.sendto(data, addr)
+
+    def datagram_received(self, data, addr):
+        """Parse and dispatch received datagram."""
+        if self._lost():
+            return
+        knxipframe = KNXIPFrame(self.xknx)
+        try:
+            knxipframe.from_knx(data)
+        except (CouldNotParseKNXIP, TypeError) as ex:
+            self.xknx.logger.debug("GatewaySimulator could not parse frame from %s: %s", addr, ex)
+            return
+        handler = self._handlers.get(knxipframe.header.service_type_ident)
+        if handler is not None:
+            handler(knxipframe, addr)
+
+    def _search_request(self, knxipframe, addr):
+        """Answer SearchRequest."""
+        # pylint: disable=unused-argument
+        response = self._frame(KNXIPServiceType.SEARCH_RESPONSE)
+        response.body.control_endpoint = HPAI(*self.local_addr)
+        device_information = DIBDeviceInformation()
+        device_information.individual_address = self.individual_address
+        device_information.serial_number = "00:00:00:00:00:00"
+        device_information.mac_address = "00:00:00:00:00:00"
+        device_information.name = self.name
+        supported_families = DIBSuppSVCFamilies()
+        supported_families.families = [
+            DIBSuppSVCFamilies.Family(DIBServiceFamily.CORE, 1),
+            DIBSuppSVCFamilies.Family(DIBServiceFamily.TUNNELING, 1),
+            DIBSuppSVCFamilies.Family(DIBServiceFamily.ROUTING, 1)]
+        response.body.dibs = [device_information, supported_families]
+        self._send(response, addr)
+
+    def _connect_request(self, knxipframe, addr):
+        """Open tunnelling connection."""
+        response = self._frame(KNXIPServiceType.CONNECT_RESPONSE)
+        response.body.control_endpoint = HPAI(*self.local_addr)
+        free_ids = [communication_channel_id for communication_channel_id in range(1, self.max_connections + 1)
+                    if communication_channel_id not in self.connections]
+        if knxipframe.body.request_type != ConnectRequestType.TUNNEL_CONNECTION:
+            response.body.status_code = ErrorCode.E_CONNECTION_TYPE
+        elif not free_ids:
+            response.body.status_code = ErrorCode.E_NO_MORE_CONNECTIONS
+        else:
+            connection = GatewaySimulator.Connection(
+                free_ids[0], addr, PhysicalAddress.from_raw(self.individual_address.raw + free_ids[0]))
+            self.connections[connection.communication_channel_id] = connection
+            response.body.communication_channel = connection.communication_channel_id
+            response.body.request_type = ConnectRequestType.TUNNEL_CONNECTION
+            response.body.identifier = connection.individual_address.raw
+        self._send(response, addr)
+
+    def _connectionstate_request(self, knxipframe, addr):
+        """Answer ConnectionStateRequest."""
+        response = self._frame(KNXIPServiceType.CONNECTIONSTATE_RESPONSE)
+        response.body.communication_channel_id = knxipframe.body.communication_channel_id
+        if knxipframe.body.communication_channel_id not in self.connections:
+            response.body.status_code = ErrorCode.E_CONNECTION_ID
+        self._send(response, addr)
+
+    def _disconnect_request(self, knxipframe, addr):
+        """Close tunnelling connection."""
+        self.connections.pop(knxipframe.body.communication_channel_id, None)
+        response = self._frame(KNXIPServiceType.DISCONNECT_RESPONSE)
+        response.body.communication_channel_id = knxipframe.body.communication_channel_id
+        self._send(response, addr)
+
+    def _tunnelling_request(self, knxipframe, addr):
+        """Acknowledge TunnellingRequest and put its telegram onto the bus. Out-of-order requests are discarded."""
+        body = knxipframe.body
+        ack = self._frame(KNXIPServiceType.TUNNELLING_ACK)
+        ack.body.communication_channel_id = body.communication_channel_id
+        ack.body.sequence_counter = body.sequence_counter
+        connection = self.connections.get(body.communication_channel_id)
+        if connection is None:
+            ack.body.status_code = ErrorCode.E_CONNECTION_ID
+            self._send(ack, addr, self.ack_delay)
+            return
+        if body.sequence_counter == (connection.expected_sequence_counter - 1) % 256:
+            # repeated request - acknowledged again but not sent to the bus twice
+            self._send(ack, addr, self.ack_delay)
+            return
+        if body.sequence_counter != connection.expected_sequence_counter:
+            # out of order - discarded without ack
+            return
+        self._send(ack, addr, self.ack_delay)
+        connection.expected_sequence_counter = (connection.expected_sequence_counter + 1) % 256
+        telegram = body.cemi.telegram
+        self._put_on_bus(telegram, connection.individual_address, origin=connection)
+
+    def _tunnelling_ack(self, knxipframe, addr):
+        """Handle TunnellingAck of client. Lost requests are not repeated by the simulator."""
+
+    def _routing_indication(self, knxipframe, addr):
+        """Put telegram of RoutingIndication onto the bus."""
+        self.routing_peers.add(addr)
+        self._put_on_bus(knxipframe.body.telegram, knxipframe.body.src_addr, origin=addr)
+
+    def send_telegram(self, telegram, src_addr=None):
+        """Put telegram onto the bus as if sent by a device on the bus."""
+        self._put_on_bus(telegram, src_addr or self.individual_address)
+
+    def _put_on_bus(self, telegram, src_addr, origin=None):
+        """Deliver telegram to all clients except origin when the simulated bus is free."""
+        telegram.direction = TelegramDirection.INCOMING
+        self.bus_telegrams += 1
+        if self.bus_telegram_cb is not None:
+            # pylint: disable=not-callable
+            self.bus_telegram_cb(telegram)
+        now = self.xknx.loop.time()
+        if not self.bus_rate:
+            self._deliver(telegram, src_addr, origin)
+            return
+        send_at = max(now, self._bus_free_at)
+        self._bus_free_at = send_at + 1 / self.bus_rate
+        if send_at > now:
+            self.xknx.loop.call_at(send_at, self._deliver, telegram, src_addr, origin)
+        else:
+            self._deliver(telegram, src_addr, origin)
+
+    def _deliver(self, telegram, src_addr, origin):
+        """Send telegram to tunnelling connections and routing peers."""
+        for connection in list(self.connections.values()):
+            if connection is origin:
+                continue
+            request = self._frame(KNXIPServiceType.TUNNELLING_REQUEST)
+            request.body.communication_channel_id = connection.communication_channel_id
+            request.body.sequence_counter = connection.sequence_counter
+            request.body.cemi.code = CEMIMessageCode.L_DATA_IND
+            request.body.cemi.telegram = telegram
+            request.body.cemi.src_addr = src_addr
+            connection.sequence_counter = (connection.sequence_counter + 1) % 256
+            self._send(request, connection.addr)
+        for peer in self.routing_peers:
+            if peer == origin:
+                continue
+            indication = self._frame(KNXIPServiceType.ROUTING_INDICATION)
+            indication.body.code = CEMIMessageCode.L_DATA_IND
+            indication.body.telegram = telegram
+            indication.body.src_addr = src_addr
+            self._send(indication, peer)
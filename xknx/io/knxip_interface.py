@@ -7,6 +7,7 @@ KNXIPInterface manages KNX/IP Tunneling or Routing connections.
 
 """
 import ipaddress
+import time
 from enum import Enum
 from platform import system as get_os_name
 
@@ -44,6 +45,7 @@ class ConnectionConfig:
     * auto_reconnect_wait: Wait n seconds before trying to reconnect to KNX/IP tunneling device.
     * scan_filter: For AUTOMATIC connection, limit scan with the given filter
     * bind_to_multicast_addr: Bind to the multicast address instead of the local IP (ROUTING only)
+    * window: Number of telegrams which may be unacknowledged at a time (TUNNELING only)
     """
 
     # pylint: disable=too-few-public-methods,too-many-instance-attributes
@@ -56,7 +58,8 @@ class ConnectionConfig:
                  auto_reconnect: bool = False,
                  auto_reconnect_wait: int = 3,
                  scan_filter: GatewayScanFilter = GatewayScanFilter(),
-                 bind_to_multicast_addr: bool = True):
+                 bind_to_multicast_addr: bool = True,
+                 window: int = 1):
         """Initialize ConnectionConfig class."""
         # pylint: disable=too-many-arguments
         self.connection_type = connection_type
@@ -66,6 +69,7 @@ class ConnectionConfig:
         self.auto_reconnect = auto_reconnect
         self.auto_reconnect_wait = auto_reconnect_wait
         self.bind_to_multicast_addr = bind_to_multicast_addr
+        self.window = window
         if connection_type == ConnectionType.TUNNELING:
             scan_filter.tunnelling = True
         elif connection_type == ConnectionType.ROUTING:
@@ -140,7 +144,9 @@ class KNXIPInterface():
             gateway_port=gateway_port,
             telegram_received_callback=self.telegram_received,
             auto_reconnect=auto_reconnect,
-            auto_reconnect_wait=auto_reconnect_wait)
+            auto_reconnect_wait=auto_reconnect_wait,
+            group_address_filter=self.xknx.telegram_queue.is_subscribed,
+            window=self.connection_config.window)
         await self.interface.start()
 
     async def start_routing(self, local_ip, bind_to_multicast_addr):
@@ -151,7 +157,8 @@ class KNXIPInterface():
             self.xknx,
             self.telegram_received,
             local_ip,
-            bind_to_multicast_addr)
+            bind_to_multicast_addr,
+            group_address_filter=self.xknx.telegram_queue.is_subscribed)
         await self.interface.start()
 
     async def stop(self):
@@ -162,8 +169,9 @@ class KNXIPInterface():
 
     def telegram_received(self, telegram):
         """Put received telegram into queue. Callback for having received telegram."""
-        self.xknx.loop.create_task(
-            self.xknx.telegrams.put(telegram))
+        if self.xknx.metrics is not None:
+            telegram.timestamp = time.monotonic()
+        self.xknx.telegrams.put_nowait(telegram)
 
     async def send_telegram(self, telegram):
         """Send telegram to connected device (either Tunneling or Routing)."""
@@ -0,0 +1,72 @@
+"""
+Module for exposing the metrics of XKNX to Prometheus.
+
+MetricsExporter is a minimal HTTP server built on asyncio streams: every GET request of
+`/metrics` is answered with `xknx.metrics.expose()` in the Prometheus text format and the
+connection is closed afterwards.
+"""
+import asyncio
+
+from xknx.core.metrics import Metrics
+
+
+class MetricsExporter:
+    """Class for serving metrics in Prometheus text format via HTTP."""
+
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def __init__(self, xknx, host='127.0.0.1', port=8000, path='/metrics', timeout_in_seconds=5):
+        """Initialize MetricsExporter class. Enables metrics of XKNX if not yet enabled."""
+        # pylint: disable=too-many-arguments
+        self.xknx = xknx
+        self.host = host
+        self.port = port
+        self.path = path
+        self.timeout_in_seconds = timeout_in_seconds
+        self.server = None
+        if xknx.metrics is None:
+            xknx.metrics = Metrics(xknx)
+
+    async def start(self):
+        """Start HTTP server. `port` is updated to the bound port."""
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """Stop HTTP server."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def handle_connection(self, reader, writer):
+        """Answer a single HTTP request."""
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), self.timeout_in_seconds)
+            # skip headers
+            while True:
+                line = await asyncio.wait_for(reader.readline(), self.timeout_in_seconds)
+                if line in (b'\r\n', b'\n', b''):
+                    break
+            writer.write(self.response(request_line))
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError) as ex:
+            self.xknx.logger.debug("MetricsExporter could not answer request: %s", ex)
+        finally:
+            writer.close()
+
+    def response(self, request_line):
+        """Return HTTP response to request line."""
+        parts = request_line.decode('latin-1').split()
+        if len(parts) < 2 or parts[0] not in ('GET', 'HEAD'):
+            return self._http_response('405 Method Not Allowed', b'')
+        if parts[1].split('?')[0] != self.path:
+            return self._http_response('404 Not Found', b'')
+        body = self.xknx.metrics.expose().encode()
+        return self._http_response('200 OK', body, head=parts[0] == 'HEAD')
+
+    def _http_response(self, status, body, head=False):
+        """Return HTTP response."""
+        header = 'HTTP/1.1 {}\r\nContent-Type: {}\r\nContent-Length: {}\r\nConnection: close\r\n\r\n'.format(
+            status, self.CONTENT_TYPE, len(body))
+        return header.encode() + (b'' if head else body)
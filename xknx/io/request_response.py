@@ -27,10 +27,25 @@ class RequestResponse():
         """Create KNX/IP Frame object to be sent to device."""
         raise NotImplementedError('create_knxipframe has to be implemented')
 
+    def response_key(self):
+        """
+        Return key identifying the awaited response (see UDPClient.RESPONSE_KEYS). May be overwritten in derived class.
+
+        If None, every frame of the awaited service type is passed to response_rec_callback.
+        """
+        # pylint: disable=no-self-use
+        return None
+
     async def start(self):
         """Start. Send request and wait for an answer."""
-        callb = self.udpclient.register_callback(
-            self.response_rec_callback, [self.awaited_response_class.service_type])
+        # response_key() of the base class returns None - derived classes may return a key
+        response_key = self.response_key()  # pylint: disable=assignment-from-none
+        if response_key is None:
+            callb = self.udpclient.register_callback(
+                self.response_rec_callback, [self.awaited_response_class.service_type])
+        else:
+            callb = self.udpclient.register_response_callback(
+                self.response_rec_callback, self.awaited_response_class.service_type, response_key)
         await self.send_request()
         await self.start_timeout()
         await self.response_received_or_timeout.wait()
@@ -13,8 +13,10 @@ from .udp_client import UDPClient
 class Routing():
     """Class for handling KNX/IP routing."""
 
-    def __init__(self, xknx, telegram_received_callback, local_ip, bind_to_multicast_addr):
+    def __init__(self, xknx, telegram_received_callback, local_ip, bind_to_multicast_addr,
+                 group_address_filter=None):
         """Initialize Routing class."""
+        # pylint: disable=too-many-arguments
         self.xknx = xknx
         self.telegram_received_callback = telegram_received_callback
         self.local_ip = local_ip
@@ -24,6 +26,7 @@ class Routing():
                                    (DEFAULT_MCAST_GRP, DEFAULT_MCAST_PORT),
                                    multicast=True,
                                    bind_to_multicast_addr=bind_to_multicast_addr)
+        self.udpclient.group_address_filter = group_address_filter
 
         self.udpclient.register_callback(
             self.response_rec_callback,
@@ -0,0 +1,130 @@
+"""
+Module for recording the telegrams received from KNX bus to a binary file.
+
+TelegramRecorder appends the raw cEMI frame of every received ROUTING_INDICATION or TUNNELLING_REQUEST
+(before any group address filtering) to an append-only file with fixed-size records:
+
+    header (64 bytes):  magic, unix time of start of recording
+    records (64 bytes): seconds since start of recording (monotonic clock), cEMI length, cEMI frame
+
+As records have a fixed size and timestamps are monotonic, TelegramRecording seeks by time with a
+binary search over the records - the file is its own index.
+"""
+import bisect
+import mmap
+import struct
+import time
+
+from xknx.exceptions import XKNXException
+from xknx.knxip import KNXIPFrame
+
+
+class TelegramRecorder:
+    """Class for recording received cEMI frames to a binary file."""
+
+    MAGIC = b'XKNXREC1'
+    HEADER = struct.Struct('>8sd48x')
+    RECORD = struct.Struct('>dB55s')
+    MAX_CEMI_LENGTH = 55
+
+    def __init__(self, xknx, path):
+        """Initialize TelegramRecorder class."""
+        self.xknx = xknx
+        self.path = path
+        self.records = 0
+        self.skipped = 0
+        self._file = None
+        self._start = None
+
+    def start(self):
+        """Start new recording. An existing file is replaced."""
+        self._file = open(self.path, 'wb')
+        self._file.write(self.HEADER.pack(self.MAGIC, time.time()))
+        self._start = time.monotonic()
+        self.records = 0
+        self.skipped = 0
+
+    def stop(self):
+        """Stop recording."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def frame_received(self, raw):
+        """Append cEMI frame of received KNX/IP frame. Called by UDPClient for every received frame."""
+        if self._file is None:
+            return
+        pos = KNXIPFrame.cemi_offset(raw)
+        if pos is None:
+            return
+        cemi = raw[pos:]
+        if len(cemi) > self.MAX_CEMI_LENGTH:
+            self.skipped += 1
+            return
+        self._file.write(self.RECORD.pack(time.monotonic() - self._start, len(cemi), bytes(cemi)))
+        self.records += 1
+
+
+class TelegramRecording:
+    """Class for reading a recording of TelegramRecorder."""
+
+    class Timestamps:
+        """Sequence view of record timestamps for bisect."""
+
+        # pylint: disable=too-few-public-methods
+
+        def __init__(self, recording):
+            """Initialize Timestamps class."""
+            self.recording = recording
+
+        def __len__(self):
+            """Return number of records."""
+            return len(self.recording)
+
+        def __getitem__(self, index):
+            """Return timestamp of record."""
+            return self.recording.timestamp(index)
+
+    def __init__(self, path):
+        """Initialize TelegramRecording class and map recording file into memory."""
+        with open(path, 'rb') as recording_file:
+            try:
+                self._data = mmap.mmap(recording_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty file
+                self._data = b''
+        if len(self._data) < TelegramRecorder.HEADER.size:
+            raise XKNXException("Invalid telegram recording: {}".format(path))
+        magic, self.start_time = TelegramRecorder.HEADER.unpack_from(self._data, 0)
+        if magic != TelegramRecorder.MAGIC:
+            raise XKNXException("Invalid telegram recording: {}".format(path))
+
+    def __len__(self):
+        """Return number of complete records."""
+        return (len(self._data) - TelegramRecorder.HEADER.size) // TelegramRecorder.RECORD.size
+
+    @staticmethod
+    def _offset(index):
+        """Return file position of record."""
+        return TelegramRecorder.HEADER.size + index * TelegramRecorder.RECORD.size
+
+    def timestamp(self, index):
+        """Return seconds since start of recording of record."""
+        return struct.unpack_from('>d', self._data, self._offset(index))[0]
+
+    def seek(self, timestamp):
+        """Return index of the first record at or after timestamp (seconds since start of recording)."""
+        return bisect.bisect_left(TelegramRecording.Timestamps(self), timestamp)
+
+    def records(self, start=0.0, end=None):
+        """Yield (timestamp, cEMI frame) of records between start and end (seconds since start of recording)."""
+        for index in range(self.seek(start), len(self)):
+            timestamp, length, cemi = TelegramRecorder.RECORD.unpack_from(self._data, self._offset(index))
+            if end is not None and timestamp > end:
+                return
+            yield timestamp, cemi[:length]
+
+    def close(self):
+        """Unmap recording file."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
@@ -0,0 +1,77 @@
+"""
+Module for replaying telegrams recorded by TelegramRecorder.
+
+TelegramReplayer parses the recorded cEMI frames and passes the telegrams to KNXIPInterface.telegram_received
+(or another callback) - either timed like the recording, scaled by `speed`, or as fast as possible (`speed=None`).
+Replaying at maximum speed measures the throughput of the whole receive pipeline: if the TelegramQueue is running,
+`replay()` returns after all replayed telegrams were processed.
+"""
+import asyncio
+
+from xknx.exceptions import XKNXException
+from xknx.knxip import CEMIFrame
+from xknx.telegram import TelegramDirection
+
+from .knxip_interface import KNXIPInterface
+from .telegram_recorder import TelegramRecording
+
+
+class TelegramReplayer:
+    """Class for replaying recorded telegrams."""
+
+    # Number of telegrams passed at maximum speed before yielding to the event loop
+    YIELD_INTERVAL = 256
+
+    def __init__(self, xknx, path, speed=1.0, telegram_received_callback=None):
+        """Initialize TelegramReplayer class."""
+        self.xknx = xknx
+        self.path = path
+        self.speed = speed
+        self.telegram_received_callback = telegram_received_callback
+
+    def _callback(self):
+        """Return callback receiving the replayed telegrams."""
+        if self.telegram_received_callback is not None:
+            return self.telegram_received_callback
+        knxip_interface = self.xknx.knxip_interface or KNXIPInterface(self.xknx)
+        return knxip_interface.telegram_received
+
+    def parse(self, cemi):
+        """Return telegram of recorded cEMI frame or None if it can't be parsed."""
+        cemi_frame = CEMIFrame(self.xknx)
+        try:
+            cemi_frame.from_knx_data_link_layer(cemi)
+            telegram = cemi_frame.telegram
+        except XKNXException as ex:
+            self.xknx.logger.debug("Skipping recorded frame: %s", ex)
+            return None
+        telegram.direction = TelegramDirection.INCOMING
+        return telegram
+
+    async def replay(self, start=0.0, end=None):
+        """
+        Replay records between start and end (seconds since start of recording). Return number of telegrams replayed.
+
+        At maximum speed, wait until the running TelegramQueue processed all telegrams.
+        """
+        callback = self._callback()
+        recording = TelegramRecording(self.path)
+        replayed = 0
+        try:
+            replay_start = self.xknx.loop.time()
+            for timestamp, cemi in recording.records(start, end):
+                if self.speed:
+                    delay = replay_start + (timestamp - start) / self.speed - self.xknx.loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                elif replayed % self.YIELD_INTERVAL == 0:
+                    await asyncio.sleep(0)
+                telegram = self.parse(cemi)
+                if telegram is not None:
+                    callback(telegram)
+                    replayed += 1
+        finally:
+            recording.close()
+        if not self.speed and self.xknx.telegram_queue.running:
+            await self.xknx.telegrams.join()
+        return replayed
@@ -12,18 +12,18 @@ from xknx.telegram import TelegramDirection
 from .connect import Connect
 from .connectionstate import ConnectionState
 from .disconnect import Disconnect
-from .tunnelling import Tunnelling
+from .tunnelling_sender import TunnellingSender
 from .udp_client import UDPClient
 
 
 class Tunnel():
     """Class for handling KNX/IP tunnels."""
 
-    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-instance-attributes,too-many-public-methods
 
     def __init__(self, xknx, src_address, local_ip="0.0.0.0", gateway_ip=None, gateway_port=None,
                  telegram_received_callback=None, auto_reconnect=False,
-                 auto_reconnect_wait=3):
+                 auto_reconnect_wait=3, group_address_filter=None, window=1):
         """Initialize Tunnel class."""
         # pylint: disable=too-many-arguments
         self.xknx = xknx
@@ -32,11 +32,14 @@ class Tunnel():
         self.gateway_ip = gateway_ip
         self.gateway_port = gateway_port
         self.telegram_received_callback = telegram_received_callback
+        self.group_address_filter = group_address_filter
 
         self.udp_client = None
         self.init_udp_client()
 
-        self.sequence_number = 0
+        # Number of TunnellingRequests which may be unacknowledged at a time
+        self.window = window
+        self.tunnelling_sender = None
         self.communication_channel = None
         self.number_heartbeat_failed = 0
 
@@ -54,6 +57,8 @@ class Tunnel():
 
         self.udp_client.register_callback(
             self.tunnel_reqest_received, [TunnellingRequest.service_type])
+        self.udp_client.group_address_filter = self.group_address_filter
+        self.udp_client.filtered_frame_callback = self.tunnel_request_filtered
 
     def tunnel_reqest_received(self, knxipframe, udp_client):
         """Handle incoming tunnel request."""
@@ -68,6 +73,12 @@ class Tunnel():
             if self.telegram_received_callback is not None:
                 self.telegram_received_callback(telegram)
 
+    def tunnel_request_filtered(self, raw):
+        """Acknowledge incoming tunnel request dropped by group address filter without parsing it."""
+        if raw[2] * 256 + raw[3] == KNXIPServiceType.TUNNELLING_REQUEST.value:
+            # connection header: structure length, communication channel id, sequence counter
+            self.send_ack(raw[7], raw[8])
+
     def send_ack(self, communication_channel_id, sequence_counter):
         """Send tunnelling ACK after tunnelling request received."""
         ack_knxipframe = KNXIPFrame(self.xknx)
@@ -108,7 +119,13 @@ class Tunnel():
             connect.identifier)
         self._reconnect_task = None
         self.communication_channel = connect.communication_channel
-        self.sequence_number = 0
+        self.src_address = self.xknx.own_address
+        self.tunnelling_sender = TunnellingSender(
+            self.xknx,
+            self.udp_client,
+            self.communication_channel,
+            self.src_address,
+            window=self.window)
         await self.start_heartbeat()
 
     async def send_telegram(self, telegram):
@@ -125,36 +142,37 @@ class Tunnel():
         shall repeat the TUNNELLING_REQUEST frame once and then terminate the
         connection by sending a DISCONNECT_REQUEST frame to the other device’s
         control endpoint.
+
+        Repeating is done by TunnellingSender. With a window of more than one request,
+        this returns as soon as the request was sent and failures are handled in the background.
         """
-        success = await self._send_telegram_impl(telegram)
-        if not success:
-            self.xknx.logger.warning("Sending of telegram failed. Retrying a second time.")
-            success = await self._send_telegram_impl(telegram)
-            if not success:
-                self.xknx.logger.warning("Resending telegram failed. Reconnecting to tunnel.")
-                await self.reconnect()
-                success = await self._send_telegram_impl(telegram)
-                if not success:
-                    raise XKNXException("Could not send telegram to tunnel")
-        self.increase_sequence_number()
-
-    async def _send_telegram_impl(self, telegram):
-        """Send Telegram to tunnelling device - implementation."""
-        tunnelling = Tunnelling(
-            self.xknx,
-            self.udp_client,
-            telegram,
-            self.src_address,
-            self.sequence_number,
-            self.communication_channel)
-        await tunnelling.start()
-        return tunnelling.success
+        if self.tunnelling_sender is None:
+            raise XKNXException("Tunnel not connected")
+        acknowledged = await self.tunnelling_sender.send(telegram)
+        if self.window > 1:
+            acknowledged.add_done_callback(self._telegram_acknowledged)
+            return
+        if not await acknowledged:
+            self.xknx.logger.warning("Resending telegram failed. Reconnecting to tunnel.")
+            await self.reconnect()
+            acknowledged = await self.tunnelling_sender.send(telegram)
+            if not await acknowledged:
+                raise XKNXException("Could not send telegram to tunnel")
+
+    def _telegram_acknowledged(self, acknowledged):
+        """Reconnect if a telegram sent within a window was not acknowledged."""
+        # not acknowledged requests are failed when the tunnel is disconnected
+        if acknowledged.result() or self.tunnelling_sender is None or self._reconnect_task is not None:
+            return
+        self.xknx.logger.warning("Resending telegram failed. Reconnecting to tunnel.")
+        self._reconnect_task = self.xknx.loop.create_task(self.reconnect())
 
-    def increase_sequence_number(self):
-        """Increase sequence number."""
-        self.sequence_number += 1
-        if self.sequence_number == 256:
-            self.sequence_number = 0
+    @property
+    def sequence_number(self):
+        """Return sequence counter of the next TunnellingRequest."""
+        if self.tunnelling_sender is None:
+            return 0
+        return self.tunnelling_sender.sequence_counter
 
     async def connectionstate(self):
         """Return state of tunnel. True if tunnel is in good shape."""
@@ -167,6 +185,9 @@ class Tunnel():
 
     async def disconnect(self, ignore_error=False):
         """Disconnect from tunnel device."""
+        if self.tunnelling_sender is not None:
+            self.tunnelling_sender.stop()
+            self.tunnelling_sender = None
         # only send disconnect request if we ever were connected
         if self.communication_channel is None:
             # close udp client to prevent open file descriptors
@@ -241,6 +262,8 @@ class Tunnel():
     async def do_heartbeat_failed(self):
         """Heartbeat: handling error."""
         self.number_heartbeat_failed = self.number_heartbeat_failed + 1
+        if self.xknx.metrics is not None:
+            self.xknx.metrics.heartbeat_failures.inc()
         if self.number_heartbeat_failed > 3:
             self.xknx.logger.warning("Heartbeat failed - reconnecting")
             await self.stop_reconnect()
@@ -20,6 +20,10 @@ class Tunnelling(RequestResponse):
         self.sequence_counter = sequence_counter
         self.communication_channel_id = communication_channel_id
 
+    def response_key(self):
+        """Return key identifying the awaited response."""
+        return self.communication_channel_id, self.sequence_counter
+
     def create_knxipframe(self):
         """Create KNX/IP Frame object to be sent to device."""
         knxipframe = KNXIPFrame(self.xknx)
@@ -0,0 +1,158 @@
+"""
+Abstraction for sending TunnellingRequests over an established tunnel.
+
+In contrast to Tunnelling (one RequestResponse per telegram) TunnellingSender lives as long as the tunnel:
+
+* TunnellingAcks are matched to the pending requests by sequence counter within a single dispatch table,
+* retransmissions of all pending requests are driven by one shared timer,
+* optionally more than one request may be unacknowledged at a time (`window`) for gateways tolerating it.
+
+As specified within 03.08.04 KNXnet/IP Tunnelling a request not acknowledged within one second
+(or acknowledged with an error) is repeated once with the same sequence counter.
+"""
+import asyncio
+from collections import OrderedDict
+
+from xknx.knxip import (
+    ErrorCode, KNXIPFrame, KNXIPServiceType, TunnellingAck)
+
+
+class TunnellingSender():
+    """Class for sending TunnellingRequests and matching the corresponding TunnellingAcks."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    class PendingRequest:
+        """Unacknowledged TunnellingRequest."""
+
+        # pylint: disable=too-few-public-methods
+
+        def __init__(self, knxipframe, deadline, future):
+            """Initialize PendingRequest class."""
+            self.knxipframe = knxipframe
+            self.deadline = deadline
+            self.future = future
+            self.repeated = False
+
+    def __init__(self, xknx, udp_client, communication_channel_id, src_address,
+                 window=1, timeout_in_seconds=1):
+        """Initialize TunnellingSender class."""
+        # pylint: disable=too-many-arguments
+        self.xknx = xknx
+        self.udp_client = udp_client
+        self.communication_channel_id = communication_channel_id
+        self.src_address = src_address
+        self.window = window
+        self.timeout_in_seconds = timeout_in_seconds
+        self.sequence_counter = 0
+        # Pending requests by sequence counter, ordered by deadline
+        self._pending = OrderedDict()
+        self._window_slots = asyncio.Semaphore(window)
+        self._timeout_handle = None
+        self._stopped = False
+        self._callb = udp_client.register_callback(
+            self.response_rec_callback, [TunnellingAck.service_type])
+
+    async def send(self, telegram):
+        """
+        Send telegram as TunnellingRequest as soon as the window permits.
+
+        Returns a future resolving to True if the request was acknowledged, or
+        to False if it was not acknowledged after being repeated once or the sender was stopped.
+        """
+        await self._window_slots.acquire()
+        future = self.xknx.loop.create_future()
+        if self._stopped:
+            # woken up by stop() - pass the slot on to the next waiting sender
+            self._window_slots.release()
+            future.set_result(False)
+            return future
+        knxipframe = KNXIPFrame(self.xknx)
+        knxipframe.init(KNXIPServiceType.TUNNELLING_REQUEST)
+        knxipframe.body.communication_channel_id = self.communication_channel_id
+        knxipframe.body.cemi.telegram = telegram
+        knxipframe.body.cemi.src_addr = self.src_address
+        knxipframe.body.sequence_counter = self.sequence_counter
+        knxipframe.normalize()
+
+        self._pending[self.sequence_counter] = TunnellingSender.PendingRequest(
+            knxipframe, self.xknx.loop.time() + self.timeout_in_seconds, future)
+        self.sequence_counter = (self.sequence_counter + 1) % 256
+        self.udp_client.send(knxipframe)
+        self._start_timeout()
+        return future
+
+    def response_rec_callback(self, knxipframe, _):
+        """Match TunnellingAck to pending request. Callback from internal udpclient."""
+        if knxipframe.body.communication_channel_id != self.communication_channel_id:
+            return
+        pending = self._pending.get(knxipframe.body.sequence_counter)
+        if pending is None:
+            self.xknx.logger.debug("Ignoring TunnellingAck without pending request: %s", knxipframe)
+            return
+        if knxipframe.body.status_code == ErrorCode.E_NO_ERROR:
+            if self.xknx.metrics is not None:
+                self.xknx.metrics.tunnelling_ack_time.observe(
+                    self.xknx.loop.time() - pending.deadline + self.timeout_in_seconds)
+            self._finish(knxipframe.body.sequence_counter, True)
+        else:
+            self.xknx.logger.warning("Error: KNX bus responded to TunnellingRequest with error: %s",
+                                     knxipframe.body.status_code)
+            self._repeat_or_fail(knxipframe.body.sequence_counter, pending)
+
+    def timeout(self):
+        """Handle timeout of all pending requests whose deadline passed."""
+        self._timeout_handle = None
+        now = self.xknx.loop.time()
+        for sequence_counter, pending in list(self._pending.items()):
+            if pending.deadline > now:
+                break
+            self.xknx.logger.warning("Error: KNX bus did not respond in time to TunnellingRequest %s",
+                                     sequence_counter)
+            self._repeat_or_fail(sequence_counter, pending)
+        self._start_timeout()
+
+    def _repeat_or_fail(self, sequence_counter, pending):
+        """Repeat pending request once with the same sequence counter, fail it afterwards."""
+        if pending.repeated:
+            if self.xknx.metrics is not None:
+                self.xknx.metrics.tunnelling_failures.inc()
+            self._finish(sequence_counter, False)
+            return
+        if self.xknx.metrics is not None:
+            self.xknx.metrics.tunnelling_retries.inc()
+        pending.repeated = True
+        pending.deadline = self.xknx.loop.time() + self.timeout_in_seconds
+        self._pending.move_to_end(sequence_counter)
+        self.udp_client.send(pending.knxipframe)
+        self._start_timeout()
+
+    def _finish(self, sequence_counter, success):
+        """Remove pending request, resolve its future and free its window slot."""
+        pending = self._pending.pop(sequence_counter)
+        if not pending.future.done():
+            pending.future.set_result(success)
+        self._window_slots.release()
+        if not self._pending:
+            self._stop_timeout()
+
+    def _start_timeout(self):
+        """Arm shared timer for the earliest deadline if not already armed."""
+        if self._timeout_handle is not None or not self._pending:
+            return
+        deadline = next(iter(self._pending.values())).deadline
+        self._timeout_handle = self.xknx.loop.call_at(deadline, self.timeout)
+
+    def _stop_timeout(self):
+        """Cancel shared timer."""
+        if self._timeout_handle is not None:
+            self._timeout_handle.cancel()
+            self._timeout_handle = None
+
+    def stop(self):
+        """Stop sender. Pending requests are failed, requests waiting for the window are not sent."""
+        self._stopped = True
+        self._stop_timeout()
+        for sequence_counter in list(self._pending):
+            self._finish(sequence_counter, False)
+        self.udp_client.unregister_callback(self._callb)
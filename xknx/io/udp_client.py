@@ -9,21 +9,33 @@ import socket
 from sys import platform
 
 from xknx.exceptions import CouldNotParseKNXIP, XKNXException
-from xknx.knxip import KNXIPFrame
+from xknx.knxip import KNXIPFrame, KNXIPServiceType
+from xknx.telegram import GroupAddress
 
 
 class UDPClient:
     """Class for handling (sending and receiving) UDP packets."""
 
-    # pylint: disable=too-few-public-methods
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
+
+    # Functions returning the key by which a response frame is matched to the request waiting for it.
+    RESPONSE_KEYS = {
+        KNXIPServiceType.TUNNELLING_ACK:
+            lambda body: (body.communication_channel_id, body.sequence_counter),
+        KNXIPServiceType.CONNECTIONSTATE_RESPONSE:
+            lambda body: body.communication_channel_id,
+        KNXIPServiceType.DISCONNECT_RESPONSE:
+            lambda body: body.communication_channel_id,
+    }
 
     class Callback:
         """Callback class for handling callbacks for different 'KNX service types' of received packets."""
 
-        def __init__(self, callback, service_types=None):
+        def __init__(self, callback, service_types=None, response_key=None):
             """Initialize Callback class."""
             self.callback = callback
             self.service_types = service_types or []
+            self.response_key = response_key
 
         def has_service(self, service_type):
             """Test if callback is listening for given service type."""
@@ -78,28 +90,72 @@ class UDPClient:
         self.multicast = multicast
         self.bind_to_multicast_addr = bind_to_multicast_addr
         self.transport = None
-        self.callbacks = []
+        # Dispatch tables. Lists are replaced on (un)registration, never modified in place,
+        # so callbacks may unregister themselves while being called.
+        self._callbacks = {}
+        self._callbacks_all_services = []
+        self._response_callbacks = {}
+        # Optional prefilter called with the destination GroupAddress of received telegrams.
+        # Telegrams it returns False for are dropped before the frame is parsed.
+        self.group_address_filter = None
+        # Called with the raw data of frames dropped by group_address_filter.
+        self.filtered_frame_callback = None
 
     def data_received_callback(self, raw):
         """Parse and process KNXIP frame. Callback for having received an UDP packet."""
         if raw:
+            metrics = self.xknx.metrics
+            if metrics is not None:
+                metrics.datagrams_received.inc()
+            if self.xknx.telegram_recorder is not None:
+                self.xknx.telegram_recorder.frame_received(raw)
+            if self.group_address_filter is not None and self.is_filtered(raw):
+                if metrics is not None:
+                    metrics.datagrams_filtered.inc()
+                if self.filtered_frame_callback is not None:
+                    # pylint: disable=not-callable
+                    self.filtered_frame_callback(raw)
+                return
             try:
                 knxipframe = KNXIPFrame(self.xknx)
                 knxipframe.from_knx(raw)
+                if metrics is not None:
+                    metrics.datagrams_parsed.inc()
                 self.xknx.knx_logger.debug("Received: %s", knxipframe)
                 self.handle_knxipframe(knxipframe)
             except CouldNotParseKNXIP as couldnotparseknxip:
+                if metrics is not None:
+                    metrics.datagrams_failed.inc()
                 self.xknx.logger.exception(couldnotparseknxip)
 
+    def is_filtered(self, raw):
+        """Test if raw frame is a telegram to a group address rejected by group_address_filter."""
+        group_address_raw = KNXIPFrame.peek_group_address(raw)
+        if group_address_raw is None:
+            return False
+        # pylint: disable=not-callable
+        return not self.group_address_filter(
+            GroupAddress.from_raw(group_address_raw, levels=self.xknx.address_format))
+
     def handle_knxipframe(self, knxipframe):
         """Handle KNXIP Frame and call all callbacks which watch for the service type ident."""
+        service_type = knxipframe.header.service_type_ident
         handled = False
-        for callback in self.callbacks:
-            if callback.has_service(knxipframe.header.service_type_ident):
-                callback.callback(knxipframe, self)
-                handled = True
+        if self._response_callbacks:
+            response_key = UDPClient.RESPONSE_KEYS.get(service_type)
+            if response_key is not None:
+                for callback in self._response_callbacks.get(
+                        (service_type, response_key(knxipframe.body)), ()):
+                    callback.callback(knxipframe, self)
+                    handled = True
+        for callback in self._callbacks.get(service_type, ()):
+            callback.callback(knxipframe, self)
+            handled = True
+        for callback in self._callbacks_all_services:
+            callback.callback(knxipframe, self)
+            handled = True
         if not handled:
-            self.xknx.logger.debug("UNHANDLED: %s", knxipframe.header.service_type_ident)
+            self.xknx.logger.debug("UNHANDLED: %s", service_type)
 
     def register_callback(self, callback, service_types=None):
         """Register callback."""
@@ -107,12 +163,38 @@ class UDPClient:
             service_types = []
 
         callb = UDPClient.Callback(callback, service_types)
-        self.callbacks.append(callb)
+        if not service_types:
+            self._callbacks_all_services = self._callbacks_all_services + [callb]
+        for service_type in service_types:
+            self._callbacks[service_type] = self._callbacks.get(service_type, []) + [callb]
+        return callb
+
+    def register_response_callback(self, callback, service_type, response_key):
+        """
+        Register callback for the response to a specific request.
+
+        The callback is only called for frames of `service_type` whose key (see RESPONSE_KEYS)
+        equals `response_key`, e.g. the TUNNELLING_ACK with a given sequence counter.
+        Lookup is done in constant time regardless of the number of registered callbacks.
+        """
+        if service_type not in UDPClient.RESPONSE_KEYS:
+            raise XKNXException("No response key defined for {}".format(service_type))
+        callb = UDPClient.Callback(callback, [service_type], response_key)
+        key = (service_type, response_key)
+        self._response_callbacks[key] = self._response_callbacks.get(key, []) + [callb]
         return callb
 
     def unregister_callback(self, callb):
         """Unregister callback."""
-        self.callbacks.remove(callb)
+        if callb.response_key is not None:
+            _remove_callback(self._response_callbacks, (callb.service_types[0], callb.response_key), callb)
+        elif not callb.service_types:
+            callbacks = list(self._callbacks_all_services)
+            callbacks.remove(callb)
+            self._callbacks_all_services = callbacks
+        else:
+            for service_type in callb.service_types:
+                _remove_callback(self._callbacks, service_type, callb)
 
     @staticmethod
     def create_multicast_sock(own_ip, remote_addr, bind_to_multicast_addr):
@@ -184,9 +266,9 @@ class UDPClient:
             raise XKNXException("Transport not connected")
 
         if self.multicast:
-            self.transport.sendto(bytes(knxipframe.to_knx()), self.remote_addr)
+            self.transport.sendto(knxipframe.to_bytes(), self.remote_addr)
         else:
-            self.transport.sendto(bytes(knxipframe.to_knx()))
+            self.transport.sendto(knxipframe.to_bytes())
 
     def getsockname(self):
         """Return sockname."""
@@ -201,3 +283,13 @@ class UDPClient:
     async def stop(self):
         """Stop UDP socket."""
         self.transport.close()
+
+
+def _remove_callback(table, key, callb):
+    """Remove callb from the list stored for key within dispatch table. Raise ValueError if not found."""
+    callbacks = list(table.get(key, ()))
+    callbacks.remove(callb)
+    if callbacks:
+        table[key] = callbacks
+    else:
+        del table[key]
@@ -21,6 +21,18 @@ class KNXIPBody():
         """Serialize to KNX/IP raw data."""
         self.xknx.logger.warning("to_knx not implemented for %s", self.__class__.__name__)
 
+    def to_knx_into(self, buffer, pos):
+        """
+        Serialize to KNX/IP raw data into `buffer` starting at `pos`.
+
+        Returns the position after the written data. Derived classes may
+        overwrite this to write directly into the buffer without building a list.
+        """
+        # to_knx of the base class only logs a warning
+        data = self.to_knx()  # pylint: disable=assignment-from-no-return
+        buffer[pos:pos + len(data)] = data
+        return pos + len(data)
+
     def __eq__(self, other):
         """Equal operator."""
         return self.__dict__ == other.__dict__
@@ -11,20 +11,35 @@ Documentation within:
     KNX IP Communication Medium
     File: AN117 v02.01 KNX IP Communication Medium DV.pdf
 """
+from struct import Struct
+
 from xknx.dpt import DPTArray, DPTBinary
 from xknx.exceptions import (
     ConversionError, CouldNotParseKNXIP, UnsupportedCEMIMessage)
-from xknx.telegram import GroupAddress, PhysicalAddress, Telegram, TelegramType
+from xknx.telegram import (
+    GroupAddress, PhysicalAddress, Telegram, TelegramPriority, TelegramType)
 
 from .body import KNXIPBody
 from .knxip_enum import APCICommand, CEMIFlags, CEMIMessageCode
 
+# Priority bits within CEMI flags for each telegram priority
+PRIORITY_FLAGS = {
+    TelegramPriority.SYSTEM: CEMIFlags.PRIORITY_SYSTE,
+    TelegramPriority.URGENT: CEMIFlags.PRIORITY_URGENT,
+    TelegramPriority.NORMAL: CEMIFlags.PRIORITY_NORMAL,
+    TelegramPriority.LOW: CEMIFlags.PRIORITY_LOW,
+}
+TELEGRAM_PRIORITIES = {flags: priority for priority, flags in PRIORITY_FLAGS.items()}
+
 
 class CEMIFrame(KNXIPBody):
     """Representation of a CEMI Frame."""
 
     # pylint: disable=too-many-instance-attributes
 
+    # code, additional info length, flags, src, dst, mpdu_len, tpci/apci
+    STRUCT = Struct('>BBHHHBH')
+
     def __init__(self, xknx):
         """Initialize CEMIFrame object."""
         super().__init__(xknx)
@@ -42,6 +57,7 @@ class CEMIFrame(KNXIPBody):
         telegram = Telegram()
         telegram.payload = self.payload
         telegram.group_address = self.dst_addr
+        telegram.priority = TELEGRAM_PRIORITIES[self.flags & CEMIFlags.PRIORITY_MASK]
 
         def resolve_telegram_type(cmd):
             """Return telegram type from APCI Command."""
@@ -69,7 +85,7 @@ class CEMIFrame(KNXIPBody):
         self.flags = (CEMIFlags.FRAME_TYPE_STANDARD |
                       CEMIFlags.DO_NOT_REPEAT |
                       CEMIFlags.BROADCAST |
-                      CEMIFlags.PRIORITY_LOW |
+                      PRIORITY_FLAGS[telegram.priority] |
                       CEMIFlags.NO_ACK_REQUESTED |
                       CEMIFlags.CONFIRM_NO_ERROR |
                       CEMIFlags.DESTINATION_GROUP_ADDRESS |
@@ -134,13 +150,13 @@ class CEMIFrame(KNXIPBody):
 
         self.flags = cemi[2 + addil] * 256 + cemi[3 + addil]
 
-        self.src_addr = PhysicalAddress((cemi[4 + addil], cemi[5 + addil]))
+        self.src_addr = PhysicalAddress.from_raw(cemi[4 + addil] * 256 + cemi[5 + addil])
 
         if self.flags & CEMIFlags.DESTINATION_GROUP_ADDRESS:
-            self.dst_addr = GroupAddress((cemi[6 + addil], cemi[7 + addil]),
-                                         levels=self.xknx.address_format)
+            self.dst_addr = GroupAddress.from_raw(cemi[6 + addil] * 256 + cemi[7 + addil],
+                                                  levels=self.xknx.address_format)
         else:
-            self.dst_addr = PhysicalAddress((cemi[6 + addil], cemi[7 + addil]))
+            self.dst_addr = PhysicalAddress.from_raw(cemi[6 + addil] * 256 + cemi[7 + addil])
 
         self.mpdu_len = cemi[8 + addil]
 
@@ -155,19 +171,19 @@ class CEMIFrame(KNXIPBody):
             raise UnsupportedCEMIMessage(
                 "APCI not supported: {0:#012b}".format(tpci_apci & 0xFFC0))
 
-        apdu = cemi[10 + addil:]
-        if len(apdu) != self.mpdu_len:
+        apdu_len = len(cemi) - 10 - addil
+        if apdu_len != self.mpdu_len:
             raise CouldNotParseKNXIP(
                 "APDU LEN should be {} but is {}".format(
-                    self.mpdu_len, len(apdu)))
+                    self.mpdu_len, apdu_len))
 
-        if len(apdu) == 1:
+        if apdu_len == 1:
             apci = tpci_apci & DPTBinary.APCI_BITMASK
             self.payload = DPTBinary(apci)
         else:
             self.payload = DPTArray(cemi[11 + addil:])
 
-        return 10 + addil + len(apdu)
+        return 10 + addil + apdu_len
 
     def to_knx(self):
         """Serialize to KNX/IP raw data."""
@@ -211,6 +227,38 @@ class CEMIFrame(KNXIPBody):
             raise TypeError()
         return data
 
+    def to_knx_into(self, buffer, pos):
+        """Serialize to KNX/IP raw data into `buffer` starting at `pos`. Returns the position after the frame."""
+        if not isinstance(self.src_addr, (GroupAddress, PhysicalAddress)):
+            raise ConversionError("src_add not set")
+        if not isinstance(self.dst_addr, (GroupAddress, PhysicalAddress)):
+            raise ConversionError("dst_add not set")
+
+        if self.payload is None:
+            encoded_payload = 0
+            appended_payload = ()
+        elif isinstance(self.payload, DPTBinary):
+            encoded_payload = self.payload.value & DPTBinary.APCI_BITMASK
+            appended_payload = ()
+        elif isinstance(self.payload, DPTArray):
+            encoded_payload = 0
+            appended_payload = self.payload.value
+        else:
+            raise TypeError()
+
+        CEMIFrame.STRUCT.pack_into(
+            buffer, pos,
+            self.code.value,
+            0x00,
+            self.flags,
+            self.src_addr.raw,
+            self.dst_addr.raw,
+            1 + len(appended_payload),
+            self.cmd.value | encoded_payload)
+        pos += CEMIFrame.STRUCT.size
+        buffer[pos:pos + len(appended_payload)] = bytes(appended_payload)
+        return pos + len(appended_payload)
+
     def __str__(self):
         """Return object as readable string."""
         return '<CEMIFrame SourceAddress="{0}" DestinationAddress="{1}" ' \
@@ -81,6 +81,9 @@ class DIBGeneric(DIB):
 
         self.dtc = DIBTypeCode(raw[1])
         self.data = raw[:dib_length]
+        if isinstance(self.data, memoryview):
+            # don't keep the received datagram alive
+            self.data = self.data.tobytes()
 
         return dib_length
 
@@ -1,4 +1,6 @@
 """Module for serialization and deserialization of KNX/IP Header."""
+from struct import Struct
+
 from xknx.exceptions import CouldNotParseKNXIP
 
 from .body import KNXIPBody
@@ -10,6 +12,7 @@ class KNXIPHeader():
 
     HEADERLENGTH = 0x06
     PROTOCOLVERSION = 0x10
+    STRUCT = Struct('>BBHH')
 
     def __init__(self, xknx):
         """Initialize KNXIPHeader class."""
@@ -54,6 +57,16 @@ class KNXIPHeader():
         data.append(self.total_length & 255)
         return data
 
+    def to_knx_into(self, buffer, pos):
+        """Serialize to KNX/IP raw data into `buffer` starting at `pos`. Returns the position after the header."""
+        KNXIPHeader.STRUCT.pack_into(
+            buffer, pos,
+            self.header_length,
+            self.protocol_version,
+            self.service_type_ident.value,
+            self.total_length)
+        return pos + KNXIPHeader.HEADERLENGTH
+
     def __str__(self):
         """Return object as readable string."""
         return '<KNXIPHeader HeaderLength="{0}" ProtocolVersion="{1}" ' \
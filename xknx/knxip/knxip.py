@@ -14,13 +14,36 @@ from .connectionstate_response import ConnectionStateResponse
 from .disconnect_request import DisconnectRequest
 from .disconnect_response import DisconnectResponse
 from .header import KNXIPHeader
-from .knxip_enum import KNXIPServiceType
+from .knxip_enum import CEMIFlags, CEMIMessageCode, KNXIPServiceType
 from .search_request import SearchRequest
 from .search_response import SearchResponse
 from .tunnelling_ack import TunnellingAck
 from .tunnelling_request import TunnellingRequest
 
 
+# Body class instanciated for each service type
+BODY_CLASSES = {
+    KNXIPServiceType.ROUTING_INDICATION: CEMIFrame,
+    KNXIPServiceType.CONNECT_REQUEST: ConnectRequest,
+    KNXIPServiceType.CONNECT_RESPONSE: ConnectResponse,
+    KNXIPServiceType.TUNNELLING_REQUEST: TunnellingRequest,
+    KNXIPServiceType.TUNNELLING_ACK: TunnellingAck,
+    KNXIPServiceType.SEARCH_REQUEST: SearchRequest,
+    KNXIPServiceType.SEARCH_RESPONSE: SearchResponse,
+    KNXIPServiceType.DISCONNECT_REQUEST: DisconnectRequest,
+    KNXIPServiceType.DISCONNECT_RESPONSE: DisconnectResponse,
+    KNXIPServiceType.CONNECTIONSTATE_REQUEST: ConnectionStateRequest,
+    KNXIPServiceType.CONNECTIONSTATE_RESPONSE: ConnectionStateResponse,
+}
+
+# Raw values of the service types carrying a CEMI frame, and of the CEMI message codes carrying a telegram
+CEMI_SERVICE_TYPES = (KNXIPServiceType.ROUTING_INDICATION.value,
+                      KNXIPServiceType.TUNNELLING_REQUEST.value)
+CEMI_DATA_MESSAGE_CODES = (CEMIMessageCode.L_DATA_IND.value,
+                           CEMIMessageCode.L_Data_REQ.value,
+                           CEMIMessageCode.L_DATA_CON.value)
+
+
 class KNXIPFrame:
     """Class for KNX/IP Frames."""
 
@@ -33,45 +56,21 @@ class KNXIPFrame:
     def init(self, service_type_ident):
         """Init object by service_type_ident. Will instanciate a body object depending on service_type_ident."""
         self.header.service_type_ident = service_type_ident
-
-        if service_type_ident == \
-                KNXIPServiceType.ROUTING_INDICATION:
-            self.body = CEMIFrame(self.xknx)
-        elif service_type_ident == \
-                KNXIPServiceType.CONNECT_REQUEST:
-            self.body = ConnectRequest(self.xknx)
-        elif service_type_ident == \
-                KNXIPServiceType.CONNECT_RESPONSE:
-            self.body = ConnectResponse(self.xknx)
-        elif service_type_ident == \
-                KNXIPServiceType.TUNNELLING_REQUEST:
-            self.body = TunnellingRequest(self.xknx)
-        elif service_type_ident == \
-                KNXIPServiceType.TUNNELLING_ACK:
-            self.body = TunnellingAck(self.xknx)
-        elif service_type_ident == \
-                KNXIPServiceType.SEARCH_REQUEST:
-            self.body = SearchRequest(self.xknx)
-        elif service_type_ident == \
-                KNXIPServiceType.SEARCH_RESPONSE:
-            self.body = SearchResponse(self.xknx)
-        elif service_type_ident == \
-                KNXIPServiceType.DISCONNECT_REQUEST:
-            self.body = DisconnectRequest(self.xknx)
-        elif service_type_ident == \
-                KNXIPServiceType.DISCONNECT_RESPONSE:
-            self.body = DisconnectResponse(self.xknx)
-        elif service_type_ident == \
-                KNXIPServiceType.CONNECTIONSTATE_REQUEST:
-            self.body = ConnectionStateRequest(self.xknx)
-        elif service_type_ident == \
-                KNXIPServiceType.CONNECTIONSTATE_RESPONSE:
-            self.body = ConnectionStateResponse(self.xknx)
-        else:
+        try:
+            body_class = BODY_CLASSES[service_type_ident]
+        except (KeyError, TypeError):
             raise TypeError(self.header.service_type_ident)
+        self.body = body_class(self.xknx)
 
     def from_knx(self, data):
-        """Parse/deserialize from KNX/IP raw data."""
+        """
+        Parse/deserialize from KNX/IP raw data.
+
+        Bytes are wrapped in a memoryview, so passing the body to the body parsers
+        does not copy the received datagram.
+        """
+        if isinstance(data, (bytes, bytearray)):
+            data = memoryview(data)
         pos = self.header.from_knx(data)
 
         self.init(self.header.service_type_ident)
@@ -82,6 +81,40 @@ class KNXIPFrame:
 
         return pos
 
+    @staticmethod
+    def peek_group_address(data):
+        """
+        Return raw destination group address of a received ROUTING_INDICATION or TUNNELLING_REQUEST.
+
+        Only the fixed header offsets are read, no objects are built. Returns None if data
+        is not a telegram sent to a group address (or too short to tell) - in this case the
+        frame has to be parsed by from_knx().
+        """
+        pos = KNXIPFrame.cemi_offset(data)
+        if pos is None:
+            return None
+        # code, additional info length, additional info, flags, src, dst
+        pos += 2 + data[pos + 1]
+        if len(data) < pos + 6 or not data[pos + 1] & CEMIFlags.DESTINATION_GROUP_ADDRESS:
+            return None
+        return data[pos + 4] * 256 + data[pos + 5]
+
+    @staticmethod
+    def cemi_offset(data):
+        """Return position of the cEMI data message within a received ROUTING_INDICATION or TUNNELLING_REQUEST, or None."""
+        if len(data) < KNXIPHeader.HEADERLENGTH + 1:
+            return None
+        service_type = data[2] * 256 + data[3]
+        if service_type not in CEMI_SERVICE_TYPES:
+            return None
+        pos = KNXIPHeader.HEADERLENGTH
+        if service_type == KNXIPServiceType.TUNNELLING_REQUEST.value:
+            # skip connection header
+            pos += data[pos]
+        if len(data) < pos + 2 or data[pos] not in CEMI_DATA_MESSAGE_CODES:
+            return None
+        return pos
+
     def normalize(self):
         """Normalize internal data. Necessary step for serialization."""
         self.header.set_length(self.body)
@@ -93,6 +126,17 @@ class KNXIPFrame:
         data.extend(self.body.to_knx())
         return data
 
+    def to_bytes(self):
+        """
+        Serialize to KNX/IP raw data.
+
+        Writes header and body into a bytearray preallocated from the calculated length.
+        """
+        data = bytearray(KNXIPHeader.HEADERLENGTH + self.body.calculated_length())
+        pos = self.header.to_knx_into(data, 0)
+        self.body.to_knx_into(data, pos)
+        return data
+
     def __str__(self):
         """Return object as readable string."""
         return '<KNXIPFrame {0}\n body="{1}" />' \
@@ -33,7 +33,7 @@ class SearchResponse(KNXIPBody):
     def from_knx(self, raw):
         """Parse/deserialize from KNX/IP raw data."""
         pos = self.control_endpoint.from_knx(raw)
-        while raw[pos:]:
+        while pos < len(raw):
             dib = DIB.determine_dib(raw[pos:])
             pos += dib.from_knx(raw[pos:])
             self.dibs.append(dib)
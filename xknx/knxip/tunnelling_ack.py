@@ -4,6 +4,8 @@ Module for Serialization and Deserialization of a KNX Tunnel ACK information.
 Connect requests are used to transmit a KNX telegram within an existing KNX tunnel connection.
 With an Tunnel ACK the receiving party acknowledges the valid processing of the request.
 """
+from struct import Struct
+
 from xknx.exceptions import CouldNotParseKNXIP
 
 from .body import KNXIPBody
@@ -19,6 +21,7 @@ class TunnellingAck(KNXIPBody):
     service_type = KNXIPServiceType.TUNNELLING_ACK
 
     BODY_LENGTH = 4
+    STRUCT = Struct('>BBBB')
 
     def __init__(self, xknx):
         """Initialize TunnellingAck object."""
@@ -60,6 +63,16 @@ class TunnellingAck(KNXIPBody):
         data.extend(ack_to_knx())
         return data
 
+    def to_knx_into(self, buffer, pos):
+        """Serialize to KNX/IP raw data into `buffer` starting at `pos`. Returns the position after the body."""
+        TunnellingAck.STRUCT.pack_into(
+            buffer, pos,
+            TunnellingAck.BODY_LENGTH,
+            self.communication_channel_id,
+            self.sequence_counter,
+            self.status_code.value)
+        return pos + TunnellingAck.BODY_LENGTH
+
     def __str__(self):
         """Return object as readable string."""
         return '<TunnellingAck communication_channel_id="{0}" ' \
@@ -3,6 +3,8 @@ Module for Serialization and Deserialization of a KNX Tunnel Request information
 
 Connect requests are used to transmit a KNX telegram within an existing KNX tunnel connection.
 """
+from struct import Struct
+
 from xknx.exceptions import CouldNotParseKNXIP
 
 from .body import KNXIPBody
@@ -18,6 +20,7 @@ class TunnellingRequest(KNXIPBody):
     service_type = KNXIPServiceType.TUNNELLING_REQUEST
 
     HEADER_LENGTH = 4
+    STRUCT = Struct('>BBBB')
 
     def __init__(self, xknx):
         """Initialize TunnellingRequest object."""
@@ -64,6 +67,16 @@ class TunnellingRequest(KNXIPBody):
         data.extend(self.cemi.to_knx())
         return data
 
+    def to_knx_into(self, buffer, pos):
+        """Serialize to KNX/IP raw data into `buffer` starting at `pos`. Returns the position after the body."""
+        TunnellingRequest.STRUCT.pack_into(
+            buffer, pos,
+            TunnellingRequest.HEADER_LENGTH,
+            self.communication_channel_id,
+            self.sequence_counter,
+            0x00)  # Reserved
+        return self.cemi.to_knx_into(buffer, pos + TunnellingRequest.HEADER_LENGTH)
+
     def __str__(self):
         """Return object as readable string."""
         return '<TunnellingRequest communication_channel_id="{0}" ' \
@@ -13,6 +13,11 @@ from xknx.telegram import GroupAddress, Telegram, TelegramType
 class RemoteValue():
     """Class for managing remote knx value."""
 
+    # pylint: disable=too-many-instance-attributes
+
+    # Marks the value of the current payload as not yet decoded
+    UNDECODED = object()
+
     def __init__(self,
                  xknx,
                  group_address=None,
@@ -34,7 +39,25 @@ class RemoteValue():
         self.device_name = "Unknown" \
             if device_name is None else device_name
         self.after_update_cb = after_update_cb
-        self.payload = None
+        self._payload = None
+        # Decoded value of payload, cached until the payload changes
+        self._value = RemoteValue.UNDECODED
+        # Replace pending writes within the outgoing queue by newer ones (last value wins)
+        self.coalesce_writes = False
+
+    @property
+    def payload(self):
+        """Return current payload."""
+        return self._payload
+
+    @payload.setter
+    def payload(self, payload):
+        """Set current payload. The value is decoded from it on first access after the payload changed."""
+        old_payload = self._payload
+        self._payload = payload
+        if payload is None or old_payload is None \
+                or payload.__class__ is not old_payload.__class__ or payload != old_payload:
+            self._value = RemoteValue.UNDECODED
 
     @property
     def initialized(self):
@@ -55,6 +78,12 @@ class RemoteValue():
         """Test if device has given group address."""
         return group_address in [self.group_address, self.group_address_state]
 
+    def group_addresses(self):
+        """Return all group addresses of this remote value."""
+        return [group_address
+                for group_address in (self.group_address, self.group_address_state)
+                if isinstance(group_address, GroupAddress)]
+
     def state_addresses(self):
         """Return group addresses which should be requested to sync state."""
         if self.readable:
@@ -95,9 +124,12 @@ class RemoteValue():
     @property
     def value(self):
         """Return current value."""
-        if self.payload is None:
+        if self._payload is None:
             return None
-        return self.from_knx(self.payload)
+        if self._value is RemoteValue.UNDECODED:
+            # from_knx of the base class only logs a warning
+            self._value = self.from_knx(self._payload)  # pylint: disable=assignment-from-no-return
+        return self._value
 
     async def send(self, response=False):
         """Send payload as telegram to KNX bus."""
@@ -106,6 +138,7 @@ class RemoteValue():
         telegram.telegramtype = TelegramType.GROUP_RESPONSE \
             if response else TelegramType.GROUP_WRITE
         telegram.payload = self.payload
+        telegram.coalesce = self.coalesce_writes and not response
         await self.xknx.telegrams.put(telegram)
 
     async def set(self, value):
@@ -149,14 +182,14 @@ class RemoteValue():
     def __eq__(self, other):
         """Equal operator."""
         for key, value in self.__dict__.items():
-            if key == "after_update_cb":
+            if key in ("after_update_cb", "_value"):
                 continue
             if key not in other.__dict__:
                 return False
             if other.__dict__[key] != value:
                 return False
         for key, value in other.__dict__.items():
-            if key == "after_update_cb":
+            if key in ("after_update_cb", "_value"):
                 continue
             if key not in self.__dict__:
                 return False
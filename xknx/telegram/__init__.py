@@ -7,5 +7,6 @@ Module for handling KNX primitves.
 """
 # flake8: noqa
 from .address import GroupAddress, GroupAddressType, PhysicalAddress
-from .address_filter import AddressFilter
-from .telegram import Telegram, TelegramDirection, TelegramType
+from .address_filter import AddressFilter, CompiledAddressFilter
+from .telegram import (
+    Telegram, TelegramDirection, TelegramPriority, TelegramType)
@@ -11,6 +11,11 @@ The module supports all different writings of group addresses:
 * 3rn level: "1/2/3"
 * 2nd level: "1/2"
 * Free format: "123"
+
+Addresses are hashable and may be used as dict keys. `GroupAddress.from_raw()`
+and `PhysicalAddress.from_raw()` return interned instances without parsing,
+which is used when decoding received frames. Interned instances are shared,
+so addresses must be treated as immutable.
 """
 from enum import Enum
 from re import compile as re_compile
@@ -35,6 +40,8 @@ def address_tuple_to_int(address):
 class BaseAddress:  # pylint: disable=too-few-public-methods
     """Base class for all knx address types."""
 
+    __slots__ = ('raw',)
+
     def __init__(self):
         """Initialize instance variables needed by all subclasses."""
         self.raw = None
@@ -62,6 +69,10 @@ class BaseAddress:  # pylint: disable=too-few-public-methods
             raise TypeError()
         return self.raw == other.raw
 
+    def __hash__(self):
+        """Hash the address by its raw value."""
+        return hash((self.__class__.__name__, self.raw))
+
 
 class PhysicalAddress(BaseAddress):
     """Class for handling KNX pyhsical addresses."""
@@ -71,6 +82,9 @@ class PhysicalAddress(BaseAddress):
     MAX_LINE = 255
     ADDRESS_RE = re_compile(r'^(?P<area>\d{1,2})\.(?P<main>\d{1,2})\.(?P<line>\d{1,3})$')
 
+    __slots__ = ()
+    _interned = {}
+
     def __init__(self, address):
         """Initialize Address class."""
         super().__init__()
@@ -88,6 +102,24 @@ class PhysicalAddress(BaseAddress):
         if isinstance(self.raw, int) and self.raw > 65535:
             raise CouldNotParseAddress(address)
 
+    @classmethod
+    def from_raw(cls, raw):
+        """
+        Return the interned address for the integer `raw`.
+
+        Skips parsing and validation of the constructor except the range check.
+        The returned object is shared and must not be modified.
+        """
+        try:
+            return cls._interned[raw]
+        except KeyError:
+            if not 0 <= raw <= 65535:
+                raise CouldNotParseAddress(raw)
+            address = cls.__new__(cls)
+            address.raw = raw
+            cls._interned[raw] = address
+            return address
+
     def __string_to_int(self, address):
         """
         Parse `address` as string to an integer and do some simple checks.
@@ -164,6 +196,9 @@ class GroupAddress(BaseAddress):
 
     ADDRESS_RE = re_compile(r'^(?P<main>\d{1,2})(/(?P<middle>\d{1,2}))?/(?P<sub>\d{1,4})$')
 
+    __slots__ = ('levels',)
+    _interned = {}
+
     def __init__(self, address, levels=GroupAddressType.LONG):
         """Initialize Address class."""
         super().__init__()
@@ -185,6 +220,25 @@ class GroupAddress(BaseAddress):
         if isinstance(self.raw, int) and self.raw > 65535:
             raise CouldNotParseAddress(address)
 
+    @classmethod
+    def from_raw(cls, raw, levels=GroupAddressType.LONG):
+        """
+        Return the interned address for the integer `raw` and `levels`.
+
+        Skips parsing and validation of the constructor except the range check.
+        The returned object is shared and must not be modified.
+        """
+        try:
+            return cls._interned[raw, levels]
+        except KeyError:
+            if not 0 <= raw <= 65535:
+                raise CouldNotParseAddress(raw)
+            address = cls.__new__(cls)
+            address.raw = raw
+            address.levels = levels
+            cls._interned[raw, levels] = address
+            return address
+
     def __string_to_int(self, address):
         """
         Parse `address` as string to an integer and do some simple checks.
@@ -20,10 +20,25 @@ Patterns can be
         AddressFilter("2-5")
         AddressFilter("1-3,4,5")
         AddressFilter("-10")
+
+AddressFilter.compile() evaluates a filter for all 65,536 group addresses at once and returns a bitmap
+(a bytearray indexed by `GroupAddress.raw`). CompiledAddressFilter combines any number of filters into
+such a bitmap, so matching a group address is a single lookup:
+
+        CompiledAddressFilter([AddressFilter("1/*/2-5"), AddressFilter("3/1/*")]).match(address)
 """
 from xknx.exceptions import ConversionError
 
-from .address import GroupAddress
+from .address import GroupAddress, GroupAddressType
+
+# Width in bits of the main, middle and sub group of a raw group address by address format
+FIELD_BITS = {
+    GroupAddressType.LONG: {'main': 5, 'middle': 3, 'sub': 8},
+    GroupAddressType.SHORT: {'main': 5, 'sub': 11},
+    GroupAddressType.FREE: {'sub': 16},
+}
+# Fields matched by the level filters of a pattern with one, two or three levels
+FIELDS_BY_LEVELS = {1: ('sub',), 2: ('main', 'sub'), 3: ('main', 'middle', 'sub')}
 
 
 class AddressFilter:
@@ -52,6 +67,45 @@ class AddressFilter:
             return self._match_level2(address)
         return self._match_free(address)
 
+    def compile(self, levels=GroupAddressType.LONG):
+        """
+        Return bytearray of 65,536 bytes indexed by the raw group address - 1 if the address matches.
+
+        `levels` is the address format of the matched addresses. Patterns with levels the address
+        format doesn't have (e.g. "1/2/3" for SHORT addresses) don't match at all.
+        """
+        field_bits = FIELD_BITS[levels]
+        fields = FIELDS_BY_LEVELS[len(self.level_filters)]
+        if any(field not in field_bits for field in fields):
+            return bytearray(65536)
+        # values of each field allowed by the pattern - fields not within the pattern match any value
+        allowed = {}
+        for field, bits in field_bits.items():
+            if field in fields:
+                allowed[field] = self.level_filters[fields.index(field)].compile(1 << bits)
+            else:
+                allowed[field] = bytearray(b'\x01') * (1 << bits)
+        sub_allowed = allowed.pop('sub')
+        sub_size = len(sub_allowed)
+        bitmap = bytearray(65536)
+        # the upper fields (main and middle) select blocks of sub_size addresses
+        for block in range(65536 // sub_size):
+            if all(allowed[field][(block >> shift) & ((1 << field_bits[field]) - 1)]
+                   for field, shift in self._block_shifts(field_bits)):
+                bitmap[block * sub_size:(block + 1) * sub_size] = sub_allowed
+        return bitmap
+
+    @staticmethod
+    def _block_shifts(field_bits):
+        """Return (field, shift) of the upper fields within the block number of a raw group address."""
+        shifts = []
+        shift = 0
+        for field in ('middle', 'main'):
+            if field in field_bits:
+                shifts.append((field, shift))
+                shift += field_bits[field]
+        return shifts
+
     def _match_level3(self, address):
         return (
             self.level_filters[0].match(address.main)
@@ -150,3 +204,43 @@ class AddressFilter:
                 if _range.match(digit):
                     return True
             return False
+
+        def compile(self, size):
+            """Return bytearray of size indexed by digit - 1 if the digit is within range of pattern."""
+            allowed = bytearray(size)
+            for _range in self.ranges:
+                if _range.range_from < size:
+                    range_to = min(_range.range_to, size - 1)
+                    allowed[_range.range_from:range_to + 1] = b'\x01' * (range_to - _range.range_from + 1)
+            return allowed
+
+
+class CompiledAddressFilter:
+    """Class for matching group addresses against several AddressFilters with a single lookup."""
+
+    def __init__(self, address_filters):
+        """Initialize CompiledAddressFilter class."""
+        self.address_filters = list(address_filters)
+        # Bitmaps by address format, compiled when first used
+        self._bitmaps = {}
+
+    def bitmap(self, levels=GroupAddressType.LONG):
+        """Return bytearray indexed by raw group address of format levels - 1 if any filter matches."""
+        bitmap = self._bitmaps.get(levels)
+        if bitmap is None:
+            # bytes are 0 or 1, so a bitwise or of the bitmaps as integers is the union
+            union = 0
+            for address_filter in self.address_filters:
+                union |= int.from_bytes(address_filter.compile(levels), 'big')
+            bitmap = bytearray(union.to_bytes(65536, 'big'))
+            self._bitmaps[levels] = bitmap
+        return bitmap
+
+    def match(self, address):
+        """Test if address matches any of the AddressFilters."""
+        if isinstance(address, str):
+            address = GroupAddress(address)
+        bitmap = self._bitmaps.get(address.levels)
+        if bitmap is None:
+            bitmap = self.bitmap(address.levels)
+        return bitmap[address.raw] == 1
@@ -11,7 +11,12 @@ It contains
 * the telegram type (e.g. GROUP_WRITE)
 * the direction (incoming or outgoing)
 * the group address (e.g. 1/2/3)
-* and the payload (e.g. "12%" or "23.23 C".
+* the payload (e.g. "12%" or "23.23 C".
+* and the priority on the KNX bus (e.g. LOW).
+
+Telegrams marked as `background` (e.g. state reads) are sent after interactive
+telegrams of the same priority. Pending writes marked as `coalesce` are replaced
+by newer writes to the same group address before being sent.
 
 """
 from enum import Enum
@@ -34,20 +39,38 @@ class TelegramType(Enum):
     GROUP_RESPONSE = 3
 
 
+class TelegramPriority(Enum):
+    """Enum class for the KNX priority of a telegram. Sorted from highest to lowest priority."""
+
+    SYSTEM = 0
+    URGENT = 1
+    NORMAL = 2
+    LOW = 3
+
+
 class Telegram:
     """Class for KNX telegrams."""
 
-    # pylint: disable=too-few-public-methods
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
 
     def __init__(self, group_address=GroupAddress(None),
                  telegramtype=TelegramType.GROUP_WRITE,
                  direction=TelegramDirection.OUTGOING,
-                 payload=None):
+                 payload=None,
+                 priority=TelegramPriority.LOW,
+                 background=False,
+                 coalesce=False):
         """Initialize Telegram class."""
+        # pylint: disable=too-many-arguments
         self.direction = direction
         self.telegramtype = telegramtype
         self.group_address = group_address
         self.payload = payload
+        self.priority = priority
+        self.background = background
+        self.coalesce = coalesce
+        # time.monotonic() when the telegram was received, set by KNXIPInterface if metrics are enabled
+        self.timestamp = None
 
     def __str__(self):
         """Return object as readable string."""
@@ -59,5 +82,9 @@ class Telegram:
                 self.direction)
 
     def __eq__(self, other):
-        """Equal operator."""
-        return self.__dict__ == other.__dict__
+        """Equal operator. `background` and `coalesce` only affect scheduling and are not compared."""
+        return self.direction == other.direction and \
+            self.telegramtype == other.telegramtype and \
+            self.group_address == other.group_address and \
+            self.payload == other.payload and \
+            self.priority == other.priority
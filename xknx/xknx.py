@@ -4,7 +4,8 @@ import logging
 import signal
 from sys import platform
 
-from xknx.core import Config, TelegramQueue
+from xknx.core import (
+    Config, Metrics, ResponseRegistry, StateSnapshot, TelegramQueue)
 from xknx.devices import Devices
 from xknx.io import ConnectionConfig, KNXIPInterface
 from xknx.telegram import GroupAddressType, PhysicalAddress
@@ -19,6 +20,10 @@ class XKNX:
 
     DEFAULT_ADDRESS = '15.15.250'
     DEFAULT_RATE_LIMIT = 20
+    DEFAULT_RATE_LIMIT_BURST = 1
+    DEFAULT_SLOW_CALLBACK_THRESHOLD = 0.1
+    DEFAULT_STATE_SYNC_MAX_IN_FLIGHT = 10
+    DEFAULT_STATE_SYNC_TIMEOUT = 1
 
     def __init__(self,
                  config=None,
@@ -27,25 +32,48 @@ class XKNX:
                  address_format=GroupAddressType.LONG,
                  telegram_received_cb=None,
                  device_updated_cb=None,
-                 rate_limit=DEFAULT_RATE_LIMIT):
+                 rate_limit=DEFAULT_RATE_LIMIT,
+                 rate_limit_burst=DEFAULT_RATE_LIMIT_BURST,
+                 state_snapshot_file=None,
+                 metrics=False,
+                 slow_callback_threshold=DEFAULT_SLOW_CALLBACK_THRESHOLD,
+                 callback_workers=0,
+                 state_sync_max_in_flight=DEFAULT_STATE_SYNC_MAX_IN_FLIGHT,
+                 state_sync_timeout=DEFAULT_STATE_SYNC_TIMEOUT):
         """Initialize XKNX class."""
-        # pylint: disable=too-many-arguments
+        # pylint: disable=too-many-arguments,too-many-locals
         self.devices = Devices()
+        self.metrics = None
         self.telegrams = asyncio.Queue()
         self.sigint_received = asyncio.Event()
         self.telegram_queue = TelegramQueue(self)
+        self.response_registry = ResponseRegistry(self)
         self.state_updater = None
+        self.state_snapshot = None
+        self.telegram_recorder = None
         self.knxip_interface = None
         self.started = False
         self.address_format = address_format
         self.own_address = own_address
         self.rate_limit = rate_limit
+        self.rate_limit_burst = rate_limit_burst
+        self.telegram_queue.slow_callback_threshold = slow_callback_threshold
+        self.telegram_queue.callback_workers = callback_workers
+        # Maximum number of unanswered state reads, and seconds to wait for a response after a read was sent
+        self.state_sync_max_in_flight = state_sync_max_in_flight
+        self.state_sync_timeout = state_sync_timeout
         self.logger = logging.getLogger('xknx.log')
         self.knx_logger = logging.getLogger('xknx.knx')
         self.telegram_logger = logging.getLogger('xknx.telegram')
         self.connection_config = None
         self.version = VERSION
 
+        if metrics:
+            self.metrics = Metrics(self)
+
+        if state_snapshot_file is not None:
+            self.state_snapshot = StateSnapshot(self, state_snapshot_file)
+
         if config is not None:
             Config(self).read(config)
 
@@ -55,6 +83,26 @@ class XKNX:
         if device_updated_cb is not None:
             self.devices.register_device_updated_cb(device_updated_cb)
 
+    @property
+    def rate_limit(self):
+        """Return maximum number of telegrams per second sent to the KNX bus."""
+        return self.telegram_queue.rate_limiter.rate
+
+    @rate_limit.setter
+    def rate_limit(self, rate_limit):
+        """Set maximum number of telegrams per second sent to the KNX bus. 0 disables rate limiting."""
+        self.telegram_queue.rate_limiter.rate = rate_limit
+
+    @property
+    def rate_limit_burst(self):
+        """Return number of telegrams which may be sent at once before rate limiting applies."""
+        return self.telegram_queue.rate_limiter.burst
+
+    @rate_limit_burst.setter
+    def rate_limit_burst(self, rate_limit_burst):
+        """Set number of telegrams which may be sent at once before rate limiting applies."""
+        self.telegram_queue.rate_limiter.burst = rate_limit_burst
+
     async def start(self,
                     state_updater=False,
                     daemon_mode=False,
@@ -74,6 +122,12 @@ class XKNX:
         if state_updater:
             from xknx.core import StateUpdater
             self.state_updater = StateUpdater(self)
+
+        if self.state_snapshot is not None:
+            self.state_snapshot.load()
+            self.state_snapshot.restore()
+
+        if self.state_updater is not None:
             await self.state_updater.start()
 
         if daemon_mode:
@@ -98,6 +152,10 @@ class XKNX:
         await self.join()
         await self.telegram_queue.stop()
         await self._stop_knxip_interface_if_exists()
+        if self.state_snapshot is not None:
+            await self.state_snapshot.stop()
+        if self.telegram_recorder is not None:
+            self.telegram_recorder.stop()
         self.started = False
 
     async def loop_until_sigint(self):